@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+from collections.abc import Iterable
 import logging
 import pathlib
 import sys
@@ -29,9 +30,7 @@ def find_last_number(line):
     raise Exception('No number found')
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
+def solve(lines: Iterable[str], props) -> int:
     subtotal = 0
     for line in lines:
         first = find_first_number(line)
@@ -40,11 +39,16 @@ def main(props):
         logger.debug(result)
         subtotal += int(result)
 
-    print(subtotal)
+    return subtotal
+
+
+def main(props):
+    return solve(hf.iter_lines(props), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
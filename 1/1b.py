@@ -1,15 +1,20 @@
 #!/usr/bin/env python3
 
+from collections.abc import Iterable
 import logging
 import pathlib
 import sys
 __file = pathlib.Path(__file__).absolute()
 sys.path.append(str(__file.parent.parent.resolve()))
 
+from lib.class_aho_corasick import AhoCorasick
 import lib.helper_args as ha
 import lib.helper_file as hf
+import lib.helper_import as hi
 import lib.helper_log as hl
 
+np = hi.lazy_import('numpy')
+
 logger = logging.getLogger(__file.stem)
 
 NUMBERS = {
@@ -34,69 +39,70 @@ NUMBERS = {
     'nine': 9,
 }
 
-NUMBERS_REVERSED = {
-    '0': 0,
-    '1': 1,
-    '2': 2,
-    '3': 3,
-    '4': 4,
-    '5': 5,
-    '6': 6,
-    '7': 7,
-    '8': 8,
-    '9': 9,
-    'eno': 1,
-    'owt': 2,
-    'eerht': 3,
-    'ruof': 4,
-    'evif': 5,
-    'xis': 6,
-    'neves': 7,
-    'thgie': 8,
-    'enin': 9,
-}
-
-
-def get_substring_match(to_test, matches=NUMBERS):
-    for k in matches:
-        if len(k) <= len(to_test) and k == to_test[0:len(k)]:
-            return matches[k]
-    return -1
-
-
-def find_first_number(line):
-    for i in range(len(line)):
-        potential_match = get_substring_match(line[i:])
-        if potential_match >= 0:
-            return potential_match
-    raise Exception('No number found')
-
-
-def find_last_number(line):
-    target = line[::-1]
-    for i in range(len(target)):
-        potential_match = get_substring_match(target[i:], NUMBERS_REVERSED)
-        if potential_match >= 0:
-            return potential_match
-    raise Exception('No number found')
-
-
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
+# built once: finds the first and last number in a single scan of each line
+MATCHER = AhoCorasick(NUMBERS)
+NEWLINE = ord('\n')
+
+
+def find_first_and_last_numbers(line: str) -> tuple[int, int]:
+    first, last = MATCHER.first_and_last(line.encode())
+    if first is None:
+        raise Exception('No number found')
+    return first, last
+
+
+def solve_chunk(data: 'np.ndarray') -> int:
+    '''Bulk mode: test every position of a run of whole lines against every number at once'''
+    size = len(data)
+    values = np.full(size, -1, np.int8)
+    digits = (data >= ord('0')) & (data <= ord('9'))
+    values[digits] = data[digits] - ord('0')
+    for number, value in NUMBERS.items():
+        if len(number) == 1:
+            continue
+        pattern = number.encode()
+        starts = data[:size - len(pattern) + 1] == pattern[0]
+        for offset, byte in enumerate(pattern[1:], 1):
+            starts &= data[offset:size - len(pattern) + 1 + offset] == byte
+        values[:len(starts)][starts] = value
+    positions = np.flatnonzero(values >= 0)
+    newlines = np.flatnonzero(data == NEWLINE)
+    line_count = len(newlines) + (1 if size > 0 and data[-1] != NEWLINE else 0)
+    # matches are in order, so each line's matches are together: find where the line number changes
+    match_lines = np.searchsorted(newlines, positions)
+    changes = np.flatnonzero(match_lines[1:] != match_lines[:-1]) + 1
+    if len(changes) + (1 if len(positions) > 0 else 0) != line_count:
+        raise Exception('No number found')
+    firsts = np.concatenate(([0], changes))
+    lasts = np.concatenate((changes - 1, [len(positions) - 1]))
+    first_values = values[positions[firsts]].astype(np.int64)
+    last_values = values[positions[lasts]].astype(np.int64)
+    return int((first_values * 10 + last_values).sum())
+
+
+def solve(lines: Iterable[str], props) -> int:
     subtotal = 0
     for line in lines:
-        first = find_first_number(line)
-        last = find_last_number(line)
+        first, last = find_first_and_last_numbers(line)
         result = f'{first}{last}'
         logger.debug(result)
         subtotal += int(result)
 
-    print(subtotal)
+    return subtotal
+
+
+def main(props):
+    if props.use_stdin:
+        return solve(hf.iter_lines(props), props)
+    # the automaton steps through a byte at a time in Python, so files are scanned in bulk instead,
+    # which is several times faster (see bench/calibration.py), straight from the mapped file
+    buffer = hf.load_buffer(hf.find_input_file(props))
+    return sum(solve_chunk(np.frombuffer(chunk, np.uint8)) for chunk in hf.iter_buffer_chunks(buffer))
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -7,6 +7,7 @@ import sys
 __file = pathlib.Path(__file__).absolute()
 sys.path.append(str(__file.parent.parent.resolve()))
 
+from lib.class_grid import Grid
 from lib.class_text_coordinate_limits import TextCoordinateLimits as Limits
 from lib.class_text_coordinate import TextCoordinate as Coordinate
 import lib.helper_args as ha
@@ -84,7 +85,7 @@ class PipelinePipe:
         return False
 
 
-def find_connected(coord: Coordinate, grid: list[str], limits: Limits) -> list[Coordinate]:
+def find_connected(coord: Coordinate, grid: Grid, limits: Limits) -> list[Coordinate]:
     connected_neighbours = []
     for neighbour in hc.valid_neighbours(coord, limits, diagonal=False):
         if connects_to(coord, neighbour, grid):
@@ -92,8 +93,8 @@ def find_connected(coord: Coordinate, grid: list[str], limits: Limits) -> list[C
     return connected_neighbours
 
 
-def connects_to(source: Coordinate, destination: Coordinate, grid: list[str]) -> bool:
-    destination_character = grid[destination.line][destination.character]
+def connects_to(source: Coordinate, destination: Coordinate, grid: Grid) -> bool:
+    destination_character = grid.lookup(destination)
     if source.above(destination):
         return destination_character in 'J|L'
     elif source.below(destination):
@@ -105,28 +106,16 @@ def connects_to(source: Coordinate, destination: Coordinate, grid: list[str]) ->
     return False
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
-    depth = len(lines)
-    width = len(lines[0])
-    limits = Limits(depth, width)
-
-    grid = []
-    start = None
-    for line_index, line in enumerate(lines):
-        grid.append(line.strip())
-        try:
-            start_index = line.index('S')
-            start = Coordinate(line_index, start_index)
-            logger.debug('Starting from %r', start)
-        except:
-            pass
+def solve(lines: list[str], props) -> int:
+    grid = Grid.from_lines([line.strip() for line in lines])
+    limits = grid.limits
+    start = grid.coordinate(grid.find('S'))
+    logger.debug('Starting from %r', start)
 
     pipeline = Pipeline(start)
     current_depth = 1
     for neighbour in find_connected(start, grid, limits):
-        pipe_type = hc.lookup_in(neighbour, grid)
+        pipe_type = grid.lookup(neighbour)
         new_pipe = PipelinePipe(neighbour, pipe_type, start, current_depth)
         logger.debug('Connecting %r from start', new_pipe)
         pipeline.chains.append([new_pipe])
@@ -138,7 +127,7 @@ def main(props):
             last_pipe = chain[-1]
             next_pipe_coords = last_pipe.get_next()
             if not pipeline.contains(next_pipe_coords):
-                pipe_type = hc.lookup_in(next_pipe_coords, grid)
+                pipe_type = grid.lookup(next_pipe_coords)
                 new_pipe = PipelinePipe(next_pipe_coords, pipe_type, last_pipe.coord, current_depth)
                 logger.debug('Connecting %r from %r', new_pipe, last_pipe)
                 chain.append(new_pipe)
@@ -151,11 +140,16 @@ def main(props):
         if chain[-1].depth > furthest:
             furthest = chain[-1].depth
 
-    print(furthest)
+    return furthest
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -0,0 +1,127 @@
+'''
+Tracing for day 10: the loop is followed from corner to corner, skipping over straight runs of pipe,
+and only the running totals needed for its length and area are kept, rather than every pipe on it.
+'''
+from dataclasses import dataclass
+import logging
+from typing import Optional
+
+from lib.helper_direction import Direction
+import lib.helper_import as hi
+
+np = hi.lazy_import('numpy')
+
+logger = logging.getLogger(__name__)
+
+start_pipe = 'S'
+# (line, character) step for each direction
+offsets = {
+    Direction.UP: (-1, 0),
+    Direction.DOWN: (1, 0),
+    Direction.LEFT: (0, -1),
+    Direction.RIGHT: (0, 1),
+}
+# pipes that carry straight on in each direction
+straights = {
+    Direction.UP: '|',
+    Direction.DOWN: '|',
+    Direction.LEFT: '-',
+    Direction.RIGHT: '-',
+}
+# direction leaving each corner, for each direction it can be entered
+turns = {
+    ('L', Direction.DOWN): Direction.RIGHT,
+    ('L', Direction.LEFT): Direction.UP,
+    ('J', Direction.DOWN): Direction.LEFT,
+    ('J', Direction.RIGHT): Direction.UP,
+    ('7', Direction.UP): Direction.LEFT,
+    ('7', Direction.RIGHT): Direction.DOWN,
+    ('F', Direction.UP): Direction.RIGHT,
+    ('F', Direction.LEFT): Direction.DOWN,
+}
+# straight runs are looked for in windows starting this long, doubling each time, so long runs take few searches
+RUN_WINDOW = 16
+
+
+@dataclass(frozen=True)
+class Loop:
+    # number of pipes in the loop, which is also the length of its boundary
+    length: int
+    corners: int
+    # twice the area enclosed by the path through the middle of each pipe (by the shoelace formula)
+    twice_area: int
+
+    @property
+    def enclosed_tiles(self) -> int:
+        # by Pick's theorem, area = interior + boundary / 2 - 1
+        return (self.twice_area - self.length) // 2 + 1
+
+
+def _straight_run(cells: 'np.ndarray', straight: int) -> int:
+    '''How many cells from the start of cells are the straight pipe'''
+    start = 0
+    window = RUN_WINDOW
+    while start < len(cells):
+        others = np.flatnonzero(cells[start:start + window] != straight)
+        if len(others) > 0:
+            return start + int(others[0])
+        start += window
+        window *= 2
+    return len(cells)
+
+
+def _ahead(grid: 'np.ndarray', line: int, character: int, direction: Direction) -> 'np.ndarray':
+    '''Cells of the grid from next to the given cell to the edge, in the direction given'''
+    if direction == Direction.UP:
+        return grid[:line, character][::-1]
+    if direction == Direction.DOWN:
+        return grid[line + 1:, character]
+    if direction == Direction.LEFT:
+        return grid[line, :character][::-1]
+    return grid[line, character + 1:]
+
+
+def find_start(grid: 'np.ndarray') -> tuple[int, int]:
+    for line, row in enumerate(grid):
+        found = np.flatnonzero(row == ord(start_pipe))
+        if len(found) > 0:
+            return line, int(found[0])
+    raise Exception(f'No {start_pipe} found in grid')
+
+
+def trace_loop(grid: 'np.ndarray') -> Loop:
+    '''Follow the loop through the start of a (depth, width) uint8 grid, back to the start'''
+    start = find_start(grid)
+    # stray pipes next to the start can look connected to it, but lead nowhere
+    for direction in offsets:
+        found = _follow(grid, start, direction)
+        if found is not None:
+            return found
+    raise Exception(f'No loop runs through the start at {start}')
+
+
+def _follow(grid: 'np.ndarray', start: tuple[int, int], direction: Direction) -> Optional[Loop]:
+    '''The loop leaving the start in the given direction, if the pipes lead back to the start'''
+    line, character = start
+    length = corners = twice_area = 0
+    while True:
+        ahead = _ahead(grid, line, character, direction)
+        steps = _straight_run(ahead, ord(straights[direction])) + 1
+        if steps > len(ahead):
+            # runs off the edge of the grid
+            return None
+        line_step, character_step = offsets[direction]
+        next_line = line + line_step * steps
+        next_character = character + character_step * steps
+        length += steps
+        # the shoelace formula, one edge between corners at a time
+        twice_area += line * next_character - next_line * character
+        line, character = next_line, next_character
+        pipe = chr(grid[line, character])
+        if pipe == start_pipe:
+            return Loop(length, corners, abs(twice_area))
+        if (pipe, direction) not in turns:
+            logger.debug('Pipe %s at %s does not connect when heading %s', pipe, (line, character), direction.value)
+            return None
+        direction = turns[(pipe, direction)]
+        corners += 1
@@ -7,13 +7,14 @@ import sys
 __file = pathlib.Path(__file__).absolute()
 sys.path.append(str(__file.parent.parent.resolve()))
 
-import numpy as np
-
 from lib.class_text_coordinate import TextCoordinate as Coordinate
 import lib.helper_args as ha
 import lib.helper_file as hf
+import lib.helper_import as hi
 import lib.helper_log as hl
 
+np = hi.lazy_import('numpy')
+
 logger = logging.getLogger(__file.stem)
 
 
@@ -50,8 +51,7 @@ def calculate_distance(a: Coordinate, b: Coordinate) -> int:
     return total_diff
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
+def solve(lines: list[str], props) -> int:
     universe = Universe(lines)
 
     # locate galaxies
@@ -87,11 +87,16 @@ def main(props):
     for edge in weights:
         subtotal += edge[0]
 
-    print(subtotal)
+    return subtotal
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from functools import cache
 import logging
@@ -67,9 +68,7 @@ def count_permutations(partial: Partial) -> int:
     return count
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
+def solve(lines: Iterable[str], props) -> int:
     count = 0
     for line in lines:
         logger.log(hl.EXTRA_DETAIL, '')
@@ -84,12 +83,20 @@ def main(props):
         sub_count = count_permutations(start)
         logger.debug('Returning count of %d for line %s', sub_count, line[:-1])
         count += sub_count
+        # lines share almost no sub-problems, so drop them rather than letting the caches grow with the input
+        count_permutations.cache_clear()
+        fits.cache_clear()
+
+    return count
+
 
-    print(count)
+def main(props):
+    return solve(hf.iter_lines(props), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -1,94 +1,75 @@
 #!/usr/bin/env python3
 
-from dataclasses import dataclass
 import logging
 import pathlib
 import sys
 __file = pathlib.Path(__file__).absolute()
 sys.path.append(str(__file.parent.parent.resolve()))
 
+from lib.class_grid import Grid
 import lib.helper_args as ha
 import lib.helper_file as hf
+import lib.helper_import as hi
 import lib.helper_log as hl
 
+np = hi.lazy_import('numpy')
+
 logger = logging.getLogger(__file.stem)
 
 
-def find_horizontal_reflection_point(grid: list[str]) -> int:
-    width = len(grid[0])
-    for column_to_check in range(1, width):
+def find_horizontal_reflection_point(grid: Grid) -> int:
+    for column_to_check in range(1, grid.width):
         logger.log(hl.EXTRA_NOISY, 'Checking column %s', column_to_check)
         if is_horizontal_reflection_point(column_to_check, grid):
             return column_to_check
     return -1
 
 
-def find_vertical_reflection_point(grid: list[str]) -> int:
-    depth = len(grid)
-    for row_to_check in range(1, depth):
+def find_vertical_reflection_point(grid: Grid) -> int:
+    for row_to_check in range(1, grid.depth):
         logger.log(hl.EXTRA_NOISY, 'Checking row %s', row_to_check)
         if is_vertical_reflection_point(row_to_check, grid):
             return row_to_check
     return -1
 
 
-def is_horizontal_reflection_point(column: int, grid: list[str]) -> bool:
-    width = len(grid[0])
-    current_left_column = column - 1
-    current_right_column = column
-    still_potential_reflection_point = True
-    while still_potential_reflection_point:
-        if current_left_column < 0 or current_right_column >= width:
-            return True
-        for line_index, line in enumerate(grid):
-            if line[current_left_column] != line[current_right_column]:
-                logger.log(hl.EXTRA_DETAIL, 'Detected difference for line %d between columns %d and %d: %s does not match %s', line_index, current_left_column, current_right_column, line[current_left_column], line[current_right_column])
-                still_potential_reflection_point = False
-                break
-        current_left_column -= 1
-        current_right_column += 1
-    return False
-
-
-def is_vertical_reflection_point(row: int, grid: list[str]) -> bool:
-    width = len(grid[0])
-    depth = len(grid)
-    current_top_row = row - 1
-    current_bottom_row = row
-    still_potential_reflection_point = True
-    while still_potential_reflection_point:
-        if current_top_row < 0 or current_bottom_row >= depth:
-            return True
-        for column in range(width):
-            if grid[current_top_row][column] != grid[current_bottom_row][column]:
-                logger.log(hl.EXTRA_DETAIL, 'Detected difference for column %d between lines %d and %d: %s does not match %s', column, current_top_row, current_bottom_row, grid[current_top_row][column], grid[current_bottom_row][column])
-                still_potential_reflection_point = False
-                break
-        current_top_row -= 1
-        current_bottom_row += 1
-    return False
+def is_horizontal_reflection_point(column: int, grid: Grid) -> bool:
+    span = min(column, grid.width - column)
+    # the columns left of the point, mirrored so each lines up with its reflection on the right
+    left = grid.cells[:, column - span:column][:, ::-1]
+    right = grid.cells[:, column:column + span]
+    differences = int(np.count_nonzero(left != right))
+    logger.log(hl.EXTRA_DETAIL, 'Detected %d differences reflecting at column %d', differences, column)
+    return differences == 0
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
+def is_vertical_reflection_point(row: int, grid: Grid) -> bool:
+    span = min(row, grid.depth - row)
+    top = grid.cells[row - span:row][::-1]
+    bottom = grid.cells[row:row + span]
+    differences = int(np.count_nonzero(top != bottom))
+    logger.log(hl.EXTRA_DETAIL, 'Detected %d differences reflecting at row %d', differences, row)
+    return differences == 0
+
 
+def solve(lines: list[str], props) -> int:
     patterns = []
     pattern = []
     for line in lines:
         stripped_line = line.strip()
         if len(stripped_line) < 1:
             if len(pattern) > 1:
-                patterns.append(pattern)
+                patterns.append(Grid.from_lines(pattern))
                 pattern = []
         else:
             pattern.append(stripped_line)
     if len(pattern) > 1:
-        patterns.append(pattern)
+        patterns.append(Grid.from_lines(pattern))
 
     subtotal = 0
     for pattern_index, pattern in enumerate(patterns):
         logger.log(hl.EXTRA_DETAIL, '')
-        logger.log(hl.EXTRA_DETAIL, 'Starting searches for pattern %d (starting "%s")', pattern_index, pattern[0])
+        logger.log(hl.EXTRA_DETAIL, 'Starting searches for pattern %d (starting "%s")', pattern_index, pattern.row(0))
         horizontal = find_horizontal_reflection_point(pattern)
         if horizontal > 0:
             logger.debug('found a horizontal reflection point for pattern %d at %d', pattern_index, horizontal)
@@ -99,13 +80,18 @@ def main(props):
             logger.debug('found a vertical reflection point for pattern %d at %d', pattern_index, vertical)
             subtotal += 100 * vertical
             continue
-        raise Exception(f'No reflection point found for pattern {pattern_index} (starting "{pattern[0]}")')
+        raise Exception(f'No reflection point found for pattern {pattern_index} (starting "{pattern.row(0)}")')
 
-    print(subtotal)
+    return subtotal
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
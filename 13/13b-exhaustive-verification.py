@@ -76,9 +76,7 @@ def is_vertical_reflection_point(row: int, grid: list[str]) -> bool:
     return error_count == 1
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
+def solve(lines: list[str], props) -> int:
     patterns = []
     pattern = []
     for line in lines:
@@ -109,11 +107,16 @@ def main(props):
         if horizontal < 0 and vertical < 0:
             raise Exception(f'No reflection point found for pattern {pattern_index} (starting "{pattern[0]}")')
 
-    print(subtotal)
+    return subtotal
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -1,17 +1,14 @@
 #!/usr/bin/env python3
 
 import logging
-import operator
 import pathlib
 import sys
 __file = pathlib.Path(__file__).absolute()
 sys.path.append(str(__file.parent.parent.resolve()))
 
-import numpy as np
-
-from lib.class_text_coordinate_limits import TextCoordinateLimits as Limits
-from lib.class_text_coordinate import TextCoordinate as Coordinate
+from lib.class_grid import Grid
 import lib.helper_args as ha
+import lib.helper_direction as hd
 import lib.helper_file as hf
 import lib.helper_log as hl
 
@@ -21,80 +18,47 @@ blank_character = '.'
 block_character = '#'
 rollable_character = 'O'
 
-getter_by_line = operator.attrgetter('line')
-
 
 class Platform:
-    def __init__(self, limits: Limits):
-        self.blocks: set[Coordinate] = set()
-        self.rollables: set[Coordinate] = set()
-        self.limits: Limits = limits
-
-    def add_block(self, coord: Coordinate):
-        self.blocks.add(coord)
-
-    def add_rollable(self, coord: Coordinate):
-        self.rollables.add(coord)
-
-    def rollables_by_line(self, reverse=False):
-        return sorted(self.rollables, key=getter_by_line, reverse=reverse)
-
-    def empty_rollables(self):
-        self.rollables = set()
+    def __init__(self, grid: Grid):
+        # the rollables are tracked by index, leaving only the blocks in the grid
+        self.grid = grid
+        self.rollables: set[int] = {int(index) for index in grid.find_all(rollable_character)}
+        for rollable in self.rollables:
+            grid[rollable] = blank_character
 
     @property
     def load(self):
         subtotal = 0
-        for rock in self.rollables:
-            distance_from_bottom = self.limits.max_line - rock.line
+        for rollable in self.rollables:
+            distance_from_bottom = self.grid.depth - rollable // self.grid.stride
             subtotal += distance_from_bottom
         return subtotal
 
     def tilt_north(self):
-        rollables_by_line = self.rollables_by_line()
-        self.empty_rollables()
-        for rollable in rollables_by_line:
-            logger.log(hl.EXTRA_NOISY, 'Checking rollable starting from %r', rollable)
-            found_blocker = False
-            for line_index in range(rollable.line - 1, -1, -1):
-                to_test = Coordinate(line_index, rollable.character)
-                if to_test in self.blocks or to_test in self.rollables:
-                    logger.log(hl.EXTRA_NOISY, 'blocker found at line %d', line_index)
-                    new_coordinate = Coordinate(line_index + 1, rollable.character)
-                    self.add_rollable(new_coordinate)
-                    found_blocker = True
-                    break
-            if not found_blocker:
-                new_coordinate = Coordinate(0, rollable.character)
-                self.add_rollable(new_coordinate)
+        grid = self.grid
+        up = grid.offsets[hd.UP]
+        new_positions = set()
+        # in index order, so each rollable has come to rest before any below it moves
+        for rollable in sorted(self.rollables):
+            logger.log(hl.EXTRA_NOISY, 'Checking rollable starting from %r', grid.coordinate(rollable))
+            position = rollable
+            while (position + up) in grid and grid[position + up] != block_character \
+                    and (position + up) not in new_positions:
+                position += up
+            new_positions.add(position)
+        self.rollables = new_positions
 
     def visualise(self) -> str:
-        grid = np.full((self.limits.max_line, self.limits.max_character), blank_character)
-        for block in self.blocks:
-            grid[block.line][block.character] = block_character
+        grid = self.grid.copy()
         for rollable in self.rollables:
-            grid[rollable.line][rollable.character] = rollable_character
-        return '\n'.join(''.join(grid[line_index]) for line_index in range(self.limits.max_line))
+            grid[rollable] = rollable_character
+        return grid.visualise()
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
-    depth = len(lines)
-    width = len(lines[0])
-
-    platform = Platform(Limits(depth, width))
-    for line_index, line in enumerate(lines):
-        grid_line = line.strip()
-        for character_index, character in enumerate(grid_line):
-            if character == block_character:
-                coord = Coordinate(line_index, character_index)
-                logger.log(hl.EXTRA_DETAIL, 'Discovered block at %r', coord)
-                platform.add_block(coord)
-            elif character == rollable_character:
-                coord = Coordinate(line_index, character_index)
-                logger.log(hl.EXTRA_DETAIL, 'Discovered rollable at %r', coord)
-                platform.add_rollable(coord)
+def solve(lines: list[str], props) -> int:
+    platform = Platform(Grid.from_lines([line.strip() for line in lines]))
+    logger.log(hl.EXTRA_DETAIL, 'Discovered %d rollables', len(platform.rollables))
     if logger.isEnabledFor(logging.DEBUG):
         logger.debug('Starting grid: \n%s', platform.visualise())
 
@@ -103,11 +67,16 @@ def main(props):
         logger.log(hl.EXTRA_DETAIL, 'New grid: \n%s', platform.visualise())
     subtotal = platform.load
 
-    print(subtotal)
+    return subtotal
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
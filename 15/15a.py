@@ -29,9 +29,7 @@ def wrap_subtotal(input: int) -> int:
     return multiplied % 256
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
+def solve(lines: list[str], props) -> int:
     sequences = ''.join(lines).split(',')
 
     subtotal = 0
@@ -51,11 +49,16 @@ def main(props):
         logger.debug('sequence %s has hash %d', sequence, sequence_subtotal)
         subtotal += sequence_subtotal
 
-    print(subtotal)
+    return subtotal
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
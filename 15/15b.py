@@ -38,14 +38,17 @@ def aoc_hash(input: str) -> int:
     logger.log(hl.EXTRA_DETAIL, 'hashing input "%s"', input)
     ascii_codes = convert_to_ascii_codes(input)
     subtotal = 0
+    noisy = logger.isEnabledFor(hl.EXTRA_NOISY)
     for code_index, code in enumerate(ascii_codes):
         new_subtotal = subtotal + code
-        logger.log(hl.EXTRA_NOISY, 'adding %d (char %s) to hash sub-total %d = %d',
-                    code, input[code_index], subtotal, new_subtotal)
+        if noisy:
+            logger.log(hl.EXTRA_NOISY, 'adding %d (char %s) to hash sub-total %d = %d',
+                        code, input[code_index], subtotal, new_subtotal)
         subtotal = new_subtotal
         subtotal = wrap_subtotal(subtotal)
-        logger.log(hl.EXTRA_NOISY, 'wrapping sequence sub-total %d -> %d',
-                    new_subtotal, subtotal)
+        if noisy:
+            logger.log(hl.EXTRA_NOISY, 'wrapping sequence sub-total %d -> %d',
+                        new_subtotal, subtotal)
     return subtotal
 
 
@@ -96,8 +99,7 @@ class Station:
         return '\n'.join(string_forms)
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
+def solve(lines: list[str], props) -> int:
     sequences = ''.join(lines).split(',')
 
     # hash label -> box number
@@ -108,27 +110,37 @@ def main(props):
 
     subtotal = 0
     station = Station()
-    for sequence in sequences:
-        sequence = sequence.strip()
-        if operator_remove in sequence:
-            label, _ = sequence.split(operator_remove, 1)
-            station.remove_from_box(label)
-        elif operator_add in sequence:
-            label, focal_length_label = sequence.split(operator_add, 1)
-            focal_length = int(focal_length_label)
-            station.add_to_box(label, focal_length)
-        logger.log(hl.EXTRA_DETAIL, 'After "%s"\n%s\n', sequence, station.visualise())
-
-    lens_powers = station.determine_focusing_powers()
+    detailed = logger.isEnabledFor(hl.EXTRA_DETAIL)
+    with hl.timed('arrange'):
+        for sequence in sequences:
+            sequence = sequence.strip()
+            if operator_remove in sequence:
+                label, _ = sequence.split(operator_remove, 1)
+                station.remove_from_box(label)
+            elif operator_add in sequence:
+                label, focal_length_label = sequence.split(operator_add, 1)
+                focal_length = int(focal_length_label)
+                station.add_to_box(label, focal_length)
+            if detailed:
+                # visualising every box on every step is far more expensive than the step itself
+                logger.log(hl.EXTRA_DETAIL, 'After "%s"\n%s\n', sequence, station.visualise())
+
+    with hl.timed('focus'):
+        lens_powers = station.determine_focusing_powers()
     if logger.isEnabledFor(hl.EXTRA_DETAIL) and not logger.isEnabledFor(hl.EXTRA_NOISY):
         for label, power in lens_powers.items():
             logger.log(hl.EXTRA_DETAIL, 'lens "%s" has power %d', label, power)
     subtotal = sum(lens_powers.values())
-    print(subtotal)
+    return subtotal
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
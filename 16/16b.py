@@ -10,10 +10,10 @@ import sys
 __file = pathlib.Path(__file__).absolute()
 sys.path.append(str(__file.parent.parent.resolve()))
 
-from lib.class_text_coordinate_limits import TextCoordinateLimits as Limits
+from lib.class_grid import Grid
 from lib.class_text_coordinate import TextCoordinate as Coordinate
 import lib.helper_args as ha
-import lib.helper_coord as hc
+import lib.helper_direction as hd
 import lib.helper_file as hf
 import lib.helper_log as hl
 
@@ -24,6 +24,12 @@ down = 'down'
 left = 'left'
 right = 'right'
 directions = [up, down, left, right]
+grid_directions = {
+    up: hd.UP,
+    down: hd.DOWN,
+    left: hd.LEFT,
+    right: hd.RIGHT,
+}
 
 blank_character = '.'
 splitter_vertical = '|'
@@ -69,37 +75,31 @@ def new_directions(character: str, direction_of_travel: str) -> Iterable[str]:
 
 @dataclass(frozen=True)
 class Visit(Coordinate):
+    '''Where a beam enters the grid from, which is just off its edge'''
     direction: str
 
-    def where_next(self) -> Coordinate:
-        if self.direction == up:
-            return self.up()
-        if self.direction == down:
-            return self.down()
-        if self.direction == left:
-            return self.left()
-        if self.direction == right:
-            return self.right()
-
 
 class Contraption:
-    def __init__(self, grid: list[str]):
+    def __init__(self, grid: Grid):
         self.grid = grid
-        self.limits = Limits(len(grid), len(grid[0]))
-        self.visited: dict[Coordinate, set[str]] = {}
+        self.steps = {direction: grid.offsets[grid_direction] for direction, grid_direction in grid_directions.items()}
+        self.visited: dict[int, set[str]] = {}
         self.walked = False
 
     def walk(self, start: Visit = Visit(0, -1, right)):
-        to_visit: deque[Visit] = deque()
-        to_visit.append(start)
+        grid = self.grid
+        steps = self.steps
+        # the start may be just off any edge, where the index still lands next to the first cell entered
+        to_visit: deque[tuple[int, str]] = deque()
+        to_visit.append((grid.index(start.line, start.character), start.direction))
         while len(to_visit) > 0:
-            current = to_visit.popleft()
-            next = current.where_next()
-            logger.log(hl.EXTRA_NOISY, 'Visiting %r from %r', next, current)
-            if not self.limits.contains(next):
+            current, direction = to_visit.popleft()
+            next = current + steps[direction]
+            logger.log(hl.EXTRA_NOISY, 'Visiting %d from %d', next, current)
+            if next not in grid:
                 continue
-            next_directions = new_directions(hc.lookup_in(next, self.grid), current.direction)
-            logger.log(hl.EXTRA_NOISY, 'New directions for %r travelling %s: %r', next, current.direction, next_directions)
+            next_directions = new_directions(grid[next], direction)
+            logger.log(hl.EXTRA_NOISY, 'New directions for %d travelling %s: %r', next, direction, next_directions)
             unvisited_next_directions = []
             if next not in self.visited:
                 self.visited[next] = set()
@@ -111,8 +111,7 @@ class Contraption:
                         unvisited_next_directions.append(next_direction)
             for next_direction in unvisited_next_directions:
                 self.visited[next].add(next_direction)
-                next_visit = Visit(next.line, next.character, next_direction)
-                to_visit.append(next_visit)
+                to_visit.append((next, next_direction))
         self.walked = True
 
     def count_empowered(self):
@@ -123,9 +122,9 @@ class Contraption:
     def visualise(self):
         if not self.walked:
             self.walk()
-        new_grid = [line for line in self.grid]
+        new_grid = self.grid.copy()
         for visit, directions in self.visited.items():
-            existing_character = hc.lookup_in(visit, self.grid)
+            existing_character = self.grid[visit]
             if existing_character == blank_character:
                 if len(directions) > 1:
                     new_character = str(len(directions))
@@ -139,39 +138,39 @@ class Contraption:
                             new_character = '<'
                         elif direction == right:
                             new_character = '>'
-                line = new_grid[visit.line]
-                new_grid[visit.line] = (
-                    line[:visit.character]
-                    + new_character
-                    + line[visit.character+1:])
-        return '\n'.join(new_grid)
-
+                new_grid[visit] = new_character
+        return new_grid.visualise()
 
-def main(props):
-    grid = hf.load_lines(hf.find_input_file(props))
 
+def solve(lines: list[str], props) -> int:
+    grid = Grid.from_lines(lines)
     max_empowered = 0
-    for line_index, line in enumerate(grid):
+    for line_index in range(grid.depth):
         left_contraption = Contraption(grid)
         left_contraption.walk(Visit(line_index, -1, right))
         left_count = left_contraption.count_empowered()
         right_contraption = Contraption(grid)
-        right_contraption.walk(Visit(line_index, len(line), left))
+        right_contraption.walk(Visit(line_index, grid.width, left))
         right_count = right_contraption.count_empowered()
         max_empowered = max(max_empowered, left_count, right_count)
-    for character_index, _ in enumerate(grid[0]):
+    for character_index in range(grid.width):
         top_contraption = Contraption(grid)
         top_contraption.walk(Visit(-1, character_index, down))
         top_count = top_contraption.count_empowered()
         bottom_contraption = Contraption(grid)
-        bottom_contraption.walk(Visit(len(grid), character_index, up))
+        bottom_contraption.walk(Visit(grid.depth, character_index, up))
         bottom_count = bottom_contraption.count_empowered()
         max_empowered = max(max_empowered, top_count, bottom_count)
-    print(max_empowered)
+    return max_empowered
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -10,10 +10,9 @@ from typing import Optional
 __file = pathlib.Path(__file__).absolute()
 sys.path.append(str(__file.parent.parent.resolve()))
 
-from lib.class_text_coordinate_limits import TextCoordinateLimits as Limits
-from lib.class_text_coordinate import TextCoordinate as Coordinate
+from lib.class_grid import Grid
 import lib.helper_args as ha
-import lib.helper_coord as hc
+import lib.helper_direction as hd
 import lib.helper_file as hf
 import lib.helper_log as hl
 
@@ -30,11 +29,18 @@ visual_directions = {
     left: '<',
     right: '>',
 }
+grid_directions = {
+    up: hd.UP,
+    down: hd.DOWN,
+    left: hd.LEFT,
+    right: hd.RIGHT,
+}
 
 
 @dataclass(frozen=True)
 class Visit:
-    location: Coordinate
+    # index into the city's grid
+    location: int
     last_direction: Optional[str]
     last_direction_multiplicity: int
 
@@ -44,7 +50,7 @@ class Visit:
             return self.last_direction
         return None
 
-    def next_visit(self, neighbour: Coordinate, direction: str) -> 'Visit':
+    def next_visit(self, neighbour: int, direction: str) -> 'Visit':
         next_multiplicity = 1
         if self.last_direction == direction:
             next_multiplicity = self.last_direction_multiplicity + 1
@@ -67,22 +73,22 @@ class Journey:
 
 
 class City:
-    def __init__(self, weights: tuple[str], destination: Coordinate = None):
+    def __init__(self, weights: Grid, destination: Optional[int] = None):
         self.weights = weights
-        self.limits = Limits(len(weights), len(weights[0]))
+        self.steps = {direction: weights.offsets[grid_direction] for direction, grid_direction in grid_directions.items()}
         if destination is not None:
             self.destination = destination
         else:
-            self.destination = Coordinate(self.limits.max_line - 1, self.limits.max_character - 1)
+            self.destination = weights.index(weights.depth - 1, weights.width - 1)
 
-        self.initial_location: Optional[Coordinate] = None
+        self.initial_location: Optional[int] = None
         self.partial_journeys: list[Journey] = []
         self.previous_visits: set[Visit] = set()
         self.minimal_heat_loss_from: dict[Visit, int] = {}
         self.minimal_journey: Optional[Journey] = None
 
 
-    def find_minimal_journey(self, initial_location: Coordinate) -> Journey:
+    def find_minimal_journey(self, initial_location: int) -> Journey:
         if self.initial_location is not None:
             if self.initial_location == initial_location:
                 return self.minimal_journey
@@ -109,11 +115,11 @@ class City:
         logger.log(hl.EXTRA_NOISY, 'Exploring %r', visit)
         valid_directions = get_valid_directions(visit.last_direction, visit.triple_direction)
         for direction_travelled in valid_directions:
-            neighbour = from_direction(visit.location, direction_travelled)
-            if not self.limits.contains(neighbour):
+            neighbour = visit.location + self.steps[direction_travelled]
+            if neighbour not in self.weights:
                 continue
             new_visit = visit.next_visit(neighbour, direction_travelled)
-            new_heat_loss = journey.heat_loss + int(hc.lookup_in(neighbour, self.weights))
+            new_heat_loss = journey.heat_loss + int(self.weights[neighbour])
             prior_minimal_heat_loss = self.minimal_heat_loss_from.get(new_visit, None)
             if prior_minimal_heat_loss is None or new_heat_loss < prior_minimal_heat_loss:
                 self.minimal_heat_loss_from[new_visit] = new_heat_loss
@@ -122,7 +128,7 @@ class City:
 
 
     def visualise(self, journey: Journey) -> str:
-        overrides: dict[Coordinate, list[str]] = {}
+        overrides: dict[int, list[str]] = {}
         for step in journey.steps_taken:
             if step.last_direction is None:
                 continue
@@ -130,30 +136,11 @@ class City:
                 overrides[step.location] = [step.last_direction]
             else:
                 overrides[step.location].append(step.last_direction)
-        new_start_line = '.' * self.limits.max_character
-        new_grid = [new_start_line] * self.limits.max_line
+        new_grid = self.weights.copy()
+        new_grid.cells[:] = ord('.')
         for location, visits in overrides.items():
-            line = new_grid[location.line]
-            output = str(len(visits)) if len(visits) > 1 else visual_directions[visits[0]]
-            new_line = (
-                line[:location.character]
-                + output
-                + line[location.character+1:])
-            new_grid[location.line] = new_line
-        return '\n'.join(new_grid)
-
-
-@cache
-def from_direction(origin: Coordinate, direction: str) -> Coordinate:
-    if direction == up:
-        return origin.up()
-    if direction == down:
-        return origin.down()
-    if direction == left:
-        return origin.left()
-    if direction == right:
-        return origin.right()
-    raise Exception(f'Invalid direction {direction}')
+            new_grid[location] = str(len(visits)) if len(visits) > 1 else visual_directions[visits[0]]
+        return new_grid.visualise()
 
 
 @cache
@@ -173,21 +160,25 @@ def get_valid_directions(inbound_direction: Optional[str], direction_to_discard:
     return valid_directions
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-    weights = tuple(line for line in lines)
+def solve(lines: list[str], props) -> int:
+    weights = Grid.from_lines(lines)
     city = City(weights)
-    initial_location = Coordinate(0, 0)
+    initial_location = weights.index(0, 0)
     journey = city.find_minimal_journey(initial_location)
     if logger.isEnabledFor(logging.DEBUG):
         logger.debug('Minimal heat-loss journey: %s', journey)
         logger.debug('Minimal heat-loss path:\n%s', city.visualise(journey))
 
-    print(journey.heat_loss)
+    return journey.heat_loss
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -159,9 +159,7 @@ class Pit:
         return '\n'.join(self.painted)
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
+def solve(lines: list[str], props) -> int:
     pit = Pit()
     previous_direction = None
     for line in lines:
@@ -177,11 +175,16 @@ def main(props):
         logger.debug('Pit state after edging:\n%s', pit.visualise_edges())
         logger.debug('Pit state after digging:\n%s', pit.visualise_digging())
 
-    print(pit.size)
+    return pit.size
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -124,11 +124,15 @@ class Pit:
 
         # determine whether each "block" (in cross-section of segment by segment) is interior or not
         size = 0
+        noisy = logger.isEnabledFor(hl.EXTRA_NOISY)
+        detailed = logger.isEnabledFor(hl.EXTRA_DETAIL)
         for column_limits, lines_with_boundaries in _segmented_columns.items():
-            logger.log(hl.EXTRA_NOISY, 'Scanning column: %r', column_limits)
+            if noisy:
+                logger.log(hl.EXTRA_NOISY, 'Scanning column: %r', column_limits)
             lines_with_boundaries.sort()
             for row_limits, columns_with_boundaries in _segmented_rows.items():
-                logger.log(hl.EXTRA_NOISY, 'Scanning row: %r', row_limits)
+                if noisy:
+                    logger.log(hl.EXTRA_NOISY, 'Scanning row: %r', row_limits)
                 columns_with_boundaries.sort()
                 edges_above = bisect.bisect(lines_with_boundaries, midpoint(row_limits))
                 column_is_interior = edges_above % 2 == 1
@@ -139,15 +143,18 @@ class Pit:
                     block_width = length(column_limits) - 1
                     block_height = length(row_limits) - 1
                     block_size = block_width * block_height
-                    logger.log(hl.EXTRA_DETAIL, 'Including block of size: %d (%r, %r)', block_size, column_limits, row_limits)
+                    if detailed:
+                        logger.log(hl.EXTRA_DETAIL, 'Including block of size: %d (%r, %r)', block_size, column_limits, row_limits)
                     size += block_size
                     _blocks[column_limits][row_limits] = True
                 else:
-                    logger.log(hl.EXTRA_NOISY, 'Discounting block (%r, %r)', column_limits, row_limits)
+                    if noisy:
+                        logger.log(hl.EXTRA_NOISY, 'Discounting block (%r, %r)', column_limits, row_limits)
                     _blocks[column_limits][row_limits] = False
         logger.debug('Size includes subtotal from block interiors: %d', size)
 
-        logger.log(hl.EXTRA_NOISY, 'block inclusion results: %r', _blocks)
+        if noisy:
+            logger.log(hl.EXTRA_NOISY, 'block inclusion results: %r', _blocks)
 
         # add the edge lengths: we excluded edges above, so include outer edges _and_ inner edges
         # do not include vertices, else we double-count some interior vertices
@@ -164,7 +171,8 @@ class Pit:
                         count += 1
                 previously_interior = block_is_interior
             column_subtotal = count * (length(column_limits) - 1)
-            logger.log(hl.EXTRA_DETAIL, 'Including %d in edge count: %d edge segments for column %r', column_subtotal, count, column_limits)
+            if detailed:
+                logger.log(hl.EXTRA_DETAIL, 'Including %d in edge count: %d edge segments for column %r', column_subtotal, count, column_limits)
             edge_subtotal += column_subtotal
         # now rows
         for row_limits in _segmented_rows:
@@ -178,7 +186,8 @@ class Pit:
                         count += 1
                 previously_interior = block_is_interior
             row_subtotal = count * (length(row_limits) - 1)
-            logger.log(hl.EXTRA_DETAIL, 'Including %d in edge count: %d edge segments for row %r', row_subtotal, count, row_limits)
+            if detailed:
+                logger.log(hl.EXTRA_DETAIL, 'Including %d in edge count: %d edge segments for row %r', row_subtotal, count, row_limits)
             edge_subtotal += row_subtotal
         logger.debug('Size includes subtotal from edges: %d', edge_subtotal)
         size += edge_subtotal
@@ -258,29 +267,34 @@ def length(limits: tuple[int]) -> int:
     return limits[1] - limits[0]
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
+def solve(lines: list[str], props) -> int:
     directions = 'RDLU'
     pit = Pit()
     previous_direction = None
-    for line in lines:
-        _, _, colour_label = line.split()
-        direction_index = int(colour_label[7])
-        direction = hd.Direction.from_initial(directions[direction_index])
-        assert direction != previous_direction
-        distance_hex_label = colour_label[2:7]
-        distance = int(distance_hex_label, 16)
-        logger.log(hl.EXTRA_NOISY, 'Converted color %s to %s %d', colour_label, direction, distance)
-        pit.travel(direction, distance)
-        previous_direction = direction
+    with hl.timed('dig'):
+        for line in lines:
+            _, _, colour_label = line.split()
+            direction_index = int(colour_label[7])
+            direction = hd.Direction.from_initial(directions[direction_index])
+            assert direction != previous_direction
+            distance_hex_label = colour_label[2:7]
+            distance = int(distance_hex_label, 16)
+            logger.log(hl.EXTRA_NOISY, 'Converted color %s to %s %d', colour_label, direction, distance)
+            pit.travel(direction, distance)
+            previous_direction = direction
+
+    with hl.timed('fill'):
+        pit.fill()
+    return pit.size
 
-    pit.fill()
-    print(pit.size)
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -112,9 +112,7 @@ def parse_part(input: str) -> Part:
     return Part(**attributes)
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
+def solve(lines: list[str], props) -> int:
     workflows: dict[str, Workflow] = {}
     parts: list[Part] = []
     processing_workflows = True
@@ -146,11 +144,16 @@ def main(props):
         else:
             raise Exception(f'Unexpected terminus ({next_workflow_key}) reached for part: {part}')
 
-    print(subtotal)
+    return subtotal
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
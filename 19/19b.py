@@ -154,9 +154,7 @@ def parse_workflow(input: str) -> Workflow:
     return workflow
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
+def solve(lines: list[str], props) -> int:
     workflows: dict[str, Workflow] = {}
     for line in lines:
         line = line.strip()
@@ -189,11 +187,16 @@ def main(props):
                 logger.log(hl.EXTRA_NOISY, 'mapping to workflow %s for partition: %r', workflow_key, partition)
                 q.append(result)
 
-    print(subtotal)
+    return subtotal
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
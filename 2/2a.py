@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+from collections.abc import Iterable
 import logging
 import pathlib
 import sys
@@ -8,8 +9,12 @@ sys.path.append(str(__file.parent.parent.resolve()))
 
 import lib.helper_args as ha
 import lib.helper_file as hf
+import lib.helper_import as hi
 import lib.helper_log as hl
 
+np = hi.lazy_import('numpy')
+parse = hi.import_sibling(__file, 'parse')
+
 logger = logging.getLogger(__file.stem)
 
 
@@ -20,37 +25,27 @@ limits = {
 }
 
 
+def possible_game_total(draws: 'parse.Draws') -> int:
+    colour_limits = np.array([limits[colour] for colour in parse.COLOURS])
+    impossible = draws.count > colour_limits[draws.colour]
+    possible_games = np.ones(len(draws.game_ids), bool)
+    possible_games[draws.game[impossible]] = False
+    logger.debug('%d of %d games possible', possible_games.sum(), len(possible_games))
+    return int(draws.game_ids[possible_games].sum())
+
+
+def solve(lines: Iterable[str], props) -> int:
+    return possible_game_total(parse.tokenize('\n'.join(lines).encode()))
+
+
 def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
-    subtotal = 0
-    for line in lines:
-        if len(line) < 1:
-            continue
-        game_valid = True
-        game_label, cube_sets_label = line.split(':', 1)
-        cube_sets = cube_sets_label.split(';')
-        for cube_set in cube_sets:
-            if not game_valid:
-                break
-            cube_counts = cube_set.split(',')
-            for count_label in cube_counts:
-                count_label = count_label.strip()
-                count, colour = count_label.split(' ')
-                count = int(count)
-                if colour not in limits or count > limits[colour]:
-                    logger.debug('%s failed with %s', game_label, count_label)
-                    game_valid = False
-                    break
-        if game_valid:
-            logger.debug('%s succeeded', game_label)
-            subtotal += int(game_label[5:])
-
-    print(subtotal)
+    # games never span chunks, so each chunk can be totalled separately
+    return sum(possible_game_total(parse.tokenize(chunk)) for chunk in hf.iter_chunks(props))
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
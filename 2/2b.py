@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+from collections.abc import Iterable
 import logging
 import pathlib
 import sys
@@ -8,40 +9,35 @@ sys.path.append(str(__file.parent.parent.resolve()))
 
 import lib.helper_args as ha
 import lib.helper_file as hf
+import lib.helper_import as hi
 import lib.helper_log as hl
 
+np = hi.lazy_import('numpy')
+parse = hi.import_sibling(__file, 'parse')
+
 logger = logging.getLogger(__file.stem)
 
 
+def power_total(draws: 'parse.Draws') -> int:
+    max_counts = np.full((len(draws.game_ids), len(parse.COLOURS)), -1, np.int64)
+    np.maximum.at(max_counts, (draws.game, draws.colour), draws.count)
+    # colours never drawn in a game do not count towards its power
+    max_counts[max_counts < 0] = 1
+    return int(max_counts.prod(axis=1).sum())
+
+
+def solve(lines: Iterable[str], props) -> int:
+    return power_total(parse.tokenize('\n'.join(lines).encode()))
+
+
 def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
-    subtotal = 0
-    for line in lines:
-        if len(line) < 1:
-            continue
-        max_counts = {}
-        game_label, cube_sets_label = line.split(':', 1)
-        cube_sets = cube_sets_label.split(';')
-        for cube_set in cube_sets:
-            cube_counts = cube_set.split(',')
-            for count_label in cube_counts:
-                count_label = count_label.strip()
-                count, colour = count_label.split(' ')
-                count = int(count)
-                if colour not in max_counts or count > max_counts[colour]:
-                    max_counts[colour] = count
-        game_power = 1
-        for colour, max_count in max_counts.items():
-            game_power *= max_count
-        logger.debug('%s has power %d', game_label, game_power)
-        subtotal += game_power
-
-    print(subtotal)
+    # games never span chunks, so each chunk can be totalled separately
+    return sum(power_total(parse.tokenize(chunk)) for chunk in hf.iter_chunks(props))
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -0,0 +1,55 @@
+'''Tokenizing shared by both parts of day 2, turning game records into columns of numbers in one vectorised pass'''
+from dataclasses import dataclass
+from functools import cache
+
+import lib.helper_import as hi
+import lib.helper_parse as hp
+
+np = hi.lazy_import('numpy')
+
+COLOURS = ('red', 'green', 'blue')
+
+
+@dataclass(frozen=True)
+class Draws:
+    '''One row for each count of cubes drawn, across every game'''
+    # index into game_ids of the game the cubes were drawn in
+    game: 'np.ndarray'
+    # which set of the game the cubes were drawn in
+    set_index: 'np.ndarray'
+    # index into COLOURS
+    colour: 'np.ndarray'
+    count: 'np.ndarray'
+    # id of every game, including any without draws
+    game_ids: 'np.ndarray'
+
+
+@cache
+def colour_codes() -> 'np.ndarray':
+    '''Index into COLOURS for each possible first letter of a colour (-1 for none)'''
+    codes = np.full(256, -1, np.int8)
+    for index, colour in enumerate(COLOURS):
+        codes[ord(colour[0])] = index
+    return codes
+
+
+def tokenize(buffer: bytes) -> Draws:
+    data = np.frombuffer(buffer, np.uint8)
+    starts, ends, values = hp.find_numbers(data)
+    if len(ends) > 0 and ends[-1] >= len(data):
+        raise Exception('Game record ends with a number')
+
+    # game ids are followed by ':', and counts by a space and their colour
+    is_game = data[ends] == ord(':')
+    game_starts = starts[is_game]
+    count_starts = starts[~is_game]
+    colour = colour_codes()[data[ends[~is_game] + 1]]
+    if (colour < 0).any():
+        raise Exception(f'Unknown colour: expected one of {COLOURS}')
+    # each count belongs to the last game before it, and is in the set after the last semicolon before it
+    game = np.searchsorted(game_starts, count_starts) - 1
+    if (game < 0).any():
+        raise Exception('Cubes drawn before any game')
+    semicolons = np.flatnonzero(data == ord(';'))
+    set_index = np.searchsorted(semicolons, count_starts) - np.searchsorted(semicolons, game_starts)[game]
+    return Draws(game, set_index, colour, values[~is_game], values[is_game])
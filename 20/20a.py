@@ -11,9 +11,13 @@ __file = pathlib.Path(__file__).absolute()
 sys.path.append(str(__file.parent.parent.resolve()))
 
 import lib.helper_args as ha
+import lib.helper_cache as hk
 import lib.helper_file as hf
+import lib.helper_import as hi
 import lib.helper_log as hl
 
+parse = hi.import_sibling(__file, 'parse')
+
 logger = logging.getLogger(__file.stem)
 
 pulse_high = 'high'
@@ -170,28 +174,14 @@ def construct_module(key: str, type: str, destinations: list[str], sources: list
         return ModuleFlipFlop(key, tuple(destinations), tuple(sources))
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
-    source_map_to_type: dict[str, str] = {}
-    source_map_to_destination: dict[str, list[str]] = {}
-    destination_map_to_source: dict[str, list[str]] = {}
-    for line in lines:
-        source_label, destinations_label = line.split(' -> ')
-        destination_labels = destinations_label.split(', ')
-        if source_label == type_broadcaster:
-            source_key = type_broadcaster
-            source_type = type_broadcaster
-        else:
-            source_type = source_label[0]
-            source_key = source_label[1:]
-        source_map_to_type[source_key] = source_type
-        source_map_to_destination[source_key] = destination_labels
-        for destination_key in destination_labels:
-            if destination_key not in destination_map_to_source:
-                destination_map_to_source[destination_key] = []
-            destination_map_to_source[destination_key].append(source_key)
-    destination_map_to_source[type_broadcaster] = [type_button]
+def solve(lines: list[str], props) -> int:
+    return solve_wiring(parse.parse_wiring(lines), props)
+
+
+def solve_wiring(wiring: 'parse.Wiring', props) -> int:
+    source_map_to_type = wiring.source_map_to_type
+    source_map_to_destination = wiring.source_map_to_destination
+    destination_map_to_source = wiring.destination_map_to_source
 
     modules: dict[str, Module] = {}
     keys = sorted(source_map_to_destination.keys())
@@ -233,11 +223,16 @@ def main(props):
             state_indices[current_state] = index
 
     logger.info('Final pulse counts: %r', total)
-    print(total.low * total.high)
+    return total.low * total.high
+
+
+def main(props):
+    return solve_wiring(hk.load_parsed(props, parse.parse_wiring), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -171,9 +171,7 @@ def construct_module(key: str, type: str, destinations: list[str], sources: list
         return ModuleFlipFlop(key, tuple(destinations), tuple(sources))
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
+def solve(lines: list[str], props) -> int:
     source_map_to_type: dict[str, str] = {}
     source_map_to_destination: dict[str, list[str]] = {}
     destination_map_to_source: dict[str, list[str]] = {}
@@ -225,11 +223,16 @@ def main(props):
         else:
             state_indices[current_state] = index
 
-    print(index)
+    return index
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
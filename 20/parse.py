@@ -0,0 +1,35 @@
+'''Parsing shared by both parts of day 20, so the parsed module wiring can be saved and reused'''
+from dataclasses import dataclass
+
+type_broadcaster = 'broadcaster'
+type_button = 'button'
+
+
+@dataclass(frozen=True)
+class Wiring:
+    source_map_to_type: dict[str, str]
+    source_map_to_destination: dict[str, list[str]]
+    destination_map_to_source: dict[str, list[str]]
+
+
+def parse_wiring(lines: list[str]) -> Wiring:
+    source_map_to_type: dict[str, str] = {}
+    source_map_to_destination: dict[str, list[str]] = {}
+    destination_map_to_source: dict[str, list[str]] = {}
+    for line in lines:
+        source_label, destinations_label = line.split(' -> ')
+        destination_labels = destinations_label.split(', ')
+        if source_label == type_broadcaster:
+            source_key = type_broadcaster
+            source_type = type_broadcaster
+        else:
+            source_type = source_label[0]
+            source_key = source_label[1:]
+        source_map_to_type[source_key] = source_type
+        source_map_to_destination[source_key] = destination_labels
+        for destination_key in destination_labels:
+            if destination_key not in destination_map_to_source:
+                destination_map_to_source[destination_key] = []
+            destination_map_to_source[destination_key].append(source_key)
+    destination_map_to_source[type_broadcaster] = [type_button]
+    return Wiring(source_map_to_type, source_map_to_destination, destination_map_to_source)
@@ -6,12 +6,11 @@ from functools import cached_property
 import logging
 import pathlib
 import sys
-from typing import Optional
 __file = pathlib.Path(__file__).absolute()
 sys.path.append(str(__file.parent.parent.resolve()))
 
-from lib.class_text_coordinate_limits import TextCoordinateLimits as Limits
-from lib.class_text_coordinate import TextCoordinate as Coordinate
+from lib.class_grid import Grid
+from lib.class_text_coordinate import TextCoordinate as Coordinate, intern_within
 import lib.helper_args as ha
 import lib.helper_coord as hc
 import lib.helper_file as hf
@@ -36,38 +35,32 @@ class MapSuperPosition:
 
 @dataclass(frozen=True)
 class Map:
-    grid: list[str]
+    grid: Grid
     rocks: set[Coordinate]
 
     @cached_property
     def limits(self):
-        return Limits(len(self.grid), len(self.grid[0]))
+        return self.grid.limits
+
+    @cached_property
+    def neighbours(self) -> hc.NeighbourTable:
+        return hc.neighbour_table(self.grid.depth, self.grid.width, diagonal=False)
 
     def walk(self, state: MapSuperPosition) -> MapSuperPosition:
         neighbours: set[Coordinate] = set()
         for location in state.locations:
-            neighbours.update(hc.valid_neighbours(location, self.limits, diagonal=False))
+            neighbours.update(self.neighbours.around(location))
         neighbours.difference_update(self.rocks)
         result = tuple(sorted(neighbours))
         return MapSuperPosition(result)
 
     def visualise(self, state: MapSuperPosition) -> str:
-        output = [line for line in self.grid]
+        output = self.grid.copy()
         for rock in self.rocks:
-            line = output[rock.line]
-            new_line = (
-                line[:rock.character]
-                + tile_rock
-                + line[rock.character+1:])
-            output[rock.line] = new_line
+            output[output.index_of(rock)] = tile_rock
         for super_position in state.locations:
-            line = output[super_position.line]
-            new_line = (
-                line[:super_position.character]
-                + tile_location
-                + line[super_position.character+1:])
-            output[super_position.line] = new_line
-        return '\n'.join(output)
+            output[output.index_of(super_position)] = tile_location
+        return output.visualise()
 
 
 class History:
@@ -103,21 +96,14 @@ class History:
         return self.states[index]
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
-    starting_point: Optional[Coordinate] = None
-    rock_locations: set[Coordinate] = set()
-    for line_index, line in enumerate(lines):
-        for character_index, character in enumerate(line):
-            if character == tile_rock:
-                rock_locations.add(Coordinate(line_index, character_index))
-            elif character == tile_start:
-                starting_point = Coordinate(line_index, character_index)
-                line = (line[:character_index] + tile_garden + line[character_index+1:])
-                lines[line_index] = line
-
-    map = Map(lines, rock_locations)
+def solve(lines: list[str], props) -> int:
+    grid = Grid.from_lines(lines)
+    intern_within(grid.depth, grid.width)
+    start = grid.find(tile_start)
+    starting_point = grid.coordinate(start)
+    grid[start] = tile_garden
+    rock_locations = {grid.coordinate(int(rock)) for rock in grid.find_all(tile_rock)}
+    map = Map(grid, rock_locations)
     initial_state = MapSuperPosition((starting_point,))
     if logger.isEnabledFor(logging.DEBUG):
         logger.debug('Initial state: \n%s', map.visualise(initial_state))
@@ -133,11 +119,16 @@ def main(props):
     if logger.isEnabledFor(logging.DEBUG):
         logger.debug('Final state after %d steps: \n%s', number_of_steps, map.visualise(final_state))
 
-    print(final_state.count)
+    return final_state.count
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -6,19 +6,20 @@ from functools import cached_property
 import logging
 import pathlib
 import sys
-from typing import Optional
 __file = pathlib.Path(__file__).absolute()
 sys.path.append(str(__file.parent.parent.resolve()))
 
-import numpy as np
-
+from lib.class_grid import Grid
 from lib.class_text_coordinate_limits import TextCoordinateLimits as Limits
-from lib.class_text_coordinate import TextCoordinate as Coordinate
+from lib.class_text_coordinate import TextCoordinate as Coordinate, intern_within
 import lib.helper_args as ha
 import lib.helper_coord as hc
 import lib.helper_file as hf
+import lib.helper_import as hi
 import lib.helper_log as hl
 
+np = hi.lazy_import('numpy')
+
 logger = logging.getLogger(__file.stem)
 
 tile_garden = '.'
@@ -38,38 +39,32 @@ class MapSuperPosition:
 
 @dataclass(frozen=True)
 class Map:
-    grid: list[str]
+    grid: Grid
     rocks: set[Coordinate]
 
     @cached_property
     def limits(self) -> Limits:
-        return Limits(len(self.grid), len(self.grid[0]))
+        return self.grid.limits
+
+    @cached_property
+    def neighbours(self) -> hc.NeighbourTable:
+        return hc.neighbour_table(self.grid.depth, self.grid.width, diagonal=False)
 
     def walk(self, state: MapSuperPosition) -> MapSuperPosition:
         neighbours: set[Coordinate] = set()
         for location in state.locations:
-            neighbours.update(hc.valid_neighbours(location, self.limits, diagonal=False))
+            neighbours.update(self.neighbours.around(location))
         neighbours.difference_update(self.rocks)
         result = tuple(sorted(neighbours))
         return MapSuperPosition(result)
 
     def visualise(self, state: MapSuperPosition) -> str:
-        output = [line for line in self.grid]
+        output = self.grid.copy()
         for rock in self.rocks:
-            line = output[rock.line]
-            new_line = (
-                line[:rock.character]
-                + tile_rock
-                + line[rock.character+1:])
-            output[rock.line] = new_line
+            output[output.index_of(rock)] = tile_rock
         for super_position in state.locations:
-            line = output[super_position.line]
-            new_line = (
-                line[:super_position.character]
-                + tile_location
-                + line[super_position.character+1:])
-            output[super_position.line] = new_line
-        return '\n'.join(output)
+            output[output.index_of(super_position)] = tile_location
+        return output.visualise()
 
 
 class History:
@@ -107,34 +102,23 @@ class History:
         return self.states[index]
 
 
-def main(props):
+def solve(lines: list[str], props) -> int:
     if props.use_examples:
         raise Exception('Solution does not support the example input')
-    lines = hf.load_lines(hf.find_input_file(props))
     depth = len(lines)
     width = len(lines[0])
     logger.debug('Input grid is %d x %d', width, depth)
     assert depth == width
 
-    starting_point: Optional[Coordinate] = None
-    rock_locations: set[Coordinate] = set()
-    for line_index, line in enumerate(lines):
-        for character_index, character in enumerate(line):
-            if character == tile_rock:
-                rock_locations.add(Coordinate(line_index, character_index))
-            elif character == tile_start:
-                starting_point = Coordinate(line_index, character_index)
-                line = (line[:character_index] + tile_garden + line[character_index+1:])
-                lines[line_index] = line
-
-    grid = [line * 5 for line in lines] * 5
+    tile = Grid.from_lines(lines)
+    start = tile.find(tile_start)
+    starting_point = tile.coordinate(start)
+    tile[start] = tile_garden
+
+    grid = Grid(np.tile(tile.cells, (5, 5)))
+    intern_within(grid.depth, grid.width)
     starting_point = Coordinate(starting_point.line + 2 * depth, starting_point.character + 2 * width)
-    all_rocks: set[Coordinate] = set()
-    for i in range(5):
-        for j in range(5):
-            all_rocks.update(
-                Coordinate(rock.line + i * width, rock.character + j * depth)
-                for rock in rock_locations)
+    all_rocks = {grid.coordinate(int(rock)) for rock in grid.find_all(tile_rock)}
     map = Map(grid, all_rocks)
     initial_state = MapSuperPosition((starting_point,))
     history = History(map, initial_state)
@@ -157,11 +141,16 @@ def main(props):
     result = coefficients[0] * (multiples * multiples) + coefficients[1] * multiples + coefficients[2]
     logger.debug('Coefficients of interpolating polynomial: %r', coefficients)
 
-    print(result)
+    return result
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -91,9 +91,7 @@ def settle(bricks: Iterable[Brick]) -> tuple[set[Brick], dict[Brick, set[Brick]]
     return (settled, parents)
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
+def solve(lines: list[str], props) -> int:
     bricks: list[Brick] = []
     for line_index, line in enumerate(lines):
         coord_labels = line.split('~')
@@ -135,11 +133,16 @@ def main(props):
         logger.debug('Adding %d to subtotal from brick: %r', subtotal, brick)
         total += subtotal
 
-    print(total)
+    return total
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -101,9 +101,7 @@ def at_path_end(map: Map, location: Coordinate) -> bool:
     return location.line == map.limits.max_line - 1
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
+def solve(lines: list[str], props) -> int:
     map = Map(tuple(lines))
     start = Coordinate(line=0, character=1)
     assert hc.lookup_in(start, map.grid) == map_path
@@ -127,11 +125,16 @@ def main(props):
                      [len(path) for path in paths])
     longest_path = paths[0]
 
-    print(len(longest_path))
+    return len(longest_path)
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -169,9 +169,7 @@ def continue_with(journey: Journey, segment: MapSegment, end: Coordinate) -> Jou
                    journey.already_visited.union(segment.get_ends()))
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
+def solve(lines: list[str], props) -> int:
     map = Map(tuple(lines))
     start = Coordinate(line=0, character=1)
     assert hc.lookup_in(start, map.grid) == map_path
@@ -215,11 +213,16 @@ def main(props):
     logger.debug('%d journeys found', count),
     logger.debug('Longest journey was %d : %r', len(longest_journey), longest_journey)
 
-    print(len(longest_journey))
+    return len(longest_journey)
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -17,9 +17,6 @@ from typing import Optional
 __file = pathlib.Path(__file__).absolute()
 sys.path.append(str(__file.parent.parent.resolve()))
 
-from bidict import bidict
-import numpy as np
-
 from lib.class_coordinate import Coordinate
 from lib.class_coordinate_3d import Coordinate3D
 from lib.class_edge import Edge
@@ -30,14 +27,15 @@ import lib.helper_args as ha
 import lib.helper_coord as hc
 import lib.helper_direction as hd
 import lib.helper_file as hf
+import lib.helper_import as hi
 import lib.helper_log as hl
 
-logger = logging.getLogger(__file.stem)
+np = hi.lazy_import('numpy')
 
+logger = logging.getLogger(__file.stem)
 
-def parse(props) -> set[Particle3D]:
-    lines = hf.load_lines(hf.find_input_file(props))
 
+def parse(lines: list[str]) -> set[Particle3D]:
     particles: set[Particle3D] = set()
     for line_index, line in enumerate(lines):
         position_label, velocity_label = line.split(' @ ')
@@ -49,8 +47,8 @@ def parse(props) -> set[Particle3D]:
     return particles
 
 
-def main(props):
-    particles = parse(props)
+def solve(lines: list[str], props) -> int:
+    particles = parse(lines)
     projected_particles = set(particle.xy_plane_projection for particle in particles)
 
     # Given input equations of `x = px + vx * t` and `y = py + vy * t`
@@ -99,11 +97,16 @@ def main(props):
             continue
         count += 1
 
-    print(count)
+    return count
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -18,10 +18,6 @@ from typing import Optional
 __file = pathlib.Path(__file__).absolute()
 sys.path.append(str(__file.parent.parent.resolve()))
 
-from bidict import bidict
-import numpy as np
-import sympy as sp
-
 from lib.class_coordinate import Coordinate
 from lib.class_coordinate_3d import Coordinate3D
 from lib.class_edge import Edge
@@ -32,14 +28,15 @@ import lib.helper_args as ha
 import lib.helper_coord as hc
 import lib.helper_direction as hd
 import lib.helper_file as hf
+import lib.helper_import as hi
 import lib.helper_log as hl
 
-logger = logging.getLogger(__file.stem)
+sp = hi.lazy_import('sympy')
 
+logger = logging.getLogger(__file.stem)
 
-def parse(props) -> set[Particle3D]:
-    lines = hf.load_lines(hf.find_input_file(props))
 
+def parse(lines: list[str]) -> set[Particle3D]:
     particles: set[Particle3D] = set()
     for line_index, line in enumerate(lines):
         position_label, velocity_label = line.split(' @ ')
@@ -51,8 +48,8 @@ def parse(props) -> set[Particle3D]:
     return particles
 
 
-def main(props):
-    particles = parse(props)
+def solve(lines: list[str], props) -> int:
+    particles = parse(lines)
 
     # More linear algebra: setup for SymPy solution
     symbols = sp.symbols('px py pz vx vy vz t0 t1 t2', real=True)
@@ -81,11 +78,16 @@ def main(props):
     logger.debug('Lin alg solution: %r', solution)
     total = solution[0][0] + solution[0][1] + solution[0][2]
 
-    print(total)
+    return total
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -6,17 +6,17 @@ import sys
 __file = pathlib.Path(__file__).absolute()
 sys.path.append(str(__file.parent.parent.resolve()))
 
-import networkx as nx
-
 import lib.helper_args as ha
 import lib.helper_file as hf
+import lib.helper_import as hi
 import lib.helper_log as hl
 
+nx = hi.lazy_import('networkx')
+
 logger = logging.getLogger(__file.stem)
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
+def solve(lines: list[str], props) -> int:
     g = nx.parse_adjlist(
         line.replace(':', '') for line in lines)
     edge_cut = nx.minimum_edge_cut(g)
@@ -30,11 +30,16 @@ def main(props):
         subtotal *= len(component)
         count += 1
     assert count == 2
-    print(subtotal)
+    return subtotal
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
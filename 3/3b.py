@@ -7,20 +7,20 @@ import sys
 __file = pathlib.Path(__file__).absolute()
 sys.path.append(str(__file.parent.parent.resolve()))
 
-import numpy as np
-
-from lib.class_text_coordinate_limits import TextCoordinateLimits as Limits
-from lib.class_text_coordinate import TextCoordinate as Coordinate
 import lib.helper_args as ha
-import lib.helper_coord as hc
 import lib.helper_file as hf
+import lib.helper_import as hi
 import lib.helper_log as hl
 
+np = hi.lazy_import('numpy')
+parse = hi.import_sibling(__file, 'parse')
+
 logger = logging.getLogger(__file.stem)
 
 # characters = '#$%&*+-./0123456789=@' + '\n'
 symbols = '*'
-digits = '0123456789'
+# numbers next to a symbol for it to be a gear
+gear_numbers = 2
 
 
 def find_characters(lines):
@@ -32,136 +32,24 @@ def find_characters(lines):
     print(json.dumps(sorted(list(characters))))
 
 
-def find_contiguous_matches_to_left(string: str, start_index: int, matching_characters: str):
-    matching_substr = ''
-    i = start_index - 1
-    while i >= 0:
-        if string[i] in matching_characters:
-            matching_substr = string[i] + matching_substr
-        else:
-            break
-        i -= 1
-    return matching_substr
-
-
-def find_contiguous_matches_to_right(string: str, start_index: int, matching_characters: str):
-    matching_substr = ''
-    i = start_index + 1
-    while i < len(string):
-        if string[i] in matching_characters:
-            matching_substr += string[i]
-        else:
-            break
-        i += 1
-    return matching_substr
+def solve(lines: list[str], props) -> int:
+    schematic = parse.label_numbers(lines)
+    gears, labels = parse.adjacent_numbers(schematic, symbols)
+    # pairs are ordered by symbol, so each symbol's numbers are together
+    gears, first_pairs, counts = np.unique(gears, return_index=True, return_counts=True)
+    powers = np.multiply.reduceat(schematic.values[labels], first_pairs) if len(labels) > 0 else np.array([], int)
+    valid = counts == gear_numbers
+    logger.debug('Found %d valid gears of %d', valid.sum(), len(gears))
+    return int(powers[valid].sum())
 
 
 def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
-    # as we iterate over lines first, max "x" is actually depth
-    depth = len(lines)
-    width = len(lines[0])
-    limits = Limits(depth, width)
-
-    # find all symbols
-    symbol_coords = []
-    for i in range(len(lines)):
-        line = lines[i]
-        for j in range(len(line)):
-            character = line[j]
-            if character in symbols:
-                symbol_coords.append(Coordinate(i, j))
-    logger.debug('Discovered %d symbol coordinates: %r', len(symbol_coords), symbol_coords)
-
-    subtotal = 0
-    for symbol in symbol_coords:
-        # filter out gears without exactly two adjacent numbers
-        gear_adjacent = np.full((3, 3), False, np.bool_)
-        for neighbour in hc.valid_neighbours(symbol, limits):
-            neighbour_character = lines[neighbour.line][neighbour.character]
-            if neighbour_character in digits:
-                gear_adjacent[neighbour.line - symbol.line + 1, neighbour.character - symbol.character + 1] = True
-        count = 0
-        # horizontal matches can never overlap with other matches
-        if gear_adjacent[1, 0]:
-            count += 1
-        if gear_adjacent[1, 2]:
-            count += 1
-        # if above/below matched, then at most 1 number can be present
-        # otherwise count corners
-        if gear_adjacent[0, 1]:
-            count += 1
-        else:
-            if gear_adjacent[0, 0]:
-                count += 1
-            if gear_adjacent[0, 2]:
-                count += 1
-        if gear_adjacent[2, 1]:
-            count += 1
-        else:
-            if gear_adjacent[2, 0]:
-                count += 1
-            if gear_adjacent[2, 2]:
-                count += 1
-        if count != 2:
-            continue
-        logger.debug('Found valid gear: %s', symbol)
-
-        # find adjacent numbers from the adjacent digits
-        gear_power = 1
-        if gear_adjacent[1, 0]: # left
-            number = (find_contiguous_matches_to_left(lines[symbol.line], symbol.character - 1, digits)
-                      + lines[symbol.line][symbol.character - 1])
-            logger.debug('  Gear number: %s', number)
-            gear_power *= int(number)
-        if gear_adjacent[1, 2]: # right
-            number = (lines[symbol.line][symbol.character + 1]
-                      + find_contiguous_matches_to_right(lines[symbol.line], symbol.character + 1, digits))
-            logger.debug('  Gear number: %s', number)
-            gear_power *= int(number)
-        if gear_adjacent[0, 1]: # up
-            number = (find_contiguous_matches_to_left(lines[symbol.line - 1], symbol.character, digits)
-                      + lines[symbol.line - 1][symbol.character]
-                      + find_contiguous_matches_to_right(lines[symbol.line - 1], symbol.character, digits))
-            logger.debug('  Gear number: %s', number)
-            gear_power *= int(number)
-        else:
-            if gear_adjacent[0, 0]: # up left
-                number = (find_contiguous_matches_to_left(lines[symbol.line - 1], symbol.character - 1, digits)
-                          + lines[symbol.line - 1][symbol.character - 1])
-                logger.debug('  Gear number: %s', number)
-                gear_power *= int(number)
-            if gear_adjacent[0, 2]: # up right
-                number = (lines[symbol.line - 1][symbol.character + 1]
-                          + find_contiguous_matches_to_right(lines[symbol.line - 1], symbol.character + 1, digits))
-                logger.debug('  Gear number: %s', number)
-                gear_power *= int(number)
-        if gear_adjacent[2, 1]: # down
-            number = (find_contiguous_matches_to_left(lines[symbol.line + 1], symbol.character, digits)
-                      + lines[symbol.line + 1][symbol.character]
-                      + find_contiguous_matches_to_right(lines[symbol.line + 1], symbol.character, digits))
-            logger.debug('  Gear number: %s', number)
-            gear_power *= int(number)
-        else:
-            if gear_adjacent[2, 0]: # down left
-                number = (find_contiguous_matches_to_left(lines[symbol.line + 1], symbol.character - 1, digits)
-                          + lines[symbol.line + 1][symbol.character - 1])
-                logger.debug('  Gear number: %s', number)
-                gear_power *= int(number)
-            if gear_adjacent[2, 2]: # down right
-                number = (lines[symbol.line + 1][symbol.character + 1]
-                          + find_contiguous_matches_to_right(lines[symbol.line + 1], symbol.character + 1, digits))
-                logger.debug('  Gear number: %s', number)
-                gear_power *= int(number)
-        logger.debug('  Gear power: %s', gear_power)
-        subtotal += gear_power
-
-    print(subtotal)
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
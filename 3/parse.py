@@ -0,0 +1,48 @@
+'''
+Labelling shared by both parts of day 3: every number in the schematic is labelled once,
+so finding the numbers next to any set of symbols is a lookup of the labels around each symbol
+'''
+from dataclasses import dataclass
+
+from lib.class_grid import Grid
+import lib.helper_import as hi
+import lib.helper_parse as hp
+
+np = hi.lazy_import('numpy')
+
+
+@dataclass(frozen=True)
+class Schematic:
+    grid: Grid
+    # label of the number covering each index of the grid (0 for none): numbers are labelled from 1 in reading order
+    labels: 'np.ndarray'
+    # value of each label, with 0 for no number
+    values: 'np.ndarray'
+
+
+def label_numbers(lines: list[str]) -> Schematic:
+    grid = Grid.from_lines(lines)
+    # the separator after each row keeps numbers from running on to the next row
+    starts, ends, values = hp.find_numbers(grid.flat)
+    number_labels = np.arange(1, len(starts) + 1)
+    # each label is added where its number starts and removed where it ends, so a running total labels every digit
+    changes = np.zeros(grid.size + 1, np.int64)
+    changes[starts] = number_labels
+    changes[ends] = -number_labels
+    labels = np.cumsum(changes[:-1])
+    return Schematic(grid, labels, np.concatenate(([0], values)))
+
+
+def adjacent_numbers(schematic: Schematic, symbols: str) -> tuple['np.ndarray', 'np.ndarray']:
+    '''Index of each symbol and label of each number next to it, once per pair, ordered by symbol'''
+    grid = schematic.grid
+    is_symbol = np.isin(grid.flat, np.frombuffer(symbols.encode(), np.uint8))
+    symbol_indices = np.flatnonzero(is_symbol)
+    neighbours = symbol_indices[:, np.newaxis] + np.array(grid.diagonal_offsets)
+    # neighbours beyond the first or last row have no label; those beyond either end of a row are separators
+    within = (neighbours >= 0) & (neighbours < grid.size)
+    neighbour_labels = np.where(within, schematic.labels[np.clip(neighbours, 0, grid.size - 1)], 0)
+    pairs = np.unique(np.stack([np.broadcast_to(symbol_indices[:, np.newaxis], neighbours.shape).ravel(),
+                                neighbour_labels.ravel()], axis=1), axis=0)
+    pairs = pairs[pairs[:, 1] > 0]
+    return pairs[:, 0], pairs[:, 1]
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+from collections.abc import Iterable
 import logging
 import pathlib
 import sys
@@ -8,39 +9,31 @@ sys.path.append(str(__file.parent.parent.resolve()))
 
 import lib.helper_args as ha
 import lib.helper_file as hf
+import lib.helper_import as hi
 import lib.helper_log as hl
 
+np = hi.lazy_import('numpy')
+parse = hi.import_sibling(__file, 'parse')
+
 logger = logging.getLogger(__file.stem)
 
 
+def points(matches: 'np.ndarray') -> int:
+    # the first match is worth a point, and each match after doubles it
+    return int(np.where(matches > 0, np.left_shift(1, np.maximum(matches - 1, 0)), 0).sum())
+
+
+def solve(lines: Iterable[str], props) -> int:
+    return points(parse.match_counts('\n'.join(lines).encode()))
+
+
 def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
-    subtotal = 0
-    for line in lines:
-        if len(line) < 1:
-            continue
-        game_subtotal = 0
-        righters = set()
-        game_label, number_sets_label = line.split(':', 1)
-        lefter_labels, righter_labels = number_sets_label.split('|', 1)
-        for righter_label in righter_labels.split():
-            righters.add(int(righter_label))
-        for lefter_label in lefter_labels.split():
-            lefter = int(lefter_label)
-            if lefter in righters:
-                if game_subtotal == 0:
-                    game_subtotal = 1
-                else:
-                    game_subtotal *= 2
-        logger.debug('%s is worth %d points', game_label, game_subtotal)
-        subtotal += game_subtotal
-
-    print(subtotal)
+    return sum(points(parse.match_counts(chunk)) for chunk in hf.iter_chunks(props))
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -1,57 +1,64 @@
 #!/usr/bin/env python3
 
+from collections.abc import Iterable
 import logging
 import pathlib
 import sys
 __file = pathlib.Path(__file__).absolute()
 sys.path.append(str(__file.parent.parent.resolve()))
 
-import numpy as np
-
 import lib.helper_args as ha
 import lib.helper_file as hf
+import lib.helper_import as hi
 import lib.helper_log as hl
 
+np = hi.lazy_import('numpy')
+parse = hi.import_sibling(__file, 'parse')
+
 logger = logging.getLogger(__file.stem)
 
 
+def count_cards(matches: 'np.ndarray', carried: list[int]) -> tuple[int, list[int]]:
+    '''
+    Total copies of a run of cards (assumed to be in order), given the copies carried over from any earlier cards.
+    Copies are tracked as a difference array: each card adds its copies to the running count of extra copies
+    at the first card it wins, and takes them away again after the last, so every card takes constant time.
+    Each card's copies depend on the cards before it, so the cards are still counted one at a time.
+    Returns the total and the changes to carry over to the following cards.
+    '''
+    count = len(matches)
+    changes = carried + [0] * (count + int(matches.max(initial=0)) + 1 - len(carried))
+    extra = 0
+    total = 0
+    for card, matching in enumerate(matches.tolist()):
+        extra += changes[card]
+        copies = 1 + extra
+        total += copies
+        changes[card + 1] += copies
+        changes[card + 1 + matching] -= copies
+    carried = changes[count:]
+    carried[0] += extra
+    return total, carried
+
+
+def solve(lines: Iterable[str], props) -> int:
+    total, _ = count_cards(parse.match_counts('\n'.join(lines).encode()), [])
+    return total
+
+
 def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
-    matching_numbers = np.zeros(len(lines), np.int8)
-    for line in lines:
-        if len(line) < 1:
-            continue
-        matching_game_numbers = 0
-        righters = set()
-        game_label, number_sets_label = line.split(':', 1)
-        game_number = int(game_label.split()[1])
-        lefter_labels, righter_labels = number_sets_label.split('|', 1)
-        for righter_label in righter_labels.split():
-            righters.add(int(righter_label))
-        for lefter_label in lefter_labels.split():
-            lefter = int(lefter_label)
-            if lefter in righters:
-                matching_game_numbers += 1
-        logger.debug('%s has %d matching numbers', game_label, matching_game_numbers)
-        matching_numbers[game_number - 1] = matching_game_numbers
-
-    copy_count = np.ones(len(lines), np.longlong)
-    for game_number in range(len(matching_numbers)):
-        matches = matching_numbers[game_number]
-        for i in range(matches):
-            copy_count[game_number + i + 1] += copy_count[game_number]
-    logger.debug('Copy counts: %r', copy_count)
-
-    subtotal = 0
-    for count in copy_count:
-        subtotal += count
-
-    print(subtotal)
+    total = 0
+    carried = []
+    # cards only win copies of the next few cards, so only those few changes are carried between chunks
+    for chunk in hf.iter_chunks(props):
+        chunk_total, carried = count_cards(parse.match_counts(chunk), carried)
+        total += chunk_total
+    return total
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -0,0 +1,103 @@
+'''
+Parsing shared by both parts of day 4: the matching numbers on every card,
+read from fixed columns where the cards are laid out like the real input, and otherwise counted with bitsets
+'''
+from typing import Optional
+
+import lib.helper_import as hi
+import lib.helper_parse as hp
+
+np = hi.lazy_import('numpy')
+
+# every number on a card is below this, so each set of numbers fits in two 64-bit words
+NUMBER_LIMIT = 128
+WORD_BITS = 64
+# width of each number's field in the usual layout: two characters, right-aligned, then a space
+FIELD_WIDTH = 3
+
+
+def _popcount(words: 'np.ndarray') -> 'np.ndarray':
+    '''Set bits in each row of 64-bit words'''
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words).sum(axis=1, dtype=np.int64)
+    # numpy before 2.0 has no popcount, so count the unpacked bits instead
+    return np.unpackbits(np.ascontiguousarray(words).view(np.uint8), axis=1).sum(axis=1, dtype=np.int64)
+
+
+def _fixed_layout_counts(data: 'np.ndarray', width: int) -> Optional['np.ndarray']:
+    '''
+    Matches on every card when every line is laid out like the first, as in the real input:
+    the same width, with each number right-aligned in a field of two characters,
+    so the numbers can be read straight from their columns without searching for them.
+    width includes the newline ending each line.
+    '''
+    if width == 0 or len(data) % width != 0:
+        return None
+    rows = data.reshape(-1, width)
+    first = rows[0].tobytes()
+    colon, bar = first.find(b':'), first.find(b'|')
+    # each field is a space and then two characters, so the bar and the newline are a field width apart too
+    if colon < 0 or bar < colon or (bar - colon - 2) % FIELD_WIDTH or (width - bar - 2) % FIELD_WIDTH:
+        return None
+    zero = np.uint8(ord('0'))
+    sides = []
+    for start, end in [(colon, bar), (bar, width - 1)]:
+        # strided views of each kind of column, so nothing is copied until the numbers are read
+        spaces = rows[:, start + 1:end:FIELD_WIDTH]
+        tens = rows[:, start + 2:end:FIELD_WIDTH]
+        ones = rows[:, start + 3:end:FIELD_WIDTH]
+        if not ((rows[:, start] == first[start]).all() and (spaces == ord(' ')).all()
+                and ((ones - zero) <= 9).all() and (((tens - zero) <= 9) | (tens == ord(' '))).all()):
+            return None
+        # a space has no bits in common with the digit values, so is read as a zero
+        numbers = (tens & np.uint8(0x0f)) * np.uint8(10) + (ones & np.uint8(0x0f))
+        # one card to a column, so each field is a contiguous row
+        sides.append(np.ascontiguousarray(numbers.T))
+    if not (rows[:, -1] == ord('\n')).all():
+        return None
+    winning, having = sides
+    # with so few numbers on a card, comparing each winning number against every number had
+    # beats building bitsets, as it never leaves the bytes the numbers were read into
+    counts = np.zeros(len(rows), np.uint16)
+    for index, field in enumerate(winning):
+        # each number counts once, as in the bitsets: a number had twice matches once,
+        # and a winning number repeated on the same card is only counted the first time
+        matches = (having == field).any(axis=0)
+        for earlier in winning[:index]:
+            matches &= field != earlier
+        counts += matches
+    return counts.astype(np.int64)
+
+
+def match_counts(buffer: bytes) -> 'np.ndarray':
+    '''How many of each card's numbers are winning numbers, for every card in order'''
+    data = np.frombuffer(buffer, np.uint8)
+    counts = _fixed_layout_counts(data, buffer.find(b'\n') + 1)
+    if counts is not None:
+        return counts
+
+    starts, ends, values = hp.find_numbers(data)
+    if len(ends) > 0 and ends[-1] >= len(data):
+        # only possible when the last line has no trailing newline
+        data = np.append(data, np.uint8(ord('\n')))
+    # card numbers are followed by ':', and each card's winning numbers come before its '|'
+    is_card = data[ends] == ord(':')
+    card_starts = starts[is_card]
+    bars = np.flatnonzero(data == ord('|'))
+    card_bars = bars[np.minimum(np.searchsorted(bars, card_starts), len(bars) - 1)]
+    numbers = ~is_card
+    # numbers are in order, so each belongs to the card whose number came last before it
+    card = np.cumsum(is_card)[numbers] - 1
+    if (card < 0).any():
+        raise Exception('Numbers found before any card')
+    number_values = values[numbers]
+    if (number_values >= NUMBER_LIMIT).any():
+        raise Exception(f'Card numbers must be less than {NUMBER_LIMIT}')
+    having = starts[numbers] > card_bars[card]
+
+    # row 2 * card of the membership table marks the card's winning numbers, and the row after the numbers it has
+    members = np.zeros((2 * len(card_starts), NUMBER_LIMIT), np.bool_)
+    members[2 * card + having, number_values] = True
+    # packed a bit per number, so each row becomes a bitset of two 64-bit words
+    bitsets = np.packbits(members, axis=1).view(np.uint64).reshape(-1, 2, NUMBER_LIMIT // WORD_BITS)
+    return _popcount(bitsets[:, 0] & bitsets[:, 1])
@@ -0,0 +1,96 @@
+'''Parsing shared by both parts of day 5, so the parsed almanac can be saved and reused'''
+from dataclasses import dataclass
+import logging
+
+from lib.class_interval_map import IntervalMap, compose
+from lib.class_limits import Limits
+import lib.helper_import as hi
+
+bidict = hi.lazy_import('bidict')
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Almanac:
+    seeds: tuple[int]
+    # source category -> destination category
+    dependency_mappings: 'bidict.bidict'
+    # source category -> map to the destination category
+    dependency_instructions: dict[str, IntervalMap]
+    # every map from seed to location composed into one, so it is saved along with the rest
+    location: IntervalMap
+
+
+def parse_almanac(lines: list[str]) -> Almanac:
+    target_seeds = lines[0]
+    dependency_mappings = bidict.bidict()
+    dependency_instructions = {}
+
+    dependencies = {}
+    i = 2
+    current_map_label = ''
+    current_map = []
+    while i < len(lines):
+        line = lines[i].strip()
+        if len(line) < 1:
+            if len(current_map_label) < 1:
+                logger.debug('Empty map label encountered during break: skipping')
+            elif len(current_map) < 1:
+                logger.warn('Empty mapping encountered for %s', current_map_label)
+                current_map_label = ''
+            else:
+                dependencies[current_map_label] = current_map
+                current_map_label = ''
+                current_map = []
+        elif len(current_map_label) < 1:
+            current_map_label = line
+        else:
+            current_map.append(line)
+        i += 1
+    dependencies[current_map_label] = current_map
+    if len(current_map) < 1:
+        logger.warn('Empty mapping encountered for %s', current_map_label)
+    else:
+        dependencies[current_map_label] = current_map
+    logger.debug('Extracted %d dependencies from almanac', len(dependencies))
+
+    for map_label, map_instructions in dependencies.items():
+        trimmed_map_label, _ = map_label.split(None, 1)
+        source, destination = trimmed_map_label.split('-to-', 1)
+        dependency_mappings[source] = destination
+        logger.debug('Adding mapping from %s to %s', source, destination)
+        ranges = []
+        for map_instruction in map_instructions:
+            instruction_labels = map_instruction.split()
+            if len(instruction_labels) > 3:
+                logger.warn('More than 3 instructions found in almanac: %s (%s)', map_label, map_instruction)
+            destination_start = int(instruction_labels[0])
+            source_start = int(instruction_labels[1])
+            range_length = int(instruction_labels[2])
+            ranges.append((Limits(source_start, source_start + range_length), destination_start - source_start))
+        dependency_instructions[source] = IntervalMap.from_ranges(ranges)
+
+    # assert there is a route from seed to location
+    checker = 'location'
+    while checker != 'seed':
+        if checker not in dependency_mappings.inverse:
+            raise Exception(f'No inverse mapping found for {checker}')
+        checker = dependency_mappings.inverse[checker]
+    logger.debug('Found valid mapping path from seed to location')
+
+    _, seeds_label = target_seeds.split(':', 1)
+    seeds = tuple(int(seed_label.strip()) for seed_label in seeds_label.split())
+    return Almanac(seeds, dependency_mappings, dependency_instructions,
+                   location_map(dependency_mappings, dependency_instructions))
+
+
+def location_map(dependency_mappings: 'bidict.bidict', dependency_instructions: dict[str, IntervalMap]) -> IntervalMap:
+    '''Every map from seed to location composed into one'''
+    combined = IntervalMap()
+    category = 'seed'
+    while category != 'location':
+        combined = compose(combined, dependency_instructions[category])
+        category = dependency_mappings[category]
+    logger.debug('Composed seed to location map of %d pieces', len(combined.starts))
+    return combined
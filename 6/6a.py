@@ -9,8 +9,11 @@ sys.path.append(str(__file.parent.parent.resolve()))
 
 import lib.helper_args as ha
 import lib.helper_file as hf
+import lib.helper_import as hi
 import lib.helper_log as hl
 
+race = hi.import_sibling(__file, 'race')
+
 logger = logging.getLogger(__file.stem)
 
 
@@ -34,63 +37,27 @@ def max_if_not_unset(new_value: int, existing_value: int, label: str) -> int:
     return new_maximum
 
 
-def midpoint(minimum: int, maximum: int) -> int:
-    return math.floor((maximum - minimum)/2) + minimum
-
-
-
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
+def solve(lines: list[str], props) -> int:
     _, times_label = lines[0].split(':', 1)
     _, distances_label = lines[1].split(':', 1)
     time_labels = times_label.split()
     distance_labels = distances_label.split()
     assert len(time_labels) == len(distance_labels)
-    number_of_games = len(time_labels)
-
-    subtotal = 1
-    for game in range(number_of_games):
-        time_limit = int(time_labels[game])
-        distance_target = int(distance_labels[game])
-
-        starting_midpoint = midpoint(1, time_limit)
-        lower_bound_range = (1, starting_midpoint)
-        upper_bound_range = (starting_midpoint, time_limit)
 
-        while lower_bound_range[1] - lower_bound_range[0] > 0:
-            time_test = midpoint(lower_bound_range[0], lower_bound_range[1])
-            remaining_time = time_limit - time_test
-            distance_travelled = remaining_time * time_test
-            if distance_travelled > distance_target:
-                lower_bound_range = (lower_bound_range[0], time_test)
-            else:
-                lower_bound_range = (time_test + 1, lower_bound_range[1])
+    counts = race.winning_holds_bulk([int(label) for label in time_labels],
+                                     [int(label) for label in distance_labels]).tolist()
+    for game, winning_strategy_count in enumerate(counts):
+        logger.debug('Game %d has %s winning strategies', game, winning_strategy_count)
+    return math.prod(counts)
 
-        while upper_bound_range[1] - upper_bound_range[0] > 0:
-            time_test = midpoint(upper_bound_range[0], upper_bound_range[1])
-            if time_test == upper_bound_range[0]:
-                assert upper_bound_range[1] - upper_bound_range[0] == 1
-                # Force the final iteration step to split the range
-                time_test = upper_bound_range[1]
-            remaining_time = time_limit - time_test
-            distance_travelled = remaining_time * time_test
-            if distance_travelled > distance_target:
-                upper_bound_range = (time_test, upper_bound_range[1])
-            else:
-                upper_bound_range = (upper_bound_range[0], time_test - 1)
 
-        winning_strategy_count = upper_bound_range[0] - lower_bound_range[0] + 1
-        logger.debug(
-            'Game %d has %s winning strategies (%d to %d)',
-            game, winning_strategy_count, lower_bound_range[0], upper_bound_range[0])
-        subtotal *= winning_strategy_count
-
-    print(subtotal)
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -0,0 +1,49 @@
+'''
+Counting the winning hold times of races, shared by both parts of day 6.
+Holding the button for t of a race's T milliseconds travels t * (T - t),
+which beats the record D exactly when (T - 2t)^2 < T^2 - 4D,
+so the winning holds are those with |T - 2t| below the square root of the discriminant.
+'''
+import math
+
+import lib.helper_import as hi
+
+np = hi.lazy_import('numpy')
+
+# times below this keep every intermediate value of the bulk path well within a signed 64-bit integer
+BULK_TIME_LIMIT = 2**30
+
+
+def winning_holds(time_limit: int, record: int) -> int:
+    '''How many hold times beat the record, exactly for integers of any size'''
+    discriminant = time_limit * time_limit - 4 * record
+    if discriminant <= 0:
+        # at best the record is equalled, which doesn't win
+        return 0
+    # largest |T - 2t| that wins, which must also share the parity of T (and can't pass T, with 0 <= t <= T)
+    spread = min(math.isqrt(discriminant - 1), time_limit)
+    spread -= (spread - time_limit) % 2
+    return spread + 1 if spread >= 0 else 0
+
+
+def winning_holds_bulk(time_limits: 'np.ndarray', records: 'np.ndarray') -> 'np.ndarray':
+    '''
+    winning_holds for many races at once, for times below BULK_TIME_LIMIT.
+    The square root is taken in floating point and then corrected with exact integer checks.
+    '''
+    time_limits = np.asarray(time_limits, np.int64)
+    if ((time_limits < 0) | (time_limits >= BULK_TIME_LIMIT)).any():
+        raise Exception(f'Race times must be from 0 to below {BULK_TIME_LIMIT} to count in bulk')
+    # records beyond the square of the time can never be beaten, and any below 0 are beaten by every hold,
+    # so clipping them to those bounds avoids overflow without changing the counts
+    records = np.clip(np.asarray(records, np.int64), -1, time_limits * time_limits)
+    discriminant = time_limits * time_limits - 4 * records
+    wins = discriminant > 0
+    limit = np.where(wins, discriminant - 1, 0)
+    spread = np.sqrt(limit.astype(np.float64)).astype(np.int64)
+    # float64 keeps 53 bits, so the estimate can be one out either way
+    spread -= spread * spread > limit
+    spread += (spread + 1) * (spread + 1) <= limit
+    spread = np.minimum(spread, time_limits)
+    spread -= (spread - time_limits) % 2
+    return np.where(wins & (spread >= 0), spread + 1, 0)
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
+from collections.abc import Iterable
 import logging
-import operator
 import pathlib
 import sys
 __file = pathlib.Path(__file__).absolute()
@@ -9,137 +9,33 @@ sys.path.append(str(__file.parent.parent.resolve()))
 
 import lib.helper_args as ha
 import lib.helper_file as hf
+import lib.helper_import as hi
 import lib.helper_log as hl
 
-logger = logging.getLogger(__file.stem)
-
-
-card_ranks = {
-    'J': 0, # joker is individually weaker
-    '2': 2,
-    '3': 3,
-    '4': 4,
-    '5': 5,
-    '6': 6,
-    '7': 7,
-    '8': 8,
-    '9': 9,
-    'T': 10,
-    'Q': 12,
-    'K': 13,
-    'A': 14,
-}
-
-
-classifications = {
-    'Five of a kind': 6,
-    'Four of a kind': 5,
-    'Full house': 4,
-    'Three of a kind': 3,
-    'Two pair': 2,
-    'One pair': 1,
-    'High card': 0
-}
-
-
-getter_0 = operator.itemgetter(0)
-getter_1 = operator.itemgetter(1)
-getter_2 = operator.itemgetter(2)
-getter_3 = operator.itemgetter(3)
-getter_4 = operator.itemgetter(4)
-
+parse = hi.import_sibling(__file, 'parse')
 
-def parse_hand(hand: str) -> list[int]:
-    assert len(hand) == 5
-    parsed = []
-    for c in hand:
-        assert c in card_ranks
-        parsed.append(card_ranks[c])
-    return parsed
-
-
-def count_ranks(hand: list[int]) -> dict[int, int]:
-    counts = {}
-    for card in hand:
-        if card not in counts:
-            counts[card] = 1
-        else:
-            counts[card] += 1
-    return counts
-
-
-def classify_hand(hand: list[int]) -> int:
-    counts = count_ranks(hand)
-    joker_count = 0
-    if card_ranks['J'] in counts:
-        joker_count = counts[card_ranks['J']]
-        del counts[card_ranks['J']]
-    ordered_counts = [(k, v) for k, v in sorted(
-        counts.items(), key=getter_1, reverse=True)]
-    if len(ordered_counts) < 1:
-        # full hand of jokers
-        return classifications['Five of a kind']
-    else:
-        # jokers contribute to the "best" hand - always best to get most cards of one type as possible
-        ordered_counts[0] = (ordered_counts[0][0], ordered_counts[0][1] + joker_count)
-    if ordered_counts[0][1] == 5:
-        return classifications['Five of a kind']
-    elif ordered_counts[0][1] == 4:
-        return classifications['Four of a kind']
-    elif ordered_counts[0][1] == 3:
-        if ordered_counts[1][1] == 2:
-            return classifications['Full house']
-        else:
-            return classifications['Three of a kind']
-    elif ordered_counts[0][1] == 2:
-        if ordered_counts[1][1] == 2:
-            return classifications['Two pair']
-        else:
-            return classifications['One pair']
-    else:
-        return classifications['High card']
+logger = logging.getLogger(__file.stem)
 
 
-class CardHand:
-    def __init__(self, hand, bid):
-        self.bid = int(bid)
-        self.hand_label = hand
-        self.cards = parse_hand(hand)
-        self.classification = classify_hand(self.cards)
+# joker is individually weaker
+card_order = 'J23456789TQKA'
+joker = 'J'
 
-    def value(self, rank: int) -> int:
-        return self.bid * rank
 
+def solve(lines: Iterable[str], props) -> int:
+    hands, bids = parse.pack_hands(''.join(line + '\n' for line in lines).encode(), card_order, joker)
+    return parse.total_winnings(hands, bids)
 
 
 def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-
-    hands = []
-    for line in lines:
-        hands.append(CardHand(*line.split()))
-    hands.sort(key=lambda hand: (
-        hand.classification,
-        hand.cards[0],
-        hand.cards[1],
-        hand.cards[2],
-        hand.cards[3],
-        hand.cards[4],
-        ))
-
-    subtotal = 0
-    for idx, hand in enumerate(hands):
-        value = hand.value(idx + 1)
-        logger.debug(
-            'hand %s has value %d (classification: %d, bid: %d)',
-            hand.hand_label, value, hand.classification, hand.bid)
-        subtotal += value
-
-    print(subtotal)
+    hands, bids = parse.load_hands(props, card_order, joker)
+    logger.debug('Ranking %d hands', len(hands))
+    return parse.total_winnings(hands, bids)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -0,0 +1,123 @@
+'''
+Packing shared by both parts of day 7: each hand becomes a single integer that sorts in the order the hands rank,
+with the hand's type in the top four bits and then four bits for each card in the order they were dealt.
+'''
+from functools import cache
+import itertools
+from typing import Optional
+
+import lib.helper_file as hf
+import lib.helper_import as hi
+import lib.helper_parse as hp
+
+np = hi.lazy_import('numpy')
+
+HAND_SIZE = 5
+CARD_BITS = 4
+# marks bytes that are not cards
+NO_CARD = 255
+# numpy sorts integers of up to 16 bits stably with a radix sort, so longer keys are sorted 16 bits at a time
+RADIX_BITS = 16
+
+classifications = {
+    'Five of a kind': 6,
+    'Four of a kind': 5,
+    'Full house': 4,
+    'Three of a kind': 3,
+    'Two pair': 2,
+    'One pair': 1,
+    'High card': 0
+}
+
+
+def _classify_counts(counts: tuple[int, ...]) -> int:
+    '''Type of a hand, from how many of each card it has (largest first)'''
+    if counts[0] == 5:
+        return classifications['Five of a kind']
+    elif counts[0] == 4:
+        return classifications['Four of a kind']
+    elif counts[0] == 3:
+        return classifications['Full house' if counts[1] == 2 else 'Three of a kind']
+    elif counts[0] == 2:
+        return classifications['Two pair' if counts[1] == 2 else 'One pair']
+    return classifications['High card']
+
+
+def _partitions(total: int, largest: int) -> list[tuple[int, ...]]:
+    if total == 0:
+        return [()]
+    return [(part,) + rest for part in range(min(total, largest), 0, -1) for rest in _partitions(total - part, part)]
+
+
+@cache
+def classification_table() -> 'np.ndarray':
+    '''
+    Type of hand for each (sum of squared card counts, jokers) - the sum telling apart every way to share the
+    cards that aren't jokers - with each joker joining the most common card, as that always makes the best hand.
+    '''
+    table = np.full((HAND_SIZE ** 2 + 1, HAND_SIZE + 1), -1, np.int64)
+    for jokers in range(HAND_SIZE + 1):
+        for counts in _partitions(HAND_SIZE - jokers, HAND_SIZE - jokers):
+            best = (counts[0] + jokers,) + counts[1:] if counts else (jokers,)
+            table[sum(count * count for count in counts), jokers] = _classify_counts(best)
+    return table
+
+
+def pack_hands(buffer: bytes, card_order: str, joker: Optional[str] = None) -> tuple['np.ndarray', 'np.ndarray']:
+    '''
+    Packed hand and bid of each line.
+    Cards rank in card_order, weakest first; any joker card counts as whichever card makes the best hand.
+    '''
+    data = np.frombuffer(buffer, np.uint8)
+    line_starts = np.concatenate(([0], np.flatnonzero(data[:-1] == ord('\n')) + 1))
+    if len(data) == 0 or data[-1] != ord('\n'):
+        data = np.append(data, np.uint8(ord('\n')))
+    # blank lines hold no hand
+    line_starts = line_starts[data[line_starts] != ord('\n')]
+    card_positions = line_starts[:, np.newaxis] + np.arange(HAND_SIZE)
+    if len(line_starts) > 0 and card_positions[-1, -1] >= len(data):
+        raise Exception(f'Hands must have {HAND_SIZE} cards')
+
+    ranks = np.full(256, NO_CARD, np.uint8)
+    ranks[np.frombuffer(card_order.encode(), np.uint8)] = np.arange(len(card_order))
+    # one column per card in the hand
+    cards = ranks[data[card_positions]].T
+    if (cards == NO_CARD).any():
+        raise Exception(f'Hands must only hold cards from {card_order}')
+
+    counted = np.ones_like(cards, np.bool_) if joker is None else cards != card_order.index(joker)
+    jokers = HAND_SIZE - counted.sum(axis=0, dtype=np.uint8)
+    # each rank adds the square of its count: once for every card, and twice for every pair of cards that match
+    squares = HAND_SIZE - jokers
+    for first, second in itertools.combinations(range(HAND_SIZE), 2):
+        squares += np.uint8(2) * ((cards[first] == cards[second]) & counted[first] & counted[second])
+    packed = classification_table()[squares, jokers]
+    for card in cards:
+        packed = packed << CARD_BITS | card
+
+    # the cards hold digits too, so bids are only looked for after each hand
+    bid_data = data.copy()
+    bid_data[card_positions] = ord(' ')
+    _, _, bids = hp.find_numbers(bid_data)
+    if len(bids) != len(packed):
+        raise Exception('Every hand must have exactly one bid')
+    return packed, bids
+
+
+def load_hands(props, card_order: str, joker: Optional[str] = None) -> tuple['np.ndarray', 'np.ndarray']:
+    '''Packed hands and bids of the whole input, read a chunk at a time'''
+    chunks = [pack_hands(chunk, card_order, joker) for chunk in hf.iter_chunks(props)]
+    if not chunks:
+        return np.zeros(0, np.int64), np.zeros(0, np.int64)
+    hands, bids = zip(*chunks)
+    return np.concatenate(hands), np.concatenate(bids)
+
+
+def total_winnings(hands: 'np.ndarray', bids: 'np.ndarray') -> int:
+    '''Sum of each bid multiplied by the rank of its hand, weakest first (ties in the order they were dealt)'''
+    order = np.arange(len(hands))
+    # least significant digits first, with each stable pass keeping the order of the passes before
+    for shift in range(0, CARD_BITS * (HAND_SIZE + 1), RADIX_BITS):
+        digits = (hands[order] >> shift) & ((1 << RADIX_BITS) - 1)
+        order = order[np.argsort(digits.astype(np.uint16), kind='stable')]
+    return int((bids[order] * np.arange(1, len(order) + 1)).sum())
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-from dataclasses import dataclass
 import logging
 import pathlib
 import sys
@@ -8,59 +7,60 @@ __file = pathlib.Path(__file__).absolute()
 sys.path.append(str(__file.parent.parent.resolve()))
 
 import lib.helper_args as ha
+import lib.helper_cache as hk
 import lib.helper_file as hf
+import lib.helper_import as hi
 import lib.helper_log as hl
 
+np = hi.lazy_import('numpy')
+parse = hi.import_sibling(__file, 'parse')
+jumps = hi.import_sibling(__file, 'jumps')
+
 logger = logging.getLogger(__file.stem)
 
 start = 'AAA'
 end = 'ZZZ'
 
 
-@dataclass(frozen=True)
-class DesertNode:
-    id: int
-    left: int
-    right: int
+def solve(lines: list[str], props) -> int:
+    return solve_network(parse.parse_network(lines), props)
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-    path = lines[0].strip()
-    nodes = lines[2:]
+def solve_network(network: 'parse.Network', props) -> int:
+    current_location = network.index(start)
+    end_location = network.index(end)
+    is_end = np.arange(len(network.names)) == end_location
+    pass_jumps = jumps.PassJumps(network, is_end)
+    # skip whole passes of the instructions until one reaches the end
+    pass_ends = pass_jumps.passes.tolist()
+    reaches_end = pass_jumps.reaches_end.tolist()
+    completed = 0
+    while current_location != end_location and not reaches_end[current_location]:
+        current_location = pass_ends[current_location]
+        completed += 1
+        if completed > len(network.names):
+            # every pass since has started from a node already seen
+            raise Exception(f'{end} is never reached from {start}')
+    logger.debug('Pass %d from %s reaches %s', completed, network.names[current_location], end)
 
-    node_map = {}
-    for node in nodes:
-        id, paths = node.split('=', 1)
-        paths = paths.split('(', 1)[1].split(')', 1)[0]
-        left, right = paths.split(',')
-        desert_node = DesertNode(id.strip(), left.strip(), right.strip())
-        logger.debug('Adding to map: %r', desert_node)
-        node_map[desert_node.id] = desert_node
+    instructions = network.instructions
+    successors = network.successors()
+    steps = completed * len(instructions)
+    for direction in instructions:
+        if current_location == end_location:
+            break
+        current_location = successors[direction][current_location]
+        steps += 1
+    return steps
 
-    current_location = node_map[start]
-    i = 0
-    cycles = 0
-    while current_location.id != end:
-        next_step = path[i]
-        if next_step == 'L':
-            next_location = node_map[current_location.left]
-        elif next_step == 'R':
-            next_location = node_map[current_location.right]
-        else:
-            raise Exception(f'invalid next step {next_step} from {current_location.id} (idx: {i})')
-        logger.debug('Moving from %s to %s (idx: %d, cycle %d)', current_location.id, next_location.id, i, cycles)
-        current_location = next_location
-        i += 1
-        if i >= len(path):
-            cycles += 1
-            i = 0
 
-    print(cycles * len(path) + i)
+def main(props):
+    return solve_network(hk.load_parsed(props, parse.parse_network), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
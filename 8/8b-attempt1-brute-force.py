@@ -54,8 +54,7 @@ class DesertNodeSet:
         return all(map(node_is_terminus, self._set))
 
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
+def solve(lines: list[str], props) -> int:
     path = lines[0].strip()
     assert len(path.replace('L', '').replace('R', '')) == 0
     nodes = lines[2:]
@@ -84,11 +83,16 @@ def main(props):
             cycles += 1
             i = 0
 
-    print(cycles * len(path) + i)
+    return cycles * len(path) + i
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import cache
 import logging
-import math
 import operator
 import pathlib
 import sys
@@ -10,84 +11,157 @@ __file = pathlib.Path(__file__).absolute()
 sys.path.append(str(__file.parent.parent.resolve()))
 
 import lib.helper_args as ha
+import lib.helper_cache as hk
 import lib.helper_file as hf
+import lib.helper_import as hi
 import lib.helper_log as hl
+import lib.helper_math as hm
+
+np = hi.lazy_import('numpy')
+parse = hi.import_sibling(__file, 'parse')
+jumps = hi.import_sibling(__file, 'jumps')
 
 logger = logging.getLogger(__file.stem)
 
 
 @dataclass(frozen=True)
-class DesertNode:
-    id: int
-    left: int
-    right: int
-
-
-def node_is_starting_point(node: DesertNode) -> bool:
-    return node.id.endswith('A')
-
-
-def node_is_terminus(node: DesertNode) -> bool:
-    return node.id.endswith('Z')
-
-
-go_left = operator.attrgetter('left')
-go_right = operator.attrgetter('right')
-
-
-def make_move(node: DesertNode, direction: str, node_map: dict[str, DesertNode]) -> None:
-    if direction == 'L':
-        next_node_id = go_left(node)
-    elif direction == 'R':
-        next_node_id = go_right(node)
-    else:
-        raise Exception(f'invalid direction {direction}')
-    return node_map[next_node_id]
+class GhostPath:
+    '''
+    Where a ghost's walk reaches an end: after lead steps, its walk repeats every length steps.
+    Both are counted in whole passes of the instructions, so the lead can be a little longer than it needs to be.
+    '''
+    start: str
+    lead: int
+    length: int
+    # steps before the end of the first cycle at which the ghost is at an end
+    ends: tuple[int, ...]
+
+    def at_end(self, step: int) -> bool:
+        if step >= self.lead:
+            step = self.lead + (step - self.lead) % self.length
+        return step in self.ends
+
+
+def node_is_starting_point(name: str) -> bool:
+    return name.endswith('A')
+
+
+def node_is_terminus(name: str) -> bool:
+    return name.endswith('Z')
+
+
+def pass_walker(network: 'parse.Network') -> Callable[[int], tuple[int, tuple[int, ...]]]:
+    '''
+    Node reached from each node by following every instruction once,
+    and the steps along the way (from 1) that reach an end, worked out at most once for each node.
+    '''
+    instructions = network.instructions
+    successors = network.successors()
+    is_end = [node_is_terminus(name) for name in network.names]
+
+    @cache
+    def walk_pass(node: int) -> tuple[int, tuple[int, ...]]:
+        ends = []
+        for steps, direction in enumerate(instructions, 1):
+            node = successors[direction][node]
+            if is_end[node]:
+                ends.append(steps)
+        return node, tuple(ends)
+    return walk_pass
+
+
+def trace_ghost(network: 'parse.Network', start: int, pass_jumps: 'jumps.PassJumps',
+                walk_pass: Callable[[int], tuple[int, tuple[int, ...]]]) -> GhostPath:
+    '''
+    Find the cycle of the ghost's (node, instruction) states using Brent's cycle detection over whole passes of the
+    instructions: every state recurs exactly when the node at the start of a pass does.
+    Passes are looked up in the jump tables, so only the passes that reach an end are walked step by step.
+    '''
+    follow = pass_jumps.passes.tolist().__getitem__
+    reaches_end = pass_jumps.reaches_end.tolist()
+
+    # find the cycle length, with the hare searching ever larger powers of two ahead of the tortoise
+    power = length = 1
+    tortoise = start
+    hare = follow(start)
+    while tortoise != hare:
+        if power == length:
+            tortoise = hare
+            power *= 2
+            length = 0
+        hare = follow(hare)
+        length += 1
+    # then the lead, with the hare jumping a whole cycle ahead
+    tortoise = start
+    hare = int(pass_jumps.after([start], length)[0])
+    lead = 0
+    while tortoise != hare:
+        tortoise = follow(tortoise)
+        hare = follow(hare)
+        lead += 1
+
+    count = len(network.instructions)
+    ends = [0] if node_is_terminus(network.names[start]) else []
+    node = start
+    for passes in range(lead + length):
+        if not reaches_end[node]:
+            node = follow(node)
+            continue
+        node, pass_ends = walk_pass(node)
+        # an end at the close of the final pass is the first step of the cycle again, so is already included
+        ends.extend(passes * count + steps for steps in pass_ends if passes * count + steps < (lead + length) * count)
+    return GhostPath(network.names[start], lead * count, length * count, tuple(ends))
+
+
+def first_step_all_at_ends(ghosts: list[GhostPath]) -> int:
+    lead = max(ghost.lead for ghost in ghosts)
+    # until every ghost is cycling, the ghost slowest to start has only so many ends to check
+    slowest = max(ghosts, key=operator.attrgetter('lead'))
+    for step in slowest.ends:
+        if step >= lead:
+            break
+        if all(ghost.at_end(step) for ghost in ghosts):
+            return step
+
+    # from then on, each ghost is at an end at any step that matches one of its ends in the cycle
+    congruences = [(0, 1)]
+    for ghost in ghosts:
+        residues = {step % ghost.length for step in ghost.ends if step >= ghost.lead}
+        congruences = [combined for congruence in congruences for residue in residues
+                       if (combined := hm.combine_congruences(congruence, (residue, ghost.length))) is not None]
+        logger.debug('Ghost from %s leads %d steps into a cycle of %d: %d possible steps for all ghosts',
+                     ghost.start, ghost.lead, ghost.length, len(congruences))
+        if not congruences:
+            raise Exception('The ghosts are never all at an end at the same time')
+    # the first step at or after the lead for any of the possible steps (which all share one modulus)
+    return min(residue + (lead - residue + modulus - 1) // modulus * modulus for residue, modulus in congruences)
+
+
+def solve(lines: list[str], props) -> int:
+    return solve_network(parse.parse_network(lines), props)
+
+
+def solve_network(network: 'parse.Network', props) -> int:
+    starts = [index for index, name in enumerate(network.names) if node_is_starting_point(name)]
+    if not starts:
+        raise Exception('No starting points found')
+    is_end = np.array([node_is_terminus(name) for name in network.names], np.bool_)
+    pass_jumps = jumps.PassJumps(network, is_end)
+    walk_pass = pass_walker(network)
+    ghosts = [trace_ghost(network, start, pass_jumps, walk_pass) for start in starts]
+    for ghost in ghosts:
+        logger.debug('Ghost from %s reaches an end %d times in its first %d steps',
+                     ghost.start, len(ghost.ends), ghost.lead + ghost.length)
+    return first_step_all_at_ends(ghosts)
 
 
 def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
-    path = lines[0].strip()
-    assert len(path.replace('L', '').replace('R', '')) == 0
-    nodes = lines[2:]
-
-    node_map = {}
-    starting_node_ids = set()
-    for node in nodes:
-        id, paths = node.split('=', 1)
-        paths = paths.split('(', 1)[1].split(')', 1)[0]
-        left, right = paths.split(',')
-        desert_node = DesertNode(id.strip(), left.strip(), right.strip())
-        if desert_node.id in node_map:
-            raise Exception(f'Duplicate node detected: {desert_node.id}')
-        logger.debug('Adding to map: %r', desert_node)
-        node_map[desert_node.id] = desert_node
-        if node_is_starting_point(desert_node):
-            starting_node_ids.add(desert_node.id)
-
-    starting_node_steps = {}
-    for starting_node_id in starting_node_ids:
-        i = 0
-        cycles = 0
-        current_node = node_map[starting_node_id]
-        while not node_is_terminus(current_node):
-            next_node = make_move(current_node, path[i], node_map)
-            logger.debug('Travelling from %s to %s', current_node.id, next_node.id)
-            current_node = next_node
-            i += 1
-            if i >= len(path):
-                cycles += 1
-                i = 0
-        journey_length = cycles * len(path) + i
-        logger.debug('Journey from %s took %d steps', starting_node_id, journey_length)
-        starting_node_steps[starting_node_id] = journey_length
-
-    logger.warning('This is the solution to the AoC problem, not the generalised problem statement.')
-    print(math.lcm(*list(starting_node_steps.values())))
+    return solve_network(hk.load_parsed(props, parse.parse_network), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
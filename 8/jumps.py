@@ -0,0 +1,45 @@
+'''Jumps through day 8's network by whole passes of the instructions, from every node at once'''
+import pathlib
+
+import lib.helper_import as hi
+
+np = hi.lazy_import('numpy')
+parse = hi.import_sibling(pathlib.Path(__file__), 'parse')
+
+
+class PassJumps:
+    '''
+    Where whole passes of the instructions lead from each node.
+    Each level of jumps covers twice as many passes as the level below (binary lifting),
+    so finding the node after any number of passes takes one lookup per bit of the number,
+    for as many starting nodes at once as needed.
+    '''
+    def __init__(self, network: 'parse.Network', is_end: 'np.ndarray'):
+        successors = np.array(network.successors(), np.intp)
+        nodes = np.arange(len(network.names))
+        # whether the pass from each node is at an end after any of its steps
+        reaches_end = np.zeros(len(nodes), np.bool_)
+        for direction in network.instructions:
+            nodes = successors[direction][nodes]
+            reaches_end |= is_end[nodes]
+        self.passes = nodes
+        self.reaches_end = reaches_end
+        self._jumps = [nodes]
+
+    def jumps(self, level: int) -> 'np.ndarray':
+        '''Node reached from each node after 2**level passes'''
+        while len(self._jumps) <= level:
+            previous = self._jumps[-1]
+            self._jumps.append(previous[previous])
+        return self._jumps[level]
+
+    def after(self, nodes: 'np.ndarray', passes: int) -> 'np.ndarray':
+        '''Node reached after the given number of passes from each of the nodes'''
+        nodes = np.asarray(nodes, np.intp)
+        level = 0
+        while passes:
+            if passes & 1:
+                nodes = self.jumps(level)[nodes]
+            passes >>= 1
+            level += 1
+        return nodes
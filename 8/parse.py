@@ -0,0 +1,48 @@
+'''Parsing shared by both parts of day 8: nodes are numbered, so each step is a lookup in a list rather than a dict'''
+from dataclasses import dataclass
+
+directions = 'LR'
+
+
+@dataclass(frozen=True)
+class Network:
+    # index into directions of each instruction, in order
+    instructions: tuple[int, ...]
+    names: tuple[str, ...]
+    # node reached by going left and right from each node
+    left: tuple[int, ...]
+    right: tuple[int, ...]
+
+    def index(self, name: str) -> int:
+        return self.names.index(name)
+
+    def successors(self) -> tuple[tuple[int, ...], tuple[int, ...]]:
+        '''Node reached from each node, for each direction in turn'''
+        return self.left, self.right
+
+
+def parse_network(lines: list[str]) -> Network:
+    path = lines[0].strip()
+    if len(path.replace('L', '').replace('R', '')) > 0:
+        raise Exception(f'Instructions must only go {directions}')
+    instructions = tuple(directions.index(direction) for direction in path)
+
+    names = []
+    labels = []
+    for node in lines[2:]:
+        if not node.strip():
+            continue
+        id, paths = node.split('=', 1)
+        paths = paths.split('(', 1)[1].split(')', 1)[0]
+        left, right = paths.split(',')
+        names.append(id.strip())
+        labels.append((left.strip(), right.strip()))
+    indices = {name: index for index, name in enumerate(names)}
+    if len(indices) < len(names):
+        raise Exception('Duplicate node detected')
+    missing = {label for pair in labels for label in pair if label not in indices}
+    if missing:
+        raise Exception(f'Paths lead to unknown nodes: {sorted(missing)}')
+    left = tuple(indices[left] for left, _ in labels)
+    right = tuple(indices[right] for _, right in labels)
+    return Network(instructions, tuple(names), left, right)
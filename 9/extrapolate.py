@@ -0,0 +1,86 @@
+'''
+Extrapolation shared by both parts of day 9.
+A sequence of n values whose differences reach zero is extrapolated by its n-th differences being zero,
+so the next value is a sum of the values with alternating binomial coefficients:
+a[n] = sum((-1) ** (n - 1 - k) * comb(n, k) * a[k] for k in range(n)), and the previous value likewise in reverse.
+Every sequence of the same length shares the coefficients, so each group of them takes a single matrix product.
+'''
+from collections.abc import Callable
+from functools import cache
+import math
+
+import lib.helper_import as hi
+import lib.helper_parse as hp
+
+np = hi.lazy_import('numpy')
+
+# one more than the largest magnitude an int64 can hold, and the most digits that always fit
+INT64_LIMIT = 2**63
+INT64_DIGITS = 18
+
+Coefficients = Callable[[int], tuple[int, ...]]
+
+
+@cache
+def next_coefficients(length: int) -> tuple[int, ...]:
+    '''Weight of each value of a sequence in the value that follows it'''
+    return tuple((-1) ** (length - 1 - k) * math.comb(length, k) for k in range(length))
+
+
+@cache
+def previous_coefficients(length: int) -> tuple[int, ...]:
+    '''Weight of each value of a sequence in the value that comes before it'''
+    return next_coefficients(length)[::-1]
+
+
+@cache
+def last_difference_coefficients(length: int) -> tuple[int, ...]:
+    '''Weight of each value of a sequence in its single difference of the highest order'''
+    return tuple((-1) ** (length - 1 - k) * math.comb(length - 1, k) for k in range(length))
+
+
+def _products(values: 'np.ndarray', coefficients: tuple[int, ...]) -> 'np.ndarray':
+    '''Each row of values multiplied by the coefficients, exactly'''
+    if values.dtype != object:
+        largest = max(abs(int(values.max())), abs(int(values.min())))
+        if largest * sum(map(abs, coefficients)) < INT64_LIMIT:
+            return values @ np.array(coefficients, np.int64)
+        values = values.astype(object)
+    # Python integers never overflow
+    return values @ np.array(coefficients, object)
+
+
+def _parse_sequences(buffer: bytes) -> dict[int, 'np.ndarray']:
+    '''Sequences of each length, one to a row, found in bulk where every value fits an int64'''
+    data = np.frombuffer(buffer, np.uint8)
+    starts, ends, values = hp.find_numbers(data)
+    if (ends - starts > INT64_DIGITS).any():
+        # Python integers never overflow
+        by_length: dict[int, list[list[int]]] = {}
+        for line in buffer.splitlines():
+            if line.split():
+                by_length.setdefault(len(line.split()), []).append([int(value) for value in line.split()])
+        return {length: np.array(sequences, object) for length, sequences in by_length.items()}
+
+    negative = (starts > 0) & (data[np.maximum(starts - 1, 0)] == ord('-'))
+    values = np.where(negative, -values, values)
+    # values are in order, so each line's values are together
+    line = np.searchsorted(np.flatnonzero(data == ord('\n')), starts)
+    firsts = np.flatnonzero(np.concatenate(([True], line[1:] != line[:-1]))) if len(line) > 0 else line
+    lengths = np.diff(np.append(firsts, len(line)))
+    return {int(length): values[firsts[lengths == length, np.newaxis] + np.arange(length)]
+            for length in np.unique(lengths)}
+
+
+def extrapolate_total(buffer: bytes, coefficients: Coefficients) -> int:
+    '''Sum of the values extrapolated from every line of sequences'''
+    total = 0
+    for length, values in _parse_sequences(buffer).items():
+        if length < 2:
+            raise Exception('Ran out of differences for sequence')
+        # the differences must reach zero while there are still values to take differences of
+        if _products(values, last_difference_coefficients(length)).any():
+            raise Exception('Ran out of differences for sequence')
+        # summed as Python integers, as the predictions of many lines together could overflow
+        total += sum(_products(values, coefficients(length)).tolist())
+    return total
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+import argparse
+import logging
+import pathlib
+import random
+import sys
+import tempfile
+import time
+__file = pathlib.Path(__file__).absolute()
+sys.path.append(str(__file.parent.parent.resolve()))
+
+import bench.generators as bg
+from lib.class_exercise_properties import ExerciseProperties as cep
+import lib.helper_file as hf
+import lib.helper_log as hl
+import lib.helper_runner as hr
+
+logger = logging.getLogger(__file.stem)
+
+
+def find_number_by_slicing(line: str, numbers: dict[str, int]) -> int:
+    '''How 1b found numbers before using an automaton: test every number against a new slice at each position'''
+    for i in range(len(line)):
+        to_test = line[i:]
+        for k in numbers:
+            if len(k) <= len(to_test) and k == to_test[0:len(k)]:
+                return numbers[k]
+    raise Exception('No number found')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description='Compare ways of finding the calibration values of day 1 part b on a large generated input')
+    parser.add_argument('-n', '--lines', type=int, default=2_000_000, help='number of lines to generate')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the input generator')
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='include debug output; set multiple times to increase verbosity')
+    return parser.parse_args()
+
+
+def measure(name: str, function, path: pathlib.Path, lines: int):
+    start = time.perf_counter()
+    total = function(path)
+    elapsed = time.perf_counter() - start
+    size = path.stat().st_size
+    print(f'{name:<10} {elapsed:9.3f}s {lines / elapsed / 1e6:10.2f} {size / elapsed / 2**20:10.1f}  {total}',
+          flush=True)
+
+
+def main(args):
+    solution = hr.load_solution(1, 'b')
+    reversed_numbers = {number[::-1]: value for number, value in solution.NUMBERS.items()}
+
+    def slicing(path: pathlib.Path) -> int:
+        return sum(find_number_by_slicing(line, solution.NUMBERS) * 10
+                   + find_number_by_slicing(line[::-1], reversed_numbers)
+                   for line in hf.iter_lines(cep(1, 'b', path.parent, input_file=path)))
+
+    def automaton(path: pathlib.Path) -> int:
+        return solution.solve(hf.iter_lines(cep(1, 'b', path.parent, input_file=path)), None)
+
+    def bulk(path: pathlib.Path) -> int:
+        # includes importing numpy, as a solution run from scratch would
+        return solution.main(cep(1, 'b', path.parent, input_file=path))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory) / '1-input-calibration.txt'
+        start = time.perf_counter()
+        path.write_text('\n'.join(bg.calibration(args.lines, random.Random(args.seed))) + '\n')
+        logger.info('Generated %d lines in %.3fs', args.lines, time.perf_counter() - start)
+
+        print(f'{"":<10} {"time":>10} {"M lines/s":>10} {"MiB/s":>10}  total')
+        measure('slicing', slicing, path, args.lines)
+        measure('automaton', automaton, path, args.lines)
+        measure('bulk', bulk, path, args.lines)
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    hl.setup_logging(args.verbose)
+    main(args)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+import argparse
+from dataclasses import dataclass
+import logging
+import pathlib
+import sys
+import timeit
+import tracemalloc
+__file = pathlib.Path(__file__).absolute()
+sys.path.append(str(__file.parent.parent.resolve()))
+
+import lib.class_text_coordinate as ctc
+import lib.helper_log as hl
+
+logger = logging.getLogger(__file.stem)
+
+
+@dataclass(frozen=True, order=True)
+class DataclassCoordinate:
+    '''TextCoordinate as it was before gaining slots and interning'''
+    line: int
+    character: int
+
+    def up(self, distance: int = 1) -> 'DataclassCoordinate':
+        return DataclassCoordinate(self.line - distance, self.character)
+
+    def right(self, distance: int = 1) -> 'DataclassCoordinate':
+        return DataclassCoordinate(self.line, self.character + distance)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description='Compare the cost of creating and looking up coordinates for each TextCoordinate variant')
+    parser.add_argument('-s', '--size', type=int, default=140,
+                        help='width and depth of the grid being walked')
+    parser.add_argument('-n', '--number', type=int, default=1_000_000,
+                        help='number of operations to time')
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='include debug output; set multiple times to increase verbosity')
+    return parser.parse_args()
+
+
+def bytes_per_instance(factory, size: int) -> float:
+    tracemalloc.start()
+    coordinates = [factory(line, character) for line in range(size) for character in range(size)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(coordinates)
+
+
+def measure(name: str, factory, size: int, number: int):
+    middle = factory(size // 2, size // 2)
+    everything = {factory(line, character) for line in range(size) for character in range(size)}
+    # moves within the grid, as solutions do: interned coordinates come back out of the table
+    moves = timeit.timeit(lambda: middle.up().right(), number=number // 2)
+    lookups = timeit.timeit(lambda: middle.up() in everything, number=number)
+    size_in_bytes = bytes_per_instance(factory, size)
+    print(f'{name:<10} {number / moves / 1e6:10.2f} {number / lookups / 1e6:10.2f} {size_in_bytes:10.0f}')
+
+
+def main(args):
+    print(f'{"":<10} {"moves M/s":>10} {"lookup M/s":>10} {"bytes":>10}')
+    measure('dataclass', DataclassCoordinate, args.size, args.number)
+    ctc.intern_within(0, 0)
+    measure('slots', ctc.TextCoordinate, args.size, args.number)
+    ctc.intern_within(args.size, args.size)
+    # instances already exist in the table, so only the references to them are counted
+    measure('interned', ctc.interned, args.size, args.number)
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    hl.setup_logging(args.verbose)
+    main(args)
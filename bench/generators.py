@@ -0,0 +1,507 @@
+'''
+Synthetic puzzle inputs of any size, following the structure of the real inputs closely enough for the solutions.
+Each generator takes a size and a seeded random number generator, and returns the lines of an input file.
+'''
+from collections.abc import Callable
+import itertools
+import random
+import string
+
+Generator = Callable[[int, random.Random], list[str]]
+
+DIGIT_WORDS = ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
+ALMANAC_CATEGORIES = ['seed', 'soil', 'fertilizer', 'water', 'light', 'temperature', 'humidity', 'location']
+ALMANAC_MAXIMUM = 2**32
+
+
+def calibration(size: int, rng: random.Random) -> list[str]:
+    '''Day 1: size lines of letters, digits and spelled out digits'''
+    lines = []
+    for _ in range(size):
+        parts = [rng.choice(string.digits[1:])]
+        for _ in range(rng.randint(2, 8)):
+            choice = rng.random()
+            if choice < 0.3:
+                parts.append(rng.choice(string.digits[1:]))
+            elif choice < 0.5:
+                parts.append(rng.choice(DIGIT_WORDS))
+            else:
+                parts.append(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))))
+        rng.shuffle(parts)
+        lines.append(''.join(parts))
+    return lines
+
+
+def games(size: int, rng: random.Random) -> list[str]:
+    '''Day 2: size games of up to six sets of cubes'''
+    lines = []
+    for game in range(1, size + 1):
+        sets = []
+        for _ in range(rng.randint(1, 6)):
+            colours = rng.sample(['red', 'green', 'blue'], rng.randint(1, 3))
+            sets.append(', '.join(f'{rng.randint(1, 20)} {colour}' for colour in colours))
+        lines.append(f'Game {game}: ' + '; '.join(sets))
+    return lines
+
+
+def schematic(size: int, rng: random.Random) -> list[str]:
+    '''Day 3: a size x size engine schematic of numbers of up to three digits and symbols between them'''
+    lines = []
+    for _ in range(size):
+        line = ''
+        while len(line) < size:
+            line += '.' * rng.randint(0, 4)
+            if rng.random() < 0.7:
+                line += str(rng.randint(1, 999))
+            else:
+                line += rng.choice('#$%&*+-/=@')
+            line += '.'
+        lines.append(line[:size])
+    return lines
+
+
+def scratchcards(size: int, rng: random.Random) -> list[str]:
+    '''Day 4: size cards of ten winning numbers and twenty-five numbers each, as in the real input'''
+    width = len(str(size))
+    lines = []
+    for card in range(1, size + 1):
+        # mostly few matches, so the copies won settle down rather than growing with every card
+        matches = rng.choices([0, 1, 2, 3, 5, 10], weights=[64, 20, 10, 3, 2, 1])[0]
+        # cards cannot win copies of cards beyond the end of the table
+        matches = min(matches, size - card)
+        winning = rng.sample(range(1, 100), 10)
+        others = rng.sample([number for number in range(1, 100) if number not in winning], 25 - matches)
+        having = winning[:matches] + others
+        rng.shuffle(having)
+        lines.append(f'Card {card:>{width}}: ' + ' '.join(f'{number:>2}' for number in winning)
+                     + ' | ' + ' '.join(f'{number:>2}' for number in having))
+    return lines
+
+
+def races(size: int, rng: random.Random) -> list[str]:
+    '''
+    Day 6: size races of up to a hundred milliseconds, each with a record that can be beaten
+    (at most a thousand or so, as part b reads all the records as a single number)
+    '''
+    times = [rng.randint(10, 99) for _ in range(size)]
+    # holding the button for half the race goes furthest
+    records = [rng.randint(time, (time // 2) * (time - time // 2) - 1) for time in times]
+    return ['Time:     ' + ' '.join(f'{time:>4}' for time in times),
+            'Distance: ' + ' '.join(f'{record:>4}' for record in records)]
+
+
+def camel_cards(size: int, rng: random.Random) -> list[str]:
+    '''Day 7: size hands of five cards, each with a bid'''
+    return [''.join(rng.choices('23456789TJQKA', k=5)) + f' {rng.randint(1, 1000)}' for _ in range(size)]
+
+
+def almanac(size: int, rng: random.Random) -> list[str]:
+    '''Day 5: maps of size non-overlapping ranges each, and ten seed ranges'''
+    seeds = []
+    for _ in range(10):
+        length = rng.randint(1, ALMANAC_MAXIMUM // 40)
+        seeds.extend([rng.randrange(ALMANAC_MAXIMUM - length), length])
+    lines = ['seeds: ' + ' '.join(map(str, seeds))]
+    for source, destination in itertools.pairwise(ALMANAC_CATEGORIES):
+        lines.extend(['', f'{source}-to-{destination} map:'])
+        cuts = sorted(rng.sample(range(1, ALMANAC_MAXIMUM), 2 * size))
+        for start, end in zip(cuts[::2], cuts[1::2]):
+            length = end - start
+            lines.append(f'{rng.randrange(ALMANAC_MAXIMUM - length)} {start} {length}')
+    return lines
+
+
+def oasis(size: int, rng: random.Random) -> list[str]:
+    '''Day 9: size sequences of twenty-one values of polynomials of up to the seventh degree'''
+    lines = []
+    for _ in range(size):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 8))]
+        offset = rng.randint(-10, 10)
+        lines.append(' '.join(str(sum(coefficient * (x + offset) ** power for power, coefficient in enumerate(coefficients)))
+                              for x in range(21)))
+    return lines
+
+
+def _node_names(count: int, rng: random.Random) -> list[str]:
+    # ending A and Z are reserved for starts and ends
+    letters = string.ascii_uppercase
+    middles = [''.join(name) for name in itertools.product(letters, letters, letters[1:-1])]
+    if count > len(middles):
+        raise Exception(f'At most {len(middles)} nodes can be named')
+    return rng.sample(middles, count)
+
+
+def network(size: int, rng: random.Random) -> list[str]:
+    '''
+    Day 8: six separate loops of roughly size steps each, structured like the real input:
+    AAA leads to ZZZ and the other loops run from **A to **Z, with every end leading back to just after its start.
+    Each step has a pair of nodes, so the instructions matter without changing how many steps each loop takes.
+    '''
+    instructions = ''.join(rng.choices('LR', k=rng.choice([263, 277, 281, 283, 293])))
+    loop_lengths = [size + rng.randint(0, size // 10) for _ in range(6)]
+    names = iter(_node_names(2 * sum(loop_lengths), rng))
+    prefixes = [''.join(prefix) for prefix in itertools.product(string.ascii_uppercase, repeat=2)]
+    starts = ['AAA'] + [prefix + 'A' for prefix in rng.sample(prefixes[1:-1], 5)]
+    ends = ['ZZZ'] + [start[:2] + 'Z' for start in starts[1:]]
+    nodes = []
+    for start, end, length in zip(starts, ends, loop_lengths):
+        steps = [(start,)] + [(next(names), next(names)) for _ in range(length - 1)] + [(end,)]
+        for step, following in itertools.pairwise(steps):
+            for node in step:
+                left, right = following[0], following[-1]
+                nodes.append((node, left, right) if rng.random() < 0.5 else (node, right, left))
+        nodes.append((end, *steps[1]))
+    rng.shuffle(nodes)
+    return [instructions, ''] + [f'{node} = ({left}, {right})' for node, left, right in nodes]
+
+
+def pipe_loop(size: int, rng: random.Random) -> list[str]:
+    '''Day 10: a size x size grid with the loop running round its edge and stray pipes inside'''
+    grid = [[rng.choice('.|-LJ7F') for _ in range(size)] for _ in range(size)]
+    for index in range(1, size - 1):
+        grid[0][index] = grid[size - 1][index] = '-'
+        grid[index][0] = grid[index][size - 1] = '|'
+    grid[0][0], grid[0][size - 1], grid[size - 1][0], grid[size - 1][size - 1] = 'F', '7', 'L', 'J'
+    start = rng.randrange(1, size - 1)
+    grid[0][start] = 'S'
+    # a stray pipe below the start would look connected to it
+    grid[1][start] = '.'
+    return [''.join(row) for row in grid]
+
+
+def galaxies(size: int, rng: random.Random) -> list[str]:
+    '''Day 11: a size x size image of scattered galaxies, with a few rows and columns left empty to expand'''
+    empty_lines = set(rng.sample(range(size), size // 14))
+    empty_characters = set(rng.sample(range(size), size // 14))
+    return [''.join('#' if line not in empty_lines and character not in empty_characters and rng.random() < 0.025
+                    else '.' for character in range(size))
+            for line in range(size)]
+
+
+def springs(size: int, rng: random.Random) -> list[str]:
+    '''Day 12: size rows of up to twenty springs, some known to be damaged or operational, with their groups'''
+    lines = []
+    for _ in range(size):
+        groups = [rng.randint(1, 5) for _ in range(rng.randint(1, 5))]
+        # a layout matching the groups, which the unknown springs are then taken from
+        layout = '.' * rng.randint(0, 2) + '.'.join('#' * group + '.' * rng.randint(0, 2) for group in groups)
+        layout = layout[:20]
+        groups = [len(run) for run in layout.split('.') if run]
+        springs = ''.join('?' if rng.random() < 0.5 else spring for spring in layout)
+        lines.append(springs + ' ' + ','.join(map(str, groups)))
+    return lines
+
+
+def _reflected_pattern(rng: random.Random) -> list[str]:
+    '''
+    A pattern reflected perfectly in a horizontal line near its top and, but for a single smudge,
+    in a vertical line, so it has an answer for both parts of day 13
+    '''
+    depth, width = rng.choice([7, 9, 11, 13, 15, 17]), rng.choice([5, 7, 9, 11, 13, 15, 17])
+    line_above = rng.randint(1, (depth - 1) // 2)
+    column_left = rng.randint(1, width - 1)
+    reach = min(column_left, width - column_left)
+    rows = []
+    for _ in range(depth - line_above):
+        row = rng.choices('#.', k=width)
+        for offset in range(reach):
+            row[column_left + offset] = row[column_left - 1 - offset]
+        rows.append(row)
+    # rows above the horizontal line mirror those below it, leaving rows at the bottom outside the reflection
+    rows = [list(row) for row in rows[line_above - 1::-1]] + rows
+    # the smudge is in one of those rows, so only spoils the vertical reflection
+    row = rows[rng.randint(2 * line_above, depth - 1)]
+    column = rng.randrange(column_left - reach, column_left + reach)
+    row[column] = '#' if row[column] == '.' else '.'
+    pattern = [''.join(row) for row in rows]
+    if rng.random() < 0.5:
+        pattern = pattern[::-1]
+    if rng.random() < 0.5:
+        pattern = [''.join(column) for column in zip(*pattern)]
+    return pattern
+
+
+def mirror_patterns(size: int, rng: random.Random) -> list[str]:
+    '''Day 13: size patterns of ash and rocks, separated by blank lines'''
+    lines = []
+    for _ in range(size):
+        lines.extend(_reflected_pattern(rng) + [''])
+    return lines[:-1]
+
+
+def rocks(size: int, rng: random.Random) -> list[str]:
+    '''Day 14: a size x size platform of round and cube-shaped rocks'''
+    return [''.join(rng.choices('O#.', weights=[2, 1, 7], k=size)) for _ in range(size)]
+
+
+def initialisation(size: int, rng: random.Random) -> list[str]:
+    '''Day 15: a single line of size steps, removing and adding lenses with a few labels between them'''
+    labels = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6))) for _ in range(max(size // 4, 1))]
+    steps = [rng.choice(labels) + ('-' if rng.random() < 0.3 else f'={rng.randint(1, 9)}') for _ in range(size)]
+    return [','.join(steps)]
+
+
+def mirrors(size: int, rng: random.Random) -> list[str]:
+    '''Day 16: a size x size contraption of mirrors and splitters'''
+    return [''.join(rng.choices('./\\|-', weights=[36, 1, 1, 1, 1], k=size)) for _ in range(size)]
+
+
+def heat_loss(size: int, rng: random.Random) -> list[str]:
+    '''Day 17: a size x size city of heat loss digits'''
+    return [''.join(rng.choices('123456789', k=size)) for _ in range(size)]
+
+
+def _profile_moves(widths: list[int], heights: list[int], depths: list[int]) -> list[tuple[str, int]]:
+    '''
+    Moves around a shape with a skyline of heights above its starting line and of depths below it,
+    each the width given, so the loop never crosses itself and no move is longer than a width or height and depth
+    '''
+    moves = [('U', depths[0] + heights[0])]
+    for index, width in enumerate(widths):
+        if index > 0:
+            rise = heights[index] - heights[index - 1]
+            moves.append(('U' if rise > 0 else 'D', abs(rise)))
+        moves.append(('R', width))
+    moves.append(('D', heights[-1] + depths[-1]))
+    for index in range(len(widths) - 1, -1, -1):
+        moves.append(('L', widths[index]))
+        if index > 0:
+            rise = depths[index] - depths[index - 1]
+            moves.append(('U' if rise > 0 else 'D', abs(rise)))
+    return moves
+
+
+def _skyline(size: int, limit: int, rng: random.Random) -> list[int]:
+    '''size heights from 1 to limit, with each at least two from the one before, so no edges run side by side'''
+    heights = [rng.randint(1, limit)]
+    while len(heights) < size:
+        height = rng.randint(1, limit)
+        if abs(height - heights[-1]) > 1:
+            heights.append(height)
+    return heights
+
+
+def dig_plan(size: int, rng: random.Random) -> list[str]:
+    '''
+    Day 18: a loop of 4 * size moves around a shape of size columns,
+    with colours giving a second such loop with much longer moves for part b
+    '''
+    moves = _profile_moves([rng.randint(2, 6) for _ in range(size)],
+                           _skyline(size, 12, rng), _skyline(size, 12, rng))
+    # the colours hold five hex digits of distance, and a digit for the direction
+    long_moves = _profile_moves([rng.randint(2, 0xfffff) for _ in range(size)],
+                                _skyline(size, 0x7ffff, rng), _skyline(size, 0x7ffff, rng))
+    return [f'{direction} {distance} (#{long_distance:05x}{"RDLU".index(long_direction)})'
+            for (direction, distance), (long_direction, long_distance) in zip(moves, long_moves)]
+
+
+def workflows(size: int, rng: random.Random) -> list[str]:
+    '''Day 19: a tree of size workflows from "in", each sending parts on to others or to A or R, then size parts'''
+    names = ['in'] + [''.join(name) for name in
+                      rng.sample(list(itertools.product(string.ascii_lowercase, repeat=3)), size - 1)]
+    # each workflow is sent to from a workflow before it, so every workflow is reached and none loop
+    following = 1
+    lines = []
+    for name in names[:size]:
+        rules = []
+        for _ in range(rng.randint(1, 3)):
+            if following < size and rng.random() < 0.3:
+                target = names[following]
+                following += 1
+            else:
+                target = rng.choice('AR')
+            rules.append(f'{rng.choice("xmas")}{rng.choice("<>")}{rng.randint(100, 3900)}:{target}')
+        if following < size:
+            fallback = names[following]
+            following += 1
+        else:
+            fallback = rng.choice('AR')
+        lines.append(f'{name}{{{",".join(rules + [fallback])}}}')
+    rng.shuffle(lines)
+    lines.append('')
+    for _ in range(size):
+        lines.append('{' + ','.join(f'{category}={rng.randint(1, 4000)}' for category in 'xmas') + '}')
+    return lines
+
+
+def modules(size: int, rng: random.Random) -> list[str]:
+    '''
+    Day 20: size twelve-bit counters, structured like the real input:
+    the broadcaster starts each chain of flip-flops counting, and each counter's conjunction resets it
+    at a different period, sending a pulse through an inverter to the conjunction in front of rx
+    '''
+    bits = 12
+    names = [''.join(name) for name in itertools.product(string.ascii_lowercase, repeat=2) if name != ('r', 'x')]
+    if size * (bits + 2) + 1 > len(names):
+        raise Exception(f'At most {(len(names) - 1) // (bits + 2)} counters can be named')
+    names = iter(rng.sample(names, size * (bits + 2) + 1))
+    output = next(names)
+    periods = rng.sample(range(2**(bits - 1) + 1, 2**bits, 2), size)
+    lines = []
+    firsts = []
+    for period in periods:
+        flip_flops = [next(names) for _ in range(bits)]
+        conjunction, inverter = next(names), next(names)
+        firsts.append(flip_flops[0])
+        # the flip-flops count in binary, with the conjunction seeing those whose bits are set in the period
+        for bit, flip_flop in enumerate(flip_flops):
+            destinations = flip_flops[bit + 1:bit + 2]
+            if period >> bit & 1:
+                destinations.append(conjunction)
+            lines.append(f'%{flip_flop} -> {", ".join(destinations)}')
+        # once every one is set, the conjunction sets the rest and the count overflows back to zero
+        resets = [flip_flop for bit, flip_flop in enumerate(flip_flops) if bit == 0 or not period >> bit & 1]
+        lines.append(f'&{conjunction} -> {", ".join(resets + [inverter])}')
+        lines.append(f'&{inverter} -> {output}')
+    lines.append(f'&{output} -> rx')
+    lines.append(f'broadcaster -> {", ".join(firsts)}')
+    rng.shuffle(lines)
+    return lines
+
+
+def garden(size: int, rng: random.Random) -> list[str]:
+    '''
+    Day 21: a square garden of odd width at least size, starting in the middle,
+    with the middle row and column, the edges and a diamond around the start kept clear as in the real input
+    '''
+    width = size | 1
+    middle = width // 2
+    lines = []
+    for line in range(width):
+        characters = []
+        for character in range(width):
+            clear = (line in (0, middle, width - 1) or character in (0, middle, width - 1)
+                     or abs(abs(line - middle) + abs(character - middle) - middle) <= 1)
+            characters.append('.' if clear or rng.random() > 0.1 else '#')
+        lines.append(''.join(characters))
+    lines[middle] = lines[middle][:middle] + 'S' + lines[middle][middle + 1:]
+    return lines
+
+
+def bricks(size: int, rng: random.Random) -> list[str]:
+    '''Day 22: size bricks dropped into a 10 x 10 footprint'''
+    lines = []
+    z = 1
+    for _ in range(size):
+        extents = [1, 1, 1]
+        extents[rng.randrange(3)] = rng.randint(1, 4)
+        x = rng.randint(0, 10 - extents[0])
+        y = rng.randint(0, 10 - extents[1])
+        lines.append(f'{x},{y},{z}~{x + extents[0] - 1},{y + extents[1] - 1},{z + extents[2] - 1}')
+        # leave gaps so bricks have to fall
+        z += extents[2] + rng.randint(0, 2)
+    rng.shuffle(lines)
+    return lines
+
+
+def trails(size: int, rng: random.Random) -> list[str]:
+    '''
+    Day 23: a size x size lattice of junctions (size at least 2), joined by winding one-way trails like the real input
+    (slopes only allow travel down and right onto and off each junction)
+    '''
+    spacing = 6
+    span = spacing * (size - 1)
+    depth, width = span + 7, span + 3
+    grid = [['#'] * width for _ in range(depth)]
+    grid[0][1] = grid[1][1] = '.'
+    grid[2][1] = 'v'
+    junctions = [[(3 + spacing * i, 1 + spacing * j) for j in range(size)] for i in range(size)]
+    for i in range(size):
+        for j in range(size):
+            line, character = junctions[i][j]
+            grid[line][character] = '.'
+            if j + 1 < size:
+                grid[line][character + 1] = grid[line][character + spacing - 1] = '>'
+                # detour above or below the direct route between the junctions
+                detour = rng.choice([-2, 0, 2]) if 0 < i < size - 1 else 0
+                for offset in range(2, spacing - 1):
+                    grid[line + detour][character + offset] = '.'
+                if detour != 0:
+                    step = 1 if detour > 0 else -1
+                    for row in range(line + step, line + detour, step):
+                        grid[row][character + 2] = grid[row][character + spacing - 2] = '.'
+                    grid[line][character + 2] = grid[line][character + spacing - 2] = '.'
+                    grid[line][character + 3:character + spacing - 2] = ['#'] * (spacing - 5)
+            if i + 1 < size:
+                for offset in range(1, spacing):
+                    grid[line + offset][character] = '.'
+                grid[line + 1][character] = grid[line + spacing - 1][character] = 'v'
+    # the other two corners would only join two trails, so become bends rather than junctions
+    line, character = junctions[0][-1]
+    grid[line][character - 1] = grid[line + 1][character] = '.'
+    line, character = junctions[-1][0]
+    grid[line - 1][character] = grid[line][character + 1] = '.'
+    last_line, last_character = junctions[-1][-1]
+    grid[last_line + 1][last_character] = 'v'
+    grid[last_line + 2][last_character] = grid[last_line + 3][last_character] = '.'
+    return [''.join(row) for row in grid]
+
+
+def hailstones(size: int, rng: random.Random) -> list[str]:
+    '''Day 24: size hailstones, all hit by one rock thrown from within the real input's test area'''
+    position = [rng.randint(2 * 10**14, 4 * 10**14) for _ in range(3)]
+    velocity = [rng.randint(-300, 300) for _ in range(3)]
+    times = rng.sample(range(10**11, 10**12), size)
+    lines = []
+    for time in times:
+        stone_velocity = [speed + rng.choice([-1, 1]) * rng.randint(1, 300) for speed in velocity]
+        stone_position = [start + (speed - stone_speed) * time
+                          for start, speed, stone_speed in zip(position, velocity, stone_velocity)]
+        lines.append(', '.join(map(str, stone_position)) + ' @ ' + ', '.join(map(str, stone_velocity)))
+    return lines
+
+
+def wiring(size: int, rng: random.Random) -> list[str]:
+    '''Day 25: two well-connected groups of components, size in total, joined by exactly three wires'''
+    names = [''.join(name) for name in rng.sample(list(itertools.product(string.ascii_lowercase, repeat=3)), size)]
+    groups = [names[:size // 2], names[size // 2:]]
+    connections: dict[str, set[str]] = {name: set() for name in names}
+
+    def connect(name: str, other: str):
+        if name not in connections[other]:
+            connections[name].add(other)
+
+    for group in groups:
+        for name in group:
+            for other in rng.sample([other for other in group if other != name], 4):
+                connect(name, other)
+    for _ in range(3):
+        connect(rng.choice(groups[0]), rng.choice(groups[1]))
+    return [f'{name}: {" ".join(sorted(others))}' for name, others in connections.items() if others]
+
+
+# day -> generator and the sizes to time by default (each part of a day shares its generator)
+GENERATORS: dict[int, tuple[Generator, list[int]]] = {
+    1: (calibration, [1000, 2000, 4000, 8000, 16000]),
+    2: (games, [1000, 2000, 4000, 8000, 16000]),
+    3: (schematic, [35, 70, 140, 280, 560]),
+    4: (scratchcards, [1000, 2000, 4000, 8000, 16000]),
+    5: (almanac, [25, 50, 100, 200, 400]),
+    6: (races, [60, 120, 240, 480, 960]),
+    7: (camel_cards, [1000, 2000, 4000, 8000, 16000]),
+    8: (network, [75, 150, 300, 600, 1200]),
+    9: (oasis, [1000, 2000, 4000, 8000, 16000]),
+    10: (pipe_loop, [35, 70, 140, 280]),
+    11: (galaxies, [35, 70, 140, 280]),
+    12: (springs, [250, 500, 1000, 2000, 4000]),
+    13: (mirror_patterns, [25, 50, 100, 200, 400]),
+    14: (rocks, [25, 50, 100, 200]),
+    16: (mirrors, [25, 50, 100, 200]),
+    15: (initialisation, [1000, 2000, 4000, 8000, 16000]),
+    17: (heat_loss, [20, 40, 80, 160]),
+    18: (dig_plan, [25, 50, 100, 200]),
+    19: (workflows, [125, 250, 500, 1000]),
+    20: (modules, [2, 4, 8, 16, 32]),
+    21: (garden, [33, 65, 131, 261]),
+    22: (bricks, [150, 300, 600, 1200]),
+    23: (trails, [3, 4, 5, 6]),
+    24: (hailstones, [75, 150, 300, 600]),
+    25: (wiring, [100, 200, 400, 800]),
+}
+
+
+def generate(day: int, size: int, seed: int = 0) -> list[str]:
+    if day not in GENERATORS:
+        raise Exception(f'No input generator for day {day}')
+    generator, _ = GENERATORS[day]
+    return generator(size, random.Random(f'{day}-{size}-{seed}'))
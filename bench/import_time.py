@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+import argparse
+import logging
+import os
+import pathlib
+import subprocess
+import sys
+import time
+__file = pathlib.Path(__file__).absolute()
+sys.path.append(str(__file.parent.parent.resolve()))
+
+import lib.helper_import as hi
+import lib.helper_log as hl
+import lib.helper_runner as hr
+
+logger = logging.getLogger(__file.stem)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description='Compare the start-up time of each solution with deferred and eager imports')
+    parser.add_argument('-r', '--repeats', type=int, default=5,
+                        help='number of times to start each solution (the fastest is reported)')
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='include debug output; set multiple times to increase verbosity')
+    parser.add_argument('solutions', nargs='*',
+                        help='days (e.g. "5") or days and parts (e.g. "5b") to time; defaults to all')
+    return parser.parse_args()
+
+
+def time_start_up(script: pathlib.Path, eager: bool, repeats: int) -> float:
+    environment = dict(os.environ)
+    if eager:
+        environment[hi.EAGER_ENVIRONMENT_VARIABLE] = '1'
+    else:
+        environment.pop(hi.EAGER_ENVIRONMENT_VARIABLE, None)
+    timings = []
+    for _ in range(repeats):
+        # --help exits as soon as the module-level imports have run
+        start = time.perf_counter()
+        subprocess.run([sys.executable, str(script), '--help'],
+                       env=environment, stdout=subprocess.DEVNULL, check=True)
+        timings.append(time.perf_counter() - start)
+    logger.debug('%s (eager: %s): %r', script.name, eager, timings)
+    return min(timings)
+
+
+def main(args):
+    print(f'{"":>4} {"eager":>10} {"deferred":>10} {"saved":>10}')
+    for day, part in hr.find_solutions(args.solutions):
+        script = hr.solution_path(day, part)
+        eager = time_start_up(script, True, args.repeats)
+        deferred = time_start_up(script, False, args.repeats)
+        saved = eager - deferred
+        print(f'{day:>3}{part} {1000 * eager:8.1f}ms {1000 * deferred:8.1f}ms '
+              f'{1000 * saved:8.1f}ms ({100 * saved / eager:.0f}%)')
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    hl.setup_logging(args.verbose)
+    main(args)
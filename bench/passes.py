@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+import argparse
+import logging
+import pathlib
+import random
+import sys
+import time
+__file = pathlib.Path(__file__).absolute()
+sys.path.append(str(__file.parent.parent.resolve()))
+
+import bench.generators as bg
+import lib.helper_import as hi
+import lib.helper_log as hl
+
+np = hi.lazy_import('numpy')
+day = __file.parent.parent / '8' / '8a.py'
+parse = hi.import_sibling(day, 'parse')
+jumps = hi.import_sibling(day, 'jumps')
+
+logger = logging.getLogger(__file.stem)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description='Compare ways of finding where many passes of the instructions lead in a generated day 8 network')
+    parser.add_argument('-n', '--size', type=int, default=1200, help='size of the generated network')
+    parser.add_argument('-s', '--starts', type=int, default=50, help='number of starting nodes')
+    parser.add_argument('-p', '--passes', type=int, default=1000, help='number of passes to make from each')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the input generator')
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='include debug output; set multiple times to increase verbosity')
+    return parser.parse_args()
+
+
+def measure(name: str, function, *args) -> list[int]:
+    start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - start
+    print(f'{name:<10} {elapsed:9.3f}s', flush=True)
+    return result
+
+
+def main(args):
+    network = parse.parse_network(bg.generate(8, args.size, args.seed))
+    starts = random.Random(args.seed).sample(range(len(network.names)), args.starts)
+    logger.info('Network of %d nodes, with %d instructions', len(network.names), len(network.instructions))
+
+    def stepping(starts: list[int], passes: int) -> list[int]:
+        # as the brute force attempt at 8b does, one instruction at a time
+        successors = network.successors()
+        ends = []
+        for node in starts:
+            for _ in range(passes):
+                for direction in network.instructions:
+                    node = successors[direction][node]
+            ends.append(node)
+        return ends
+
+    def jumping(starts: list[int], passes: int) -> list[int]:
+        # includes building the tables, which any further batch of starts could reuse
+        pass_jumps = jumps.PassJumps(network, np.zeros(len(network.names), np.bool_))
+        return pass_jumps.after(starts, passes).tolist()
+
+    results = [measure('stepping', stepping, starts, args.passes),
+               measure('jumping', jumping, starts, args.passes)]
+    if results[0] != results[1]:
+        raise Exception('Stepping and jumping end at different nodes')
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    hl.setup_logging(args.verbose)
+    main(args)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+
+import argparse
+import logging
+import pathlib
+import sys
+import tempfile
+import time
+__file = pathlib.Path(__file__).absolute()
+sys.path.append(str(__file.parent.parent.resolve()))
+
+from lib.class_exercise_properties import ExerciseProperties as cep
+import lib.helper_file as hf
+import lib.helper_import as hi
+import lib.helper_log as hl
+import lib.helper_runner as hr
+
+np = hi.lazy_import('numpy')
+
+logger = logging.getLogger(__file.stem)
+
+# step for each pipe, from the direction it is entered in to the direction it leaves in
+pipe_moves = {
+    ('|', (1, 0)): (1, 0), ('|', (-1, 0)): (-1, 0),
+    ('-', (0, 1)): (0, 1), ('-', (0, -1)): (0, -1),
+    ('L', (1, 0)): (0, 1), ('L', (0, -1)): (-1, 0),
+    ('J', (1, 0)): (0, -1), ('J', (0, 1)): (-1, 0),
+    ('7', (-1, 0)): (0, -1), ('7', (0, 1)): (1, 0),
+    ('F', (-1, 0)): (0, 1), ('F', (0, -1)): (1, 0),
+}
+
+
+def comb_loop(size: int, tooth_width: int, rng: 'np.random.Generator') -> 'np.ndarray':
+    '''
+    A size x size grid of stray pipes, holding a loop shaped like a comb:
+    teeth tooth_width wide hang from a bar along the top, with gaps as wide between them,
+    so the loop turns a corner every tooth_width or so pipes along the bottom.
+    '''
+    grid = rng.choice(np.frombuffer(b'.|-LJ7F', np.uint8), (size, size))
+    last = size - 1
+    # the top edge, and the bar of the comb below it
+    grid[0, 1:last] = grid[2, 1:last] = ord('-')
+    grid[0, 0], grid[0, last] = ord('F'), ord('7')
+    grid[1, 0] = grid[1, last] = ord('|')
+    grid[2, 0], grid[2, last] = ord('L'), ord('J')
+    # each tooth runs down from the bar and back up again, with the teeth joined by the bar
+    starts = np.arange(1, last - tooth_width, 2 * tooth_width)
+    for left in starts:
+        right = left + tooth_width - 1
+        grid[2, left], grid[2, right] = ord('7'), ord('F')
+        grid[3:last, left] = grid[3:last, right] = ord('|')
+        grid[last, left], grid[last, right] = ord('L'), ord('J')
+        grid[last, left + 1:right] = ord('-')
+    grid[0, size // 2] = ord('S')
+    return grid
+
+
+def count_by_scanning(grid: 'np.ndarray') -> int:
+    '''
+    How 10b counted enclosed tiles before tracing corners:
+    walk every pipe of the loop into a set, then cast a ray along every line of the grid.
+    '''
+    lines = [bytes(row).decode() for row in grid]
+    start_line = next(index for index, line in enumerate(lines) if 'S' in line)
+    start = (start_line, lines[start_line].index('S'))
+    # the comb's start is on the top edge, so always enters from the left and leaves to the right
+    pipes = {start}
+    position, move = (start[0], start[1] + 1), (0, 1)
+    while position != start:
+        pipes.add(position)
+        move = pipe_moves[(lines[position[0]][position[1]], move)]
+        position = (position[0] + move[0], position[1] + move[1])
+    lines[start[0]] = lines[start[0]].replace('S', '-')
+
+    count = 0
+    for line_index, line in enumerate(lines):
+        crossings = 0
+        last_corner = ''
+        for character_index, character in enumerate(line):
+            if (line_index, character_index) not in pipes:
+                count += crossings % 2
+            elif character == '|':
+                crossings += 1
+            elif character in 'JL7F':
+                if last_corner == '':
+                    last_corner = character
+                else:
+                    if (character in 'JL') != (last_corner in 'JL'):
+                        crossings += 1
+                    last_corner = ''
+    return count
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description='Compare ways of counting the tiles enclosed by day 10 loops on large generated grids')
+    parser.add_argument('-s', '--sizes', type=int, nargs='+', default=[1000, 10000], help='width of each grid')
+    parser.add_argument('-w', '--tooth-width', type=int, default=4, help='width of each tooth of the loop')
+    parser.add_argument('--scan-limit', type=int, default=2000,
+                        help='largest grid to also count by scanning every tile')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the grid generator')
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='include debug output; set multiple times to increase verbosity')
+    return parser.parse_args()
+
+
+def measure(name: str, function, *args) -> int:
+    start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - start
+    print(f'{name:<20} {elapsed:9.3f}s  {result}', flush=True)
+    return result
+
+
+def main(args):
+    solution = hr.load_solution(10, 'b')
+
+    def tracing(path: pathlib.Path) -> int:
+        # includes mapping the grid from the file, as a solution run from scratch would
+        return solution.main(cep(10, 'b', path.parent, input_file=path))
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            grid = comb_loop(size, args.tooth_width, np.random.default_rng(args.seed))
+            path = pathlib.Path(directory) / f'10-input-comb{size}.txt'
+            start = time.perf_counter()
+            with open(path, 'wb') as f:
+                for row in grid:
+                    f.write(row.tobytes() + b'\n')
+            logger.info('Generated a %d x %d grid in %.3fs', size, size, time.perf_counter() - start)
+
+            results = [measure(f'{size} tracing', tracing, path)]
+            if size <= args.scan_limit:
+                results.append(measure(f'{size} scanning', count_by_scanning, hf.load_grid(path)))
+            if any(result != results[0] for result in results):
+                raise Exception(f'Enclosed tiles differ between methods for {size} x {size}')
+            del grid
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    hl.setup_logging(args.verbose)
+    main(args)
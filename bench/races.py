@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+import argparse
+import logging
+import pathlib
+import random
+import sys
+import time
+__file = pathlib.Path(__file__).absolute()
+sys.path.append(str(__file.parent.parent.resolve()))
+
+import lib.helper_import as hi
+import lib.helper_log as hl
+
+np = hi.lazy_import('numpy')
+race = hi.import_sibling(__file.parent.parent / '6' / '6a.py', 'race')
+
+logger = logging.getLogger(__file.stem)
+
+# time limits of each size of race, with the largest bulk time for 64-bit races
+MAGNITUDES = {
+    '64-bit': race.BULK_TIME_LIMIT,
+    'bigint': 10**40,
+}
+
+
+def winning_holds_by_search(time_limit: int, record: int) -> int:
+    '''How day 6 counted winning holds before the closed form: a binary search either side of the halfway point'''
+    def midpoint(minimum: int, maximum: int) -> int:
+        return (maximum - minimum) // 2 + minimum
+
+    starting_midpoint = midpoint(1, time_limit)
+    lower = (1, starting_midpoint)
+    upper = (starting_midpoint, time_limit)
+    while lower[1] - lower[0] > 0:
+        time_test = midpoint(*lower)
+        if (time_limit - time_test) * time_test > record:
+            lower = (lower[0], time_test)
+        else:
+            lower = (time_test + 1, lower[1])
+    while upper[1] - upper[0] > 0:
+        time_test = midpoint(*upper)
+        if time_test == upper[0]:
+            time_test = upper[1]
+        if (time_limit - time_test) * time_test > record:
+            upper = (time_test, upper[1])
+        else:
+            upper = (upper[0], time_test - 1)
+    return upper[0] - lower[0] + 1
+
+
+def generate_races(count: int, time_limit: int, rng: random.Random) -> tuple[list[int], list[int]]:
+    '''Races that can all be won, with records anywhere from nothing to just short of the best distance'''
+    times = [rng.randrange(2, time_limit) for _ in range(count)]
+    records = [rng.randrange(time * time // 4) for time in times]
+    return times, records
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description='Compare ways of counting the winning holds of day 6 on many generated races')
+    parser.add_argument('-n', '--races', type=int, default=1_000_000, help='number of races to generate')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the race generator')
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='include debug output; set multiple times to increase verbosity')
+    return parser.parse_args()
+
+
+def measure(name: str, function, times: list[int], records: list[int]) -> list[int]:
+    start = time.perf_counter()
+    counts = function(times, records)
+    elapsed = time.perf_counter() - start
+    print(f'{name:<16} {elapsed:9.3f}s {len(times) / elapsed / 1e6:10.2f}', flush=True)
+    return counts
+
+
+def main(args):
+    def search(times: list[int], records: list[int]) -> list[int]:
+        return list(map(winning_holds_by_search, times, records))
+
+    def isqrt(times: list[int], records: list[int]) -> list[int]:
+        return list(map(race.winning_holds, times, records))
+
+    def bulk(times: list[int], records: list[int]) -> list[int]:
+        # includes converting to and from arrays, as a solution would
+        return race.winning_holds_bulk(np.array(times), np.array(records)).tolist()
+
+    print(f'{"":<16} {"time":>10} {"M races/s":>10}')
+    for magnitude, time_limit in MAGNITUDES.items():
+        times, records = generate_races(args.races, time_limit, random.Random(args.seed))
+        results = [measure(f'{magnitude} search', search, times, records),
+                   measure(f'{magnitude} isqrt', isqrt, times, records)]
+        if time_limit <= race.BULK_TIME_LIMIT:
+            results.append(measure(f'{magnitude} bulk', bulk, times, records))
+        if any(result != results[0] for result in results):
+            raise Exception(f'Counts differ between methods for {magnitude} races')
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    hl.setup_logging(args.verbose)
+    main(args)
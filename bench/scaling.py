@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import pathlib
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+__file = pathlib.Path(__file__).absolute()
+sys.path.append(str(__file.parent.parent.resolve()))
+
+import bench.generators as bg
+from lib.class_exercise_properties import ExerciseProperties as cep
+import lib.helper_cache as hk
+import lib.helper_import as hi
+import lib.helper_log as hl
+import lib.helper_runner as hr
+
+np = hi.lazy_import('numpy')
+
+logger = logging.getLogger(__file.stem)
+
+RESULTS_DIRECTORY = hr.ROOT_DIRECTORY / '.benchmarks'
+
+# candidate complexity curves, scaled to fit the measured times
+MODELS = {
+    'O(1)': lambda n: np.ones_like(n),
+    'O(log n)': lambda n: np.log(n),
+    'O(n)': lambda n: n,
+    'O(n log n)': lambda n: n * np.log(n),
+    'O(n^2)': lambda n: n ** 2,
+    'O(n^2 log n)': lambda n: n ** 2 * np.log(n),
+    'O(n^3)': lambda n: n ** 3,
+    'O(2^n)': lambda n: np.exp2(n),
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description='Time solutions against generated inputs of increasing size, and estimate how they scale')
+    parser.add_argument('-r', '--repeats', type=int, default=3,
+                        help='number of times to run each size (the fastest is reported)')
+    parser.add_argument('-s', '--sizes', type=int, nargs='+',
+                        help='input sizes to use instead of the defaults for each day')
+    parser.add_argument('-m', '--max-time', type=float, default=10,
+                        help='skip larger sizes once a solution takes longer than this many seconds')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the input generators')
+    parser.add_argument('-o', '--output', type=pathlib.Path,
+                        help='JSON file to save results to (defaults to .benchmarks/<commit>.json)')
+    parser.add_argument('-c', '--compare', type=pathlib.Path,
+                        help='JSON file of earlier results to compare against')
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='include debug output; set multiple times to increase verbosity')
+    parser.add_argument('solutions', nargs='*',
+                        help='days (e.g. "5") or days and parts (e.g. "5b") to time; defaults to all with generators')
+    return parser.parse_args()
+
+
+def write_input(directory: pathlib.Path, day: int, size: int, seed: int) -> pathlib.Path:
+    # named like a real input with a file suffix, so solutions find it as usual
+    path = directory / f'{day}-input-bench{size}.txt'
+    if not path.is_file():
+        path.write_text('\n'.join(bg.generate(day, size, seed)) + '\n')
+    return path
+
+
+def time_solution(day: int, part: str, directory: pathlib.Path, size: int, repeats: int) -> float:
+    props = cep(day, part, directory, file_suffix=f'-bench{size}')
+    timings = []
+    for _ in range(repeats):
+        # load afresh each time, so caches from previous runs do not flatter later ones
+        for path in directory.glob(f'*{hk.PARSED_SUFFIX}'):
+            path.unlink()
+        module = hr.load_solution(day, part)
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            module.main(props)
+            timings.append(time.perf_counter() - start)
+    logger.debug('%d%s at size %d: %r', day, part, size, timings)
+    return min(timings)
+
+
+def fit_complexity(sizes: list[int], times: list[float]) -> dict:
+    '''Slope of the log-log plot, and whichever model curve fits best relative to each time'''
+    n = np.array(sizes, float)
+    t = np.array(times)
+    exponent = np.polyfit(np.log(n), np.log(t), 1)[0]
+    residuals = {}
+    for name, model in MODELS.items():
+        with np.errstate(over='ignore', invalid='ignore'):
+            # weighting by 1/t makes every size count equally, rather than just the largest
+            curve = model(n) / t
+            scale = curve.sum() / (curve ** 2).sum()
+            residual = ((scale * curve - 1) ** 2).sum()
+        if np.isfinite(residual):
+            # exponential curves overflow for larger sizes
+            residuals[name] = float(residual)
+    return {'exponent': round(float(exponent), 2), 'model': min(residuals, key=residuals.get)}
+
+
+def git_commit() -> str:
+    result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=hr.ROOT_DIRECTORY,
+                            capture_output=True, text=True)
+    return result.stdout.strip() if result.returncode == 0 else 'unknown'
+
+
+def compare(results: dict, previous_path: pathlib.Path):
+    with open(previous_path) as f:
+        previous = json.load(f)
+    print(f'Compared with {previous["commit"]} (ratio of new time to old):')
+    for label, result in results.items():
+        if label not in previous['results']:
+            continue
+        previous_times = dict(zip(previous['results'][label]['sizes'], previous['results'][label]['times']))
+        ratios = [f'{size}: {time / previous_times[size]:.2f}x'
+                  for size, time in zip(result['sizes'], result['times']) if size in previous_times]
+        print(f'{label:>4}  {", ".join(ratios)}')
+
+
+def main(args):
+    selections = args.solutions or [str(day) for day in bg.GENERATORS]
+    solutions = [(day, part) for day, part in hr.find_solutions(selections) if day in bg.GENERATORS]
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        directory = pathlib.Path(directory)
+        for day, part in solutions:
+            label = f'{day}{part}'
+            sizes = args.sizes or bg.GENERATORS[day][1]
+            measured_sizes = []
+            times = []
+            for size in sizes:
+                try:
+                    write_input(directory, day, size, args.seed)
+                    elapsed = time_solution(day, part, directory, size, args.repeats)
+                except Exception as e:
+                    logger.debug('%s failed', label, exc_info=True)
+                    print(f'{label:>4} {size:>8} {type(e).__name__}: {e}')
+                    break
+                print(f'{label:>4} {size:>8} {elapsed:9.3f}s', flush=True)
+                measured_sizes.append(size)
+                times.append(elapsed)
+                if elapsed > args.max_time:
+                    break
+            result = {'sizes': measured_sizes, 'times': times}
+            if len(measured_sizes) > 1:
+                result.update(fit_complexity(measured_sizes, times))
+                print(f'{label:>4} grows as n^{result["exponent"]}, closest to {result["model"]}')
+            results[label] = result
+
+    commit = git_commit()
+    output_path = args.output if args.output is not None else RESULTS_DIRECTORY / f'{commit}.json'
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w') as f:
+        json.dump({'commit': commit, 'python': platform.python_version(), 'results': results}, f, indent=4)
+    print(f'Saved results to {output_path}')
+    if args.compare is not None:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    hl.setup_logging(args.verbose)
+    main(args)
@@ -0,0 +1,95 @@
+from collections import deque
+from collections.abc import Iterable
+from typing import Generic, Optional, TypeVar
+
+V = TypeVar('V')
+
+ALPHABET_SIZE = 256
+
+
+class AhoCorasick(Generic[V]):
+    '''
+    Finds occurrences of any of a set of patterns in a single forward scan over bytes, without slicing.
+    Failure links are folded into a complete transition table when built,
+    so scanning takes exactly one table lookup per byte.
+    '''
+    def __init__(self, patterns: dict[str, V]):
+        # trie of the patterns, then the failure link for each state
+        children: list[dict[int, int]] = [{}]
+        # (length, value) of each pattern ending at each state
+        outputs: list[list[tuple[int, V]]] = [[]]
+        for pattern, value in patterns.items():
+            state = 0
+            for byte in pattern.encode():
+                if byte not in children[state]:
+                    children[state][byte] = len(children)
+                    children.append({})
+                    outputs.append([])
+                state = children[state][byte]
+            outputs[state].append((len(pattern.encode()), value))
+
+        self.size = len(children)
+        # flat table: the state after reading byte b in state s is at (s << 8) | b
+        transitions = [0] * (self.size * ALPHABET_SIZE)
+        failures = [0] * self.size
+        # breadth first, so every failure link points at a state that is already complete
+        queue = deque()
+        for byte, child in children[0].items():
+            transitions[byte] = child
+            queue.append(child)
+        while queue:
+            state = queue.popleft()
+            failure = failures[state]
+            outputs[state].extend(outputs[failure])
+            base = state * ALPHABET_SIZE
+            failure_base = failure * ALPHABET_SIZE
+            transitions[base:base + ALPHABET_SIZE] = transitions[failure_base:failure_base + ALPHABET_SIZE]
+            for byte, child in children[state].items():
+                failures[child] = transitions[failure_base + byte]
+                transitions[base + byte] = child
+                queue.append(child)
+        self.transitions = transitions
+        # the match starting earliest and latest of those ending at each state, if any
+        self.longest: list[Optional[tuple[int, V]]] = [max(output, key=_length) if output else None
+                                                       for output in outputs]
+        self.shortest: list[Optional[tuple[int, V]]] = [min(output, key=_length) if output else None
+                                                        for output in outputs]
+        self.outputs = [tuple(output) for output in outputs]
+
+    def scan(self, data: bytes) -> Iterable[tuple[int, V]]:
+        '''The start and value of every match, in order of where they end'''
+        transitions = self.transitions
+        outputs = self.outputs
+        state = 0
+        for end, byte in enumerate(data, 1):
+            state = transitions[state << 8 | byte]
+            for length, value in outputs[state]:
+                yield end - length, value
+
+    def first_and_last(self, data: bytes) -> tuple[Optional[V], Optional[V]]:
+        '''Values of the matches starting first and last (None if there are no matches)'''
+        transitions = self.transitions
+        longest = self.longest
+        shortest = self.shortest
+        state = 0
+        first = last = None
+        first_start = len(data)
+        last_start = -1
+        for end, byte in enumerate(data, 1):
+            state = transitions[state << 8 | byte]
+            match = longest[state]
+            if match is None:
+                continue
+            length, value = match
+            if end - length < first_start:
+                first_start = end - length
+                first = value
+            length, value = shortest[state]
+            if end - length > last_start:
+                last_start = end - length
+                last = value
+        return first, last
+
+
+def _length(match: tuple[int, object]) -> int:
+    return match[0]
@@ -11,3 +11,6 @@ class ExerciseProperties:
     use_examples: bool = False
     file_suffix: Optional[str] = None
     debug: bool = False
+    use_stdin: bool = False
+    # overrides the input file otherwise found from the properties above
+    input_file: Optional[pathlib.Path] = None
@@ -0,0 +1,132 @@
+from collections.abc import Iterable
+from functools import cached_property
+
+from lib.class_text_coordinate import TextCoordinate as Coordinate, interned
+from lib.class_text_coordinate_limits import TextCoordinateLimits as Limits
+import lib.helper_direction as hd
+import lib.helper_import as hi
+
+np = hi.lazy_import('numpy')
+
+# never a valid cell, so stepping off the side of a row always lands on one of these
+SEPARATOR = ord('\n')
+
+
+class Grid:
+    '''
+    Alternative to lib.class_map_base.Map, holding every character in one flat buffer.
+    Cells are addressed by integer index (line * stride + character), with a separator after each row,
+    so neighbours are found by adding offsets rather than by building coordinates.
+    '''
+    def __init__(self, cells: 'np.ndarray'):
+        depth, width = cells.shape
+        self.depth = depth
+        self.width = width
+        self.stride = width + 1
+        self.size = depth * self.stride
+        self.buffer = bytearray(self.size)
+        # views onto the buffer: changes made through any of these are shared
+        self.flat = np.frombuffer(self.buffer, np.uint8)
+        rows = self.flat.reshape(depth, self.stride)
+        rows[:, :width] = cells
+        rows[:, width] = SEPARATOR
+        self.cells = rows[:, :width]
+        self.offsets = {
+            hd.UP: -self.stride,
+            hd.DOWN: self.stride,
+            hd.LEFT: -1,
+            hd.RIGHT: 1,
+        }
+        self.orthogonal_offsets = tuple(self.offsets.values())
+        self.diagonal_offsets = (
+            -self.stride - 1, -self.stride, -self.stride + 1,
+            -1, 1,
+            self.stride - 1, self.stride, self.stride + 1,
+        )
+
+    @classmethod
+    def from_lines(cls, lines: list[str]) -> 'Grid':
+        width = len(lines[0])
+        for line in lines:
+            if len(line) != width:
+                raise Exception(f'Lines are not all {width} characters wide')
+        data = ''.join(lines).encode()
+        return cls(np.frombuffer(data, np.uint8).reshape(len(lines), width))
+
+    def copy(self) -> 'Grid':
+        return Grid(self.cells)
+
+    def index(self, line: int, character: int) -> int:
+        return line * self.stride + character
+
+    def index_of(self, coord: Coordinate) -> int:
+        return coord.line * self.stride + coord.character
+
+    def coordinate(self, index: int) -> Coordinate:
+        return interned(*divmod(index, self.stride))
+
+    def __contains__(self, value) -> bool:
+        if isinstance(value, Coordinate):
+            return value in self.limits
+        return 0 <= value < self.size and self.buffer[value] != SEPARATOR
+
+    def __getitem__(self, index: int) -> str:
+        return chr(self.buffer[index])
+
+    def __setitem__(self, index: int, character: str):
+        self.buffer[index] = ord(character)
+
+    def lookup(self, coord: Coordinate) -> str:
+        return chr(self.buffer[coord.line * self.stride + coord.character])
+
+    def step(self, index: int, direction: hd.Direction, distance: int = 1) -> int:
+        '''The result may be out of bounds: check with `in`'''
+        return index + self.offsets[direction] * distance
+
+    def neighbours(self, index: int, diagonal: bool = True) -> Iterable[int]:
+        buffer = self.buffer
+        size = self.size
+        for offset in self.diagonal_offsets if diagonal else self.orthogonal_offsets:
+            neighbour = index + offset
+            if 0 <= neighbour < size and buffer[neighbour] != SEPARATOR:
+                yield neighbour
+
+    def find(self, character: str) -> int:
+        index = self.buffer.find(ord(character))
+        if index < 0:
+            raise Exception(f'Character "{character}" not found in grid')
+        return index
+
+    def find_all(self, character: str) -> 'np.ndarray':
+        '''Indices of every cell holding the character'''
+        return np.flatnonzero(self.flat == ord(character))
+
+    def mask(self, character: str) -> 'np.ndarray':
+        '''(depth, width) array that is True wherever the character is'''
+        return self.cells == ord(character)
+
+    @cached_property
+    def bounds_mask(self) -> 'np.ndarray':
+        '''Flat array that is True for every index that is a cell rather than a separator'''
+        mask = np.ones(self.size, bool)
+        mask[self.width::self.stride] = False
+        return mask
+
+    def row(self, line: int) -> str:
+        start = line * self.stride
+        return self.buffer[start:start + self.width].decode()
+
+    def column(self, character: int) -> str:
+        return self.buffer[character::self.stride].decode()
+
+    @cached_property
+    def limits(self) -> Limits:
+        return Limits(self.depth, self.width)
+
+    @property
+    def lines(self) -> tuple[str]:
+        '''For code still using helper_coord.lookup_in or Map'''
+        return tuple(self.row(line) for line in range(self.depth))
+
+    def visualise(self) -> str:
+        return self.buffer[:-1].decode()
@@ -0,0 +1,112 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Optional
+
+from lib.class_limits import Limits
+
+
+@dataclass(frozen=True)
+class IntervalMap:
+    '''
+    Piecewise shift of the integers: values from starts[i] up to (but excluding) starts[i + 1]
+    have offsets[i] added, and values before the first start are unchanged.
+    The last piece runs on forever, and neighbouring pieces never share an offset.
+    '''
+    starts: tuple[int, ...] = ()
+    offsets: tuple[int, ...] = ()
+
+    def __post_init__(self):
+        assert len(self.starts) == len(self.offsets)
+        assert all(left < right for left, right in zip(self.starts, self.starts[1:]))
+
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[tuple[Limits, int]]) -> 'IntervalMap':
+        '''Map shifting each range of values by its offset, and leaving every other value unchanged'''
+        starts = []
+        offsets = []
+        end = None
+        for limits, offset in sorted(ranges):
+            if limits.length == 0:
+                continue
+            if end is not None and limits.min < end:
+                raise Exception(f'Overlapping ranges: {limits} starts before {end}')
+            if end is not None and limits.min > end:
+                # values between the ranges are unchanged
+                starts.append(end)
+                offsets.append(0)
+            starts.append(limits.min)
+            offsets.append(offset)
+            end = limits.max
+        if end is not None:
+            starts.append(end)
+            offsets.append(0)
+        return _normalised(starts, offsets)
+
+    def offset_at(self, value: int) -> int:
+        index = bisect_right(self.starts, value) - 1
+        return self.offsets[index] if index >= 0 else 0
+
+    def __call__(self, value: int) -> int:
+        return value + self.offset_at(value)
+
+    def pieces(self) -> Iterator[tuple[Optional[int], Optional[int], int]]:
+        '''(start, end, offset) of every piece in order, with None for the ends that are unbounded'''
+        ends = self.starts[1:] + (None,)
+        if not self.starts:
+            yield None, None, 0
+            return
+        yield None, self.starts[0], 0
+        yield from zip(self.starts, ends, self.offsets)
+
+    def map_limits(self, ranges: Iterable[Limits]) -> Iterator[Limits]:
+        '''
+        Image of each range, one range for each piece it overlaps.
+        The ranges are swept in order of where they start,
+        so the piece each starts in is found by moving forward from the last.
+        '''
+        starts = self.starts
+        index = -1
+        for limits in sorted(ranges):
+            if limits.length == 0:
+                continue
+            while index + 1 < len(starts) and starts[index + 1] <= limits.min:
+                index += 1
+            low = limits.min
+            piece = index
+            while low < limits.max:
+                high = limits.max if piece + 1 == len(starts) else min(limits.max, starts[piece + 1])
+                offset = self.offsets[piece] if piece >= 0 else 0
+                yield Limits(low + offset, high + offset)
+                low = high
+                piece += 1
+
+
+def compose(first: IntervalMap, second: IntervalMap) -> IntervalMap:
+    '''Single map taking each value through first and then second'''
+    starts = []
+    offsets = []
+    for start, end, offset in first.pieces():
+        # the pieces of second that this piece's values land in, as values before the shift
+        low = 0 if start is None else bisect_right(second.starts, start + offset)
+        high = len(second.starts) if end is None else bisect_left(second.starts, end + offset)
+        if start is not None:
+            starts.append(start)
+            offsets.append(offset + second.offset_at(start + offset))
+        for index in range(low, high):
+            starts.append(second.starts[index] - offset)
+            offsets.append(offset + second.offsets[index])
+    return _normalised(starts, offsets)
+
+
+def _normalised(starts: list[int], offsets: list[int]) -> IntervalMap:
+    '''Map without any piece that has the same offset as the one before'''
+    kept_starts = []
+    kept_offsets = []
+    previous = 0
+    for start, offset in zip(starts, offsets):
+        if offset != previous:
+            kept_starts.append(start)
+            kept_offsets.append(offset)
+            previous = offset
+    return IntervalMap(tuple(kept_starts), tuple(kept_offsets))
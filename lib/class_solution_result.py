@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+import pathlib
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class SolutionResult:
+    day: int
+    part: str
+    answer: Optional[str] = None
+    expected: Optional[str] = None
+    wall_time: float = 0 # seconds
+    peak_memory: int = 0 # bytes
+    error: Optional[str] = None
+    output: str = ''
+    cached: bool = False # answer came from an earlier run
+    input_file: Optional[pathlib.Path] = None # given explicitly, rather than found for the day
+
+    @property
+    def label(self) -> str:
+        return f'{self.day}{self.part}'
+
+    @property
+    def checked(self) -> bool:
+        return self.expected is not None
+
+    @property
+    def passed(self) -> bool:
+        if self.error is not None:
+            return False
+        return not self.checked or self.answer == self.expected
+
+    @property
+    def status(self) -> str:
+        if self.error is not None:
+            return 'ERROR'
+        if not self.checked:
+            return 'UNCHECKED'
+        return 'OK' if self.passed else 'FAIL'
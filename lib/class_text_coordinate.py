@@ -1,7 +1,10 @@
 from dataclasses import dataclass
 
+# every coordinate within a bounded grid, shared rather than allocated on each move: see intern_within
+_interned: tuple[tuple['TextCoordinate', ...], ...] = ()
 
-@dataclass(frozen=True, order=True)
+
+@dataclass(frozen=True, order=True, slots=True)
 class TextCoordinate:
     line: int
     character: int
@@ -27,13 +30,36 @@ class TextCoordinate:
         return NotImplemented
 
     def up(self, distance: int = 1) -> 'TextCoordinate':
-        return TextCoordinate(self.line - distance, self.character)
+        return interned(self.line - distance, self.character)
 
     def down(self, distance: int = 1) -> 'TextCoordinate':
-        return TextCoordinate(self.line + distance, self.character)
+        return interned(self.line + distance, self.character)
 
     def left(self, distance: int = 1) -> 'TextCoordinate':
-        return TextCoordinate(self.line, self.character - distance)
+        return interned(self.line, self.character - distance)
 
     def right(self, distance: int = 1) -> 'TextCoordinate':
-        return TextCoordinate(self.line, self.character + distance)
+        return interned(self.line, self.character + distance)
+
+
+def interned(line: int, character: int) -> TextCoordinate:
+    '''The shared instance where one exists, otherwise a new coordinate'''
+    if 0 <= line < len(_interned):
+        row = _interned[line]
+        if 0 <= character < len(row):
+            return row[character]
+    return TextCoordinate(line, character)
+
+
+def intern_within(max_line: int, max_character: int):
+    '''Build every coordinate up front (replacing any previous grid's), for solutions that revisit cells many times'''
+    global _interned
+    _interned = tuple(
+        tuple(TextCoordinate(line, character) for character in range(max_character))
+        for line in range(max_line))
+
+
+def clear_interned():
+    '''Drop the coordinates built by intern_within, once nothing is walking that grid any more'''
+    global _interned
+    _interned = ()
@@ -1,10 +1,41 @@
 import argparse
+import pathlib
 
 
 def parse_args():
     parser = argparse.ArgumentParser()
     parser.add_argument('-e', '--examples', action='store_true', help='use examples as input')
+    parser.add_argument('--stdin', action='store_true',
+                        help='read input from standard input (only supported by some solutions)')
     parser.add_argument('-v', '--verbose', action='count', default=0,
                         help='include debug output; set multiple times to increase verbosity')
+    # both set args.profile, with '-' meaning the statistics are printed rather than saved
+    parser.add_argument('--profile', action='store_const', const='-',
+                        help='profile the solution, printing the functions with the most cumulative time')
+    parser.add_argument('--profile-out', dest='profile', metavar='FILE',
+                        help='profile the solution, saving full statistics to the file')
+    parser.add_argument('--timings', metavar='FILE',
+                        help='save the time taken by each timed section of the solution as JSON')
     parser.add_argument('file_suffix', nargs='?', help='additional file suffix to look for debug output')
     return parser.parse_args()
+
+
+def parse_runner_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-e', '--examples', action='store_true', help='use examples as input')
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='include debug output; set multiple times to increase verbosity')
+    parser.add_argument('-s', '--file-suffix', help='additional file suffix to look for input')
+    parser.add_argument('-a', '--answers', type=pathlib.Path,
+                        help='JSON file of expected answers (defaults to validate.json)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of worker processes to spread solutions across')
+    parser.add_argument('-t', '--timeout', type=float,
+                        help='time limit in seconds for each solution')
+    parser.add_argument('-i', '--inputs', metavar='GLOB_OR_DIRECTORY',
+                        help='run each solution against every matching input file (or every text file in a directory)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='run every solution, rather than reusing answers from earlier runs')
+    parser.add_argument('solutions', nargs='*',
+                        help='days (e.g. "5") or days and parts (e.g. "5b") to run; defaults to all')
+    return parser.parse_args()
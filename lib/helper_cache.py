@@ -0,0 +1,140 @@
+import ast
+from collections.abc import Callable
+from functools import cache
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import pickle
+import sys
+import tempfile
+from typing import Optional, TypeVar
+
+from lib.class_exercise_properties import ExerciseProperties as cep
+import lib.helper_file as hf
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIRECTORY = pathlib.Path(__file__).absolute().parent.parent
+ANSWER_CACHE_DIRECTORY = ROOT_DIRECTORY / '.cache' / 'answers'
+PARSED_SUFFIX = '.pickle'
+T = TypeVar('T')
+
+
+def content_hash(path: pathlib.Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+@cache
+def file_hash(path: pathlib.Path) -> str:
+    '''Only hashes each file once per process: use content_hash for files that may change in the meantime'''
+    return content_hash(path)
+
+
+@cache
+def lib_imports(path: pathlib.Path) -> frozenset[pathlib.Path]:
+    '''Every lib module the file imports, directly or through other lib modules'''
+    tree = ast.parse(path.read_bytes(), str(path))
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module is not None:
+            names.add(node.module)
+    imports = set()
+    for name in names:
+        if name.split('.', 1)[0] != 'lib':
+            continue
+        module_path = ROOT_DIRECTORY.joinpath(*name.split('.')).with_suffix('.py')
+        if module_path.is_file() and module_path not in imports:
+            imports.add(module_path)
+            imports.update(lib_imports(module_path))
+    return frozenset(imports)
+
+
+def day_modules(script_path: pathlib.Path) -> list[pathlib.Path]:
+    '''Modules shared between the parts of a day (anything alongside the script not named after a solution)'''
+    return sorted(path for path in script_path.parent.glob('*.py') if not path.name[0].isdigit())
+
+
+def source_hash(path: pathlib.Path) -> str:
+    '''Changes whenever the file or any lib module it uses does'''
+    parts = [f'{path.name} {file_hash(path)}']
+    for module_path in sorted(lib_imports(path)):
+        parts.append(f'{module_path.relative_to(ROOT_DIRECTORY)} {file_hash(module_path)}')
+    return hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+
+
+def answer_key(script_path: pathlib.Path, properties: cep) -> str:
+    '''
+    Changes whenever anything that could change the answer does:
+    the input, the script, any lib module it uses, or whether it is solving an example
+    '''
+    input_path = hf.find_input_file(properties)
+    parts = [
+        f'script {source_hash(script_path)}',
+        f'input {file_hash(input_path)}',
+        f'examples {properties.use_examples}',
+    ]
+    for module_path in day_modules(script_path):
+        parts.append(f'{module_path.name} {source_hash(module_path)}')
+    logger.log(2, 'Answer key parts for %s: %r', script_path.name, parts)
+    return hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+
+
+def load_answer(key: str, directory: pathlib.Path = ANSWER_CACHE_DIRECTORY) -> Optional[str]:
+    path = directory / f'{key}.json'
+    if not path.is_file():
+        return None
+    with open(path) as f:
+        return json.load(f)['answer']
+
+
+def save_answer(key: str, answer: str, label: str, directory: pathlib.Path = ANSWER_CACHE_DIRECTORY) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    # one file per answer, so parallel workers never write to the same file
+    with open(directory / f'{key}.json', 'w') as f:
+        json.dump({'solution': label, 'answer': answer}, f)
+
+
+def parsed_path(input_path: pathlib.Path, parse: Callable) -> pathlib.Path:
+    return input_path.with_name(f'{input_path.stem}.{parse.__name__}{PARSED_SUFFIX}')
+
+
+def load_parsed(properties: cep, parse: Callable[[list[str]], T]) -> T:
+    '''
+    parse(lines) for the input file, reusing the result saved alongside the input by any earlier run.
+    The saved result is used while the input file is unmodified (same mtime, or failing that the same hash)
+    and the module defining parse (with the lib modules it uses) is unchanged.
+    '''
+    if properties.use_stdin:
+        return parse(list(hf.iter_lines(properties)))
+    input_path = hf.find_input_file(properties)
+    path = parsed_path(input_path, parse)
+    parser = source_hash(pathlib.Path(sys.modules[parse.__module__].__file__))
+    modified = input_path.stat().st_mtime_ns
+    if path.is_file():
+        with open(path, 'rb') as f:
+            # the header is read on its own, so a stale result is never unpickled
+            header = pickle.load(f)
+            if header['parser'] == parser and (
+                    header['modified'] == modified or header['hash'] == content_hash(input_path)):
+                logger.debug('Using parsed input from %s', path)
+                result = pickle.load(f)
+                if header['modified'] != modified:
+                    # touched but unchanged: save the new mtime so the input need not be hashed next time
+                    _save_parsed(path, {**header, 'modified': modified}, result)
+                return result
+    logger.debug('Parsing %s', input_path)
+    result = parse(hf.load_lines(input_path))
+    _save_parsed(path, {'parser': parser, 'modified': modified, 'hash': content_hash(input_path)}, result)
+    return result
+
+
+def _save_parsed(path: pathlib.Path, header: dict, result) -> None:
+    # replace the file in one step, so parts running in parallel never see half of one
+    with tempfile.NamedTemporaryFile('wb', dir=path.parent, suffix=PARSED_SUFFIX, delete=False) as f:
+        pickle.dump(header, f)
+        pickle.dump(result, f, pickle.HIGHEST_PROTOCOL)
+    os.replace(f.name, path)
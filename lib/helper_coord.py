@@ -1,11 +1,19 @@
 from collections.abc import Iterable
+from functools import cache, cached_property
 import logging
 
 from lib.class_text_coordinate_limits import TextCoordinateLimits as Limits
-from lib.class_text_coordinate import TextCoordinate as Coordinate
+from lib.class_text_coordinate import TextCoordinate as Coordinate, interned
+import lib.helper_import as hi
+
+np = hi.lazy_import('numpy')
 
 logger = logging.getLogger(__name__)
 
+# (line, character) offsets, in the same order as gen_neighbours
+DIAGONAL_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+ORTHOGONAL_OFFSETS = ((-1, 0), (0, -1), (0, 1), (1, 0))
+
 
 def lookup_in(coord: Coordinate, grid: list[str] | tuple[str]) -> str:
     return grid[coord.line][coord.character]
@@ -23,14 +31,91 @@ def valid_neighbours(
 
 def gen_neighbours(coord: Coordinate, diagonal: bool = True) -> Iterable[Coordinate]:
     if diagonal:
-        yield Coordinate(coord.line - 1, coord.character - 1)
-    yield Coordinate(coord.line - 1, coord.character)
+        yield interned(coord.line - 1, coord.character - 1)
+    yield interned(coord.line - 1, coord.character)
     if diagonal:
-        yield Coordinate(coord.line - 1, coord.character + 1)
-    yield Coordinate(coord.line, coord.character - 1)
-    yield Coordinate(coord.line, coord.character + 1)
+        yield interned(coord.line - 1, coord.character + 1)
+    yield interned(coord.line, coord.character - 1)
+    yield interned(coord.line, coord.character + 1)
     if diagonal:
-        yield Coordinate(coord.line + 1, coord.character - 1)
-    yield Coordinate(coord.line + 1, coord.character)
+        yield interned(coord.line + 1, coord.character - 1)
+    yield interned(coord.line + 1, coord.character)
     if diagonal:
-        yield Coordinate(coord.line + 1, coord.character + 1)
+        yield interned(coord.line + 1, coord.character + 1)
+
+
+def _shifted(offset: int, length: int) -> tuple[slice, slice]:
+    '''Source and destination slices moving every element of an axis by the offset, dropping any that fall off'''
+    return (slice(max(0, -offset), length - max(0, offset)),
+            slice(max(0, offset), length - max(0, -offset)))
+
+
+class NeighbourTable:
+    '''
+    The neighbours of every cell in a grid of a given shape, worked out once up front.
+    Cells are numbered line * width + character, and neighbours beyond the edges of the grid are left out.
+    '''
+    def __init__(self, depth: int, width: int, diagonal: bool = True):
+        self.depth = depth
+        self.width = width
+        self.size = depth * width
+        self.offsets = DIAGONAL_OFFSETS if diagonal else ORTHOGONAL_OFFSETS
+        lines, characters = np.divmod(np.arange(self.size), width)
+        # a column per offset, holding -1 wherever that neighbour is off the grid
+        self.padded = np.full((self.size, len(self.offsets)), -1, np.intp)
+        for column, (line_offset, character_offset) in enumerate(self.offsets):
+            neighbour_lines = lines + line_offset
+            neighbour_characters = characters + character_offset
+            valid = ((neighbour_lines >= 0) & (neighbour_lines < depth)
+                     & (neighbour_characters >= 0) & (neighbour_characters < width))
+            self.padded[valid, column] = neighbour_lines[valid] * width + neighbour_characters[valid]
+        # compressed rows: the neighbours of cell i are indices[starts[i]:starts[i + 1]]
+        present = self.padded >= 0
+        self.starts = np.zeros(self.size + 1, np.intp)
+        np.cumsum(present.sum(axis=1), out=self.starts[1:])
+        self.indices = self.padded[present]
+
+    def index(self, coord: Coordinate) -> int:
+        return coord.line * self.width + coord.character
+
+    def coordinate(self, index: int) -> Coordinate:
+        return interned(*divmod(index, self.width))
+
+    @cached_property
+    def neighbours(self) -> list[tuple[int, ...]]:
+        '''Neighbour indices of each cell, as tuples that can be iterated over without allocating'''
+        indices = self.indices.tolist()
+        starts = self.starts.tolist()
+        return [tuple(indices[starts[cell]:starts[cell + 1]]) for cell in range(self.size)]
+
+    @cached_property
+    def _neighbour_coordinates(self) -> list[tuple[Coordinate, ...]]:
+        coordinates = [self.coordinate(cell) for cell in range(self.size)]
+        return [tuple(coordinates[neighbour] for neighbour in neighbours) for neighbours in self.neighbours]
+
+    def around(self, coord: Coordinate) -> tuple[Coordinate, ...]:
+        '''Same as valid_neighbours, but only for coordinates within the grid'''
+        # outside the grid, the index would silently land on some other cell (or wrap from the end)
+        if not (0 <= coord.line < self.depth and 0 <= coord.character < self.width):
+            raise Exception(f'Coordinate {coord} is outside the {self.depth} x {self.width} grid')
+        return self._neighbour_coordinates[coord.line * self.width + coord.character]
+
+    def expand(self, frontier: 'np.ndarray') -> 'np.ndarray':
+        '''Sorted indices of every cell next to any of the frontier's cells'''
+        reached = self.padded[frontier].ravel()
+        return np.unique(reached[reached >= 0])
+
+    def expand_mask(self, mask: 'np.ndarray') -> 'np.ndarray':
+        '''(depth, width) mask of every cell next to any cell set in the given mask'''
+        expanded = np.zeros_like(mask)
+        for line_offset, character_offset in self.offsets:
+            source_lines, destination_lines = _shifted(line_offset, self.depth)
+            source_characters, destination_characters = _shifted(character_offset, self.width)
+            expanded[destination_lines, destination_characters] |= mask[source_lines, source_characters]
+        return expanded
+
+
+@cache
+def neighbour_table(depth: int, width: int, diagonal: bool = True) -> NeighbourTable:
+    '''Shared between every caller working on a grid of the same shape'''
+    return NeighbourTable(depth, width, diagonal)
@@ -1,18 +1,132 @@
 import argparse
+from collections.abc import Iterable
+import contextlib
+import glob
 import logging
+import mmap
 import pathlib
+import sys
 
 from lib.class_exercise_properties import ExerciseProperties as cep
+import lib.helper_import as hi
+
+np = hi.lazy_import('numpy')
 
 logger = logging.getLogger(__name__)
 
+NEWLINE = ord('\n')
+CARRIAGE_RETURN = ord('\r')
+CHUNK_SIZE = 2**24
+
 
 def load_lines(file_path: str) -> list[str]:
     with open(file_path) as f:
         return [line.strip() for line in f.readlines()]
 
 
+def iter_lines(properties: cep) -> Iterable[str]:
+    '''Lazily read lines from the input file (or standard input), so only one line is held at a time'''
+    if properties.use_stdin:
+        logger.debug('Using standard input')
+        for line in sys.stdin:
+            yield line.strip()
+        return
+    with open(find_input_file(properties)) as f:
+        for line in f:
+            yield line.strip()
+
+
+def iter_chunks(properties: cep, chunk_size: int = CHUNK_SIZE) -> Iterable[bytes]:
+    '''
+    Read the input file (or standard input) roughly chunk_size bytes at a time, always ending on a whole line,
+    so inputs of any size can be processed in bulk using bounded memory
+    '''
+    with contextlib.ExitStack() as stack:
+        if properties.use_stdin:
+            logger.debug('Using standard input')
+            stream = sys.stdin.buffer
+        else:
+            stream = stack.enter_context(open(find_input_file(properties), 'rb'))
+        remainder = b''
+        while block := stream.read(chunk_size):
+            block = remainder + block
+            end = block.rfind(b'\n') + 1
+            if end == 0:
+                # no whole line yet
+                remainder = block
+                continue
+            yield block[:end]
+            remainder = block[end:]
+        if remainder:
+            yield remainder
+
+
+def load_buffer(file_path: str) -> mmap.mmap | bytes:
+    '''Map the file into memory: pages are only read when used, and nothing is copied'''
+    with open(file_path, 'rb') as f:
+        if pathlib.Path(file_path).stat().st_size == 0:
+            # empty files cannot be mapped
+            return b''
+        # the mapping stays valid after the file is closed
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def iter_buffer_chunks(buffer: mmap.mmap | bytes, chunk_size: int = CHUNK_SIZE) -> Iterable[memoryview]:
+    '''Slices of the buffer of at least chunk_size bytes (bar the last), always ending on a whole line'''
+    view = memoryview(buffer)
+    start = 0
+    size = len(buffer)
+    while start < size:
+        end = buffer.find(b'\n', start + chunk_size - 1) if start + chunk_size < size else -1
+        end = size if end < 0 else end + 1
+        yield view[start:end]
+        start = end
+
+
+def iter_buffer_lines(buffer: mmap.mmap | bytes) -> Iterable[memoryview]:
+    '''Slices of the buffer for each line, without line terminators'''
+    view = memoryview(buffer)
+    start = 0
+    size = len(buffer)
+    while start < size:
+        end = buffer.find(b'\n', start)
+        if end < 0:
+            end = size
+        line_end = end
+        if line_end > start and buffer[line_end - 1] == CARRIAGE_RETURN:
+            line_end -= 1
+        yield view[start:line_end]
+        start = end + 1
+
+
+def load_grid(file_path: str) -> 'np.ndarray':
+    '''
+    A read-only (depth, width) uint8 array viewing the mapped file directly.
+    Every line must be the same width; line terminators are skipped over using the row stride.
+    '''
+    buffer = load_buffer(file_path)
+    width = buffer.find(b'\n')
+    if width < 0:
+        # single line without a terminator
+        return np.frombuffer(buffer, np.uint8).reshape(1, -1)
+    stride = width + 1
+    if width > 0 and buffer[width - 1] == CARRIAGE_RETURN:
+        width -= 1
+    # a trailing terminator is optional, as are blank lines at the end of the file
+    content_end = len(buffer)
+    while content_end > 0 and buffer[content_end - 1] in (NEWLINE, CARRIAGE_RETURN):
+        content_end -= 1
+    depth = (content_end + stride - 1) // stride
+    terminators = np.ndarray((depth - 1,), np.uint8, buffer=buffer, offset=stride - 1, strides=(stride,))
+    if depth * stride - (stride - width) != content_end or not (terminators == NEWLINE).all():
+        raise Exception(f'Lines in {file_path} are not all {width} characters wide')
+    return np.ndarray((depth, width), np.uint8, buffer=buffer, strides=(stride, 1))
+
+
 def find_input_file(properties: cep) -> pathlib.Path:
+    if properties.input_file is not None:
+        logger.debug('Using given input file: %s', properties.input_file)
+        return properties.input_file
     for include_exercise in [True, False]:
         path = properties.parent_directory / determine_name(properties, include_exercise)
         if path.is_file():
@@ -22,6 +136,20 @@ def find_input_file(properties: cep) -> pathlib.Path:
         f'No input files found at expected paths for {properties.day}{properties.exercise}')
 
 
+def find_input_files(pattern: str) -> list[pathlib.Path]:
+    '''Every file matching a glob pattern, or every text file in a directory'''
+    path = pathlib.Path(pattern)
+    if path.is_dir():
+        paths = path.glob('*.txt')
+    else:
+        paths = map(pathlib.Path, glob.glob(pattern, recursive=True))
+    files = sorted(path.resolve() for path in paths if path.is_file())
+    if not files:
+        raise Exception(f'No input files found matching {pattern}')
+    logger.debug('Found %d input files matching %s', len(files), pattern)
+    return files
+
+
 def determine_name(properties: cep, include_exercise=True) -> str:
     parts = [str(properties.day)]
     if include_exercise:
@@ -42,5 +170,6 @@ def parse_name(file_path_str: str, args: argparse.Namespace) -> cep:
     file_path = pathlib.Path(file_path_str).resolve()
     file_name = file_path.stem.split('-', 1)[0]
     if args is not None:
-        return cep(int(file_name[:-1]), file_name[-1], file_path.parent, args.examples, args.file_suffix, args.verbose)
+        return cep(int(file_name[:-1]), file_name[-1], file_path.parent, args.examples, args.file_suffix, args.verbose,
+                   getattr(args, 'stdin', False))
     return cep(int(file_name[:-1]), file_name[-1], file_path.parent)
@@ -0,0 +1,44 @@
+import importlib
+import importlib.util
+import logging
+import os
+import pathlib
+import sys
+from types import ModuleType
+
+logger = logging.getLogger(__name__)
+
+# set to any non-empty value to import everything up front (e.g. to compare start-up times)
+EAGER_ENVIRONMENT_VARIABLE = 'AOC_EAGER_IMPORTS'
+
+
+def lazy_import(name: str) -> ModuleType:
+    '''Defer loading a module until one of its attributes is first accessed'''
+    if name in sys.modules:
+        return sys.modules[name]
+    if os.environ.get(EAGER_ENVIRONMENT_VARIABLE):
+        return importlib.import_module(name)
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f'No module named {name!r}', name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    logger.debug('Deferred import of %s', name)
+    return module
+
+
+def is_loaded(module: ModuleType) -> bool:
+    # LazyLoader swaps the module class back to ModuleType once the module has really been executed
+    # note type() must be used here: any attribute access on a deferred module would load it
+    return type(module) is ModuleType
+
+
+def import_sibling(path: pathlib.Path, name: str) -> ModuleType:
+    '''
+    Import a module from the same directory as the given file.
+    Each day directory is a package, but one named such that it cannot appear in an import statement.
+    '''
+    return importlib.import_module(f'{path.parent.name}.{name}')
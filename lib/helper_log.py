@@ -1,8 +1,23 @@
+import contextlib
+import cProfile
+import json
 import logging
+import pstats
+import sys
+import time
+from typing import Optional
 
 EXTRA_DETAIL = 8
 EXTRA_NOISY = 2
 
+# profile "file" meaning the statistics should be printed rather than saved
+PROFILE_TO_STDERR = '-'
+PROFILE_LINES = 30
+
+logger = logging.getLogger(__name__)
+
+_timings: dict[str, float] = {}
+
 
 def setup_logging(verbosity_level=0):
     if verbosity_level == 1:
@@ -16,3 +31,46 @@ def setup_logging(verbosity_level=0):
         logging.basicConfig(level=EXTRA_NOISY)
     else:
         logging.basicConfig(level=logging.INFO)
+
+
+@contextlib.contextmanager
+def timed(section: str):
+    '''Time a phase of a solution (e.g. parse, build, solve): repeated sections are added together'''
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        _timings[section] = _timings.get(section, 0) + elapsed
+        logger.debug('Section %s took %.3fs', section, elapsed)
+
+
+def timings() -> dict[str, float]:
+    return dict(_timings)
+
+
+def reset_timings():
+    _timings.clear()
+
+
+@contextlib.contextmanager
+def reporting(profile_path: Optional[str] = None, timings_path: Optional[str] = None):
+    '''Profile whatever runs within (if asked to) and then write out any timed sections'''
+    profiler = None
+    if profile_path is not None:
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            if profile_path == PROFILE_TO_STDERR:
+                stats = pstats.Stats(profiler, stream=sys.stderr)
+                stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_LINES)
+            else:
+                # view with: python -m pstats <file>
+                profiler.dump_stats(profile_path)
+        if timings_path is not None:
+            with open(timings_path, 'w') as f:
+                json.dump(_timings, f, indent=4)
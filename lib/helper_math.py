@@ -0,0 +1,20 @@
+import math
+from typing import Optional
+
+
+def combine_congruences(first: tuple[int, int], second: tuple[int, int]) -> Optional[tuple[int, int]]:
+    '''
+    (residue, modulus) of the values congruent to both (residue, modulus) pairs, if any,
+    by the Chinese remainder theorem generalised to moduli that share factors.
+    '''
+    residue, modulus = first
+    other_residue, other_modulus = second
+    divisor = math.gcd(modulus, other_modulus)
+    difference = other_residue - residue
+    if difference % divisor != 0:
+        return None
+    reduced = other_modulus // divisor
+    combined_modulus = modulus * reduced
+    # how many steps of modulus from residue reach a value congruent to the second
+    multiple = difference // divisor * pow(modulus // divisor, -1, reduced) % reduced
+    return (residue + modulus * multiple) % combined_modulus, combined_modulus
@@ -0,0 +1,27 @@
+import lib.helper_import as hi
+
+np = hi.lazy_import('numpy')
+
+
+def find_numbers(data: 'np.ndarray') -> tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+    '''
+    Start, end (exclusive) and value of every run of digits in a 1D uint8 array, in order.
+    Rows of a grid can be searched together, so long as each ends with a non-digit (e.g. a newline).
+    '''
+    digits = (data >= ord('0')) & (data <= ord('9'))
+    starts = np.flatnonzero(digits[1:] & ~digits[:-1]) + 1
+    if len(digits) > 0 and digits[0]:
+        starts = np.concatenate(([0], starts))
+    ends = np.flatnonzero(digits[:-1] & ~digits[1:]) + 1
+    if len(ends) < len(starts):
+        ends = np.append(ends, len(data))
+    lengths = ends - starts
+    values = (data[starts] - np.uint8(ord('0'))).astype(np.int64)
+    # one more digit at a time of just the numbers with digits left, so long numbers don't slow down short ones
+    longer = np.flatnonzero(lengths > 1)
+    offset = 1
+    while len(longer) > 0:
+        values[longer] = values[longer] * 10 + (data[starts[longer] + offset] - np.uint8(ord('0')))
+        offset += 1
+        longer = longer[lengths[longer] > offset]
+    return starts, ends, values
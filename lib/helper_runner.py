@@ -0,0 +1,229 @@
+import argparse
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+import contextlib
+import dataclasses
+import importlib.util
+import io
+import json
+import logging
+import pathlib
+import resource
+import signal
+import time
+from types import ModuleType
+from typing import Optional
+
+from lib.class_exercise_properties import ExerciseProperties as cep
+from lib.class_solution_result import SolutionResult
+from lib.class_text_coordinate import clear_interned
+import lib.helper_cache as hk
+import lib.helper_coord as hc
+import lib.helper_file as hf
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIRECTORY = pathlib.Path(__file__).absolute().parent.parent
+TIMINGS_FILE = ROOT_DIRECTORY / '.timings.json'
+DAYS = range(1, 26)
+PARTS = 'ab'
+
+
+def solution_path(day: int, part: str, root: pathlib.Path = ROOT_DIRECTORY) -> pathlib.Path:
+    return root / str(day) / f'{day}{part}.py'
+
+
+def find_solutions(selections: list[str], root: pathlib.Path = ROOT_DIRECTORY) -> list[tuple[int, str]]:
+    '''Selections are either a day ("5") or a day and part ("5b"); no selections means every day'''
+    if not selections:
+        selections = [str(day) for day in DAYS]
+    solutions = []
+    for selection in selections:
+        if selection[-1] in PARTS:
+            day, parts = int(selection[:-1]), selection[-1]
+        else:
+            day, parts = int(selection), PARTS
+        for part in parts:
+            if solution_path(day, part, root).is_file():
+                solutions.append((day, part))
+            elif len(parts) == 1:
+                raise Exception(f'No solution found for {day}{part}')
+    return solutions
+
+
+def load_solution(day: int, part: str, root: pathlib.Path = ROOT_DIRECTORY) -> ModuleType:
+    path = solution_path(day, part, root)
+    # unique module names avoid sharing module-level caches between solutions
+    spec = importlib.util.spec_from_file_location(f'solution_{day}{part}', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_expected(path: Optional[pathlib.Path]) -> dict[str, str]:
+    if path is None or not path.is_file():
+        return {}
+    with open(path) as f:
+        expected = json.load(f)
+    return {label: str(answer) for label, answer in expected.items() if answer is not None}
+
+
+def _raise_timeout(signum, frame):
+    raise TimeoutError('Solution exceeded its time limit')
+
+
+def solution_properties(day: int, part: str, args: argparse.Namespace,
+                        input_file: Optional[pathlib.Path] = None) -> cep:
+    props = hf.parse_name(str(solution_path(day, part)), args)
+    if input_file is not None:
+        props = dataclasses.replace(props, input_file=input_file)
+    return props
+
+
+def cached_result(day: int, part: str, args: argparse.Namespace, expected: Optional[str] = None,
+                  input_file: Optional[pathlib.Path] = None) -> tuple[Optional[str], Optional[SolutionResult]]:
+    '''The key to cache the answer under, and the result from an earlier run if it has not been invalidated'''
+    try:
+        props = solution_properties(day, part, args, input_file)
+        if props.use_stdin:
+            return None, None
+        key = hk.answer_key(solution_path(day, part), props)
+    except Exception:
+        # e.g. no input file: let the solution itself report the problem
+        logger.debug('No answer key for %d%s', day, part, exc_info=True)
+        return None, None
+    answer = hk.load_answer(key)
+    if answer is None:
+        return key, None
+    return key, SolutionResult(day, part, answer, expected, cached=True, input_file=input_file)
+
+
+def run_solution(day: int, part: str, args: argparse.Namespace, expected: Optional[str] = None,
+                 timeout: Optional[float] = None, use_cache: bool = False,
+                 input_file: Optional[pathlib.Path] = None) -> SolutionResult:
+    key = None
+    if use_cache:
+        key, result = cached_result(day, part, args, expected, input_file)
+        if result is not None:
+            return result
+    answer = None
+    error = None
+    output = io.StringIO()
+    if timeout:
+        # only available from the main thread of a process, which includes pool workers
+        previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    start = time.perf_counter()
+    try:
+        module = load_solution(day, part)
+        props = solution_properties(day, part, args, input_file)
+        with contextlib.redirect_stdout(output):
+            solution = module.main(props)
+        answer = str(solution) if solution is not None else None
+    except Exception as e:
+        logger.debug('Solution %d%s failed', day, part, exc_info=True)
+        error = f'{type(e).__name__}: {e}'
+    finally:
+        wall_time = time.perf_counter() - start
+        # tracing allocations would slow the solution down several times over, so the
+        # process's peak resident memory stands in, which also covers memory numpy allocates
+        peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 # KiB on Linux
+        # grid-sized tables outlive the solution that built them, so would otherwise stay resident
+        # (and in use) for every solution run after it in this process
+        clear_interned()
+        hc.neighbour_table.cache_clear()
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+    if key is not None and answer is not None:
+        hk.save_answer(key, answer, f'{day}{part}')
+    return SolutionResult(day, part, answer, expected, wall_time, peak_memory, error, output.getvalue(),
+                          input_file=input_file)
+
+
+def timing_key(day: int, part: str, args: argparse.Namespace) -> str:
+    # mirror the input file naming, as timings vary wildly between examples and inputs
+    mode = '-examples' if args.examples else '-input'
+    return f'{day}{part}{mode}{args.file_suffix or ""}'
+
+
+def load_timings(path: pathlib.Path = TIMINGS_FILE) -> dict[str, float]:
+    if not path.is_file():
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_timings(results: Iterable[SolutionResult], args: argparse.Namespace,
+                 path: pathlib.Path = TIMINGS_FILE) -> None:
+    timings = load_timings(path)
+    for result in results:
+        # timings for other input files would mislead the scheduling of the usual inputs
+        if result.error is None and not result.cached and result.input_file is None:
+            timings[timing_key(result.day, result.part, args)] = result.wall_time
+    with open(path, 'w') as f:
+        json.dump(timings, f, indent=4, sort_keys=True)
+
+
+def schedule(solutions: list[tuple], args: argparse.Namespace, timings: dict[str, float]) -> list[tuple]:
+    '''
+    Longest job first: solutions without a previous timing are assumed to be slow.
+    Each job starts with the day and part of its solution.
+    '''
+    def expected_time(solution: tuple) -> float:
+        return timings.get(timing_key(solution[0], solution[1], args), float('inf'))
+    return sorted(solutions, key=expected_time, reverse=True)
+
+
+def expected_answer(expected: dict[str, str], day: int, part: str,
+                    input_file: Optional[pathlib.Path] = None) -> Optional[str]:
+    '''Answers for given input files are labelled with the file name too, e.g. "5b:5-examples2.txt"'''
+    if input_file is None:
+        return expected.get(f'{day}{part}')
+    return expected.get(f'{day}{part}:{input_file.name}')
+
+
+def run_solutions(solutions: list[tuple[int, str]], args: argparse.Namespace,
+                  expected: dict[str, str], jobs: int = 1,
+                  timeout: Optional[float] = None, use_cache: bool = False,
+                  inputs: Optional[list[pathlib.Path]] = None) -> Iterable[SolutionResult]:
+    '''With inputs, every solution is run against each of the input files instead of the day's usual input'''
+    work = [(day, part, input_file) for day, part in solutions for input_file in (inputs or [None])]
+    if jobs <= 1:
+        for day, part, input_file in work:
+            yield run_solution(day, part, args, expected_answer(expected, day, part, input_file),
+                               timeout, use_cache, input_file)
+        return
+
+    ordered_work = schedule(work, args, load_timings())
+    logger.debug('Scheduled solutions: %r', ordered_work)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        # the executor hands out work in submission order
+        futures = {
+            executor.submit(run_solution, day, part, args, expected_answer(expected, day, part, input_file),
+                            timeout, use_cache, input_file):
+            (day, part, input_file)
+            for day, part, input_file in ordered_work
+        }
+        for future in as_completed(futures):
+            day, part, input_file = futures[future]
+            try:
+                yield future.result()
+            except BrokenProcessPool as e:
+                # a worker died outright (e.g. killed for memory): report rather than abandon the run
+                yield SolutionResult(day, part, expected=expected_answer(expected, day, part, input_file),
+                                     error=f'{type(e).__name__}: {e}', input_file=input_file)
+
+
+def format_result(result: SolutionResult) -> str:
+    answer = result.error if result.error is not None else result.answer
+    if result.checked and not result.passed and result.error is None:
+        answer = f'{answer} (expected {result.expected})'
+    if result.cached:
+        answer = f'{answer} (cached)'
+    label = f'{result.label:>4}'
+    if result.input_file is not None:
+        label = f'{label} {result.input_file.name:<24}'
+    return (f'{label} {result.status:<9} {result.wall_time:9.3f}s '
+            f'{result.peak_memory / 2**20:9.1f}MiB  {answer}')
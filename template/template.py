@@ -17,9 +17,6 @@ from typing import Optional
 __file = pathlib.Path(__file__).absolute()
 sys.path.append(str(__file.parent.parent.resolve()))
 
-from bidict import bidict
-import numpy as np
-
 from lib.class_edge import Edge
 from lib.class_text_coordinate_limits import TextCoordinateLimits as Limits
 from lib.class_text_coordinate import TextCoordinate as Coordinate
@@ -27,20 +24,27 @@ import lib.helper_args as ha
 import lib.helper_coord as hc
 import lib.helper_direction as hd
 import lib.helper_file as hf
+import lib.helper_import as hi
 import lib.helper_log as hl
 
-logger = logging.getLogger(__file.stem)
+bidict = hi.lazy_import('bidict')
+np = hi.lazy_import('numpy')
 
+logger = logging.getLogger(__file.stem)
 
-def main(props):
-    lines = hf.load_lines(hf.find_input_file(props))
 
+def solve(lines: list[str], props) -> int:
     subtotal = 0
-    print(subtotal)
+    return subtotal
+
+
+def main(props):
+    return solve(hf.load_lines(hf.find_input_file(props)), props)
 
 
 if __name__ == '__main__':
     args = ha.parse_args()
     hl.setup_logging(args.verbose)
     props = hf.parse_name(__file__, args)
-    main(props)
+    with hl.reporting(args.profile, args.timings):
+        print(main(props))
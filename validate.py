@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+import logging
+import pathlib
+import sys
+import time
+__file = pathlib.Path(__file__).absolute()
+sys.path.append(str(__file.parent.resolve()))
+
+import lib.helper_args as ha
+import lib.helper_file as hf
+import lib.helper_log as hl
+import lib.helper_runner as hr
+
+logger = logging.getLogger(__file.stem)
+
+
+def main(args):
+    answers_path = args.answers if args.answers is not None else __file.parent / 'validate.json'
+    expected = hr.load_expected(answers_path)
+    logger.debug('Loaded %d expected answers from %s', len(expected), answers_path)
+    solutions = hr.find_solutions(args.solutions)
+    inputs = hf.find_input_files(args.inputs) if args.inputs is not None else None
+
+    start = time.perf_counter()
+    results = []
+    for result in hr.run_solutions(solutions, args, expected, args.jobs, args.timeout,
+                                   not args.no_cache, inputs):
+        print(hr.format_result(result), flush=True)
+        logger.debug('Captured output from %s:\n%s', result.label, result.output)
+        results.append(result)
+    elapsed = time.perf_counter() - start
+    hr.save_timings(results, args)
+
+    failures = sum(1 for result in results if not result.passed)
+    cached = sum(1 for result in results if result.cached)
+    total_time = sum(result.wall_time for result in results)
+    print(f'Ran {len(results)} solutions ({cached} cached) in {elapsed:.3f}s '
+          f'({total_time:.3f}s of solving): {failures} failed')
+    return 1 if failures > 0 else 0
+
+
+if __name__ == '__main__':
+    args = ha.parse_runner_args()
+    hl.setup_logging(args.verbose)
+    sys.exit(main(args))